@@ -1,208 +1,20 @@
 import logging
 import os
+from importlib import import_module
+from typing import Any, Dict, List, Tuple
 
-import jaxtyping
+from .typecheck import (
+    TYPECHECK_ENV,
+    TYPECHECK_LEVELS,
+    get_typecheck_level,
+    set_typecheck_level,
+)
 
 _package_name = os.path.basename(os.path.dirname(__file__))
 
-jaxtyping.install_import_hook([_package_name], "typeguard.typechecked")
-
-
-logging.getLogger(_package_name).debug(f"Jaxtyping hook installed for: {_package_name}")
+set_typecheck_level(os.environ.get(TYPECHECK_ENV, "full"))
 
 
-from .common_utils import (
-    class_autologger,
-    get_v,
-    log_system_info,
-    setup_logging,
-    silent,
-)
-from .core import BrainEngine
-from .data import (
-    BatchProcessing,
-    BatchProcessingProtocol,
-    CacheManager,
-    CacheManagerABC,
-    CacheManagerProtocol,
-    DataDownloader,
-    DataDownloaderABC,
-    DataDownloaderProtocol,
-    DataProcessor,
-    DataProcessorABC,
-    DataProcessorProtocol,
-    Dataset,
-    DatasetABC,
-    DatasetProtocol,
-    ProjectManager,
-    ProjectManagerABC,
-    ProjectManagerProtocol,
-    _prepare_items_for_processing,
-    batch_transform_engine,
-    create_batches_logic,
-    determine_pipeline_result_logic,
-    fetch_remote_data_logic,
-    get_dataset_item_logic,
-    load_cache_logic,
-    load_local_json_logic,
-    process_single_path_logic,
-    save_cache_logic,
-    save_json_to_disk_logic,
-    transform_image_to_normalized_logic,
-    validate_dataset_integrity_logic,
-)
-from .features import (
-    HOG,
-    HOGABC,
-    EdgeDetectorProtocol,
-    FeatureExtraction,
-    FeatureExtractionABC,
-    FeatureExtractorProtocol,
-    HOGProtocol,
-    Prewitt,
-    Sobel,
-    apply_prewitt_filter_logic,
-    apply_sobel_filter_logic,
-    compute_hog_descriptor_logic,
-    extract_edges_logic,
-    extract_features_vector_logic,
-)
-from .main import main_logic
-from .nn import (
-    ActivationABC,
-    Conv2D,
-    Dropout,
-    Flatten,
-    LayerABC,
-    LayerProtocol,
-    Linear,
-    ModelABC,
-    ModelProtocol,
-    NeuralNetwork,
-    OrchestratorABC,
-    ReLU,
-    Sequential,
-    Sigmoid,
-    Softmax,
-    add_layer,
-    chain_bwd,
-    chain_fwd,
-    conv2d_bwd,
-    conv2d_fwd,
-    dropout_bwd,
-    dropout_fwd,
-    flatten_bwd,
-    flatten_fwd,
-    linear_bwd,
-    linear_fwd,
-    load,
-    predict,
-    relu_bwd,
-    relu_fwd,
-    save,
-    sigmoid_bwd,
-    sigmoid_fwd,
-    softmax_bwd,
-    softmax_fwd,
-)
-from .preprocessing import (
-    ConvolutionActions,
-    ConvolutionProtocol,
-    DataAugmentation,
-    DataAugmentationProtocol,
-    GeometryAugmentation,
-    GeometryAugmentationProtocol,
-    GrayScaleProcessing,
-    GrayScaleProtocol,
-    ImageConverterProtocol,
-    ImageDataPreprocessing,
-    ImageDataPreprocessingProtocol,
-    ImageGeometry,
-    ImageGeometryProtocol,
-    ImageHandler,
-    ImageHandlerProtocol,
-    ImageToMatrixConverter,
-    MorphologyAugmentation,
-    MorphologyAugmentationProtocol,
-    NoiseAugmentation,
-    NoiseAugmentationProtocol,
-    Normalization,
-    NormalizationProtocol,
-    ParameterProviderProtocol,
-    Pooling,
-    PoolingProtocol,
-    RandomUniformProvider,
-    Thresholding,
-    ThresholdingProtocol,
-    TransformPipeline,
-    TransformPipelineProtocol,
-    _create_supplement_all_sides,
-    _downscale_vectorized,
-    _get_augmentation_groups,
-    _get_trace_report,
-    _pick_random_pipeline,
-    _upscale_bilinear,
-    adaptive_threshold_logic,
-    apply_filters,
-    apply_pipeline_logic,
-    apply_to_methods,
-    augment_engine,
-    auto_fill_color,
-    calculate_block_size,
-    calculate_fill_color,
-    calculate_rotation_params,
-    convert_color_space,
-    convert_image_to_matrix,
-    convolution_2d,
-    dilate,
-    erode,
-    gaussian_noise,
-    generate_gaussian_kernel,
-    get_angle_range,
-    get_boundaries,
-    get_number_repeats,
-    get_uniform_value,
-    horizontal_flip,
-    kernel_data_processing,
-    max_pool_logic,
-    morphology_filter,
-    normalize,
-    open_image,
-    pad,
-    parameter_complement,
-    prepare_angle,
-    prepare_standard_geometry_logic,
-    prepare_values,
-    preprocess_logic,
-    random_shift_engine,
-    resize,
-    rotate_90,
-    rotate_small_angle,
-    salt_and_pepper,
-    save_image,
-    separate_channels,
-    sliding_window_engine,
-    vertical_flip,
-    with_dimensions,
-    z_score_normalization,
-)
-from .training import (
-    MSE,
-    SGD,
-    Adam,
-    CrossEntropy,
-    LossABC,
-    LossProtocol,
-    OptimizerABC,
-    OptimizerProtocol,
-    Trainer,
-    TrainerABC,
-    TrainerProtocol,
-    compute_cross_entropy_derivative_logic,
-    compute_cross_entropy_logic,
-    compute_mse_derivative_logic,
-    compute_mse_loss_logic,
-)
 from .types import (
     M4D,
     T1D,
@@ -215,10 +27,13 @@ from .types import (
     DataResult,
     DatasetBatch,
     FilePath,
+    FillValue,
     FuncDec,
+    ImageBatch,
     ImageBytes,
     ImageGray,
     ImageRGB,
+    ImageRGBBatch,
     JsonData,
     JsonDict,
     JsonList,
@@ -238,6 +53,346 @@ from .types import (
     T_Val,
 )
 
+_LAZY_SUBMODULES: Dict[str, Tuple[str, ...]] = {
+    ".common_utils": (
+        "RngContext",
+        "class_autologger",
+        "collect_rng_contexts",
+        "get_v",
+        "log_system_info",
+        "reseed_components",
+        "resolve_rng",
+        "setup_logging",
+        "silent",
+    ),
+    ".core": ("BrainEngine",),
+    ".data": (
+        "ArrayDataset",
+        "ArrayDatasetProtocol",
+        "BatchProcessing",
+        "BatchProcessingProtocol",
+        "CacheManager",
+        "CacheManagerABC",
+        "CacheManagerProtocol",
+        "DataDownloader",
+        "DataDownloaderABC",
+        "DataDownloaderProtocol",
+        "DataLoader",
+        "DataLoaderABC",
+        "DataLoaderProtocol",
+        "DataProcessor",
+        "DataProcessorABC",
+        "DataProcessorProtocol",
+        "Dataset",
+        "DatasetABC",
+        "DatasetProtocol",
+        "ProjectManager",
+        "ProjectManagerABC",
+        "ProjectManagerProtocol",
+        "ShardBuilder",
+        "ShardBuilderABC",
+        "ShardBuilderProtocol",
+        "_prepare_items_for_processing",
+        "allocate_batch_slots_logic",
+        "batch_indices_logic",
+        "batch_transform_engine",
+        "bucket_by_shape_logic",
+        "coerce_raw_image_logic",
+        "commit_shard_logic",
+        "conditional_headers_logic",
+        "container_checksum_logic",
+        "convert_json_to_container_logic",
+        "create_batches_logic",
+        "create_session_logic",
+        "create_storage_logic",
+        "decode_array_items_logic",
+        "determine_pipeline_result_logic",
+        "entry_size_logic",
+        "epoch_rng_logic",
+        "evict_lru_logic",
+        "fetch_remote_data_logic",
+        "file_seed_logic",
+        "fill_batch_slot_logic",
+        "flush_shard_logic",
+        "flush_stream_batch_logic",
+        "gather_batch_logic",
+        "get_array_item_logic",
+        "get_dataset_item_logic",
+        "group_same_shape_logic",
+        "hash_images_logic",
+        "hash_source_logic",
+        "http_cache_path_logic",
+        "index_entries_logic",
+        "ingest_chunk_logic",
+        "iter_batches_logic",
+        "iter_json_items_logic",
+        "json_items_to_arrays_logic",
+        "load_cache_logic",
+        "load_container_logic",
+        "load_http_cache_logic",
+        "load_local_json_logic",
+        "load_manifest_logic",
+        "normalize_stack_logic",
+        "open_storage_logic",
+        "parallel_ingest_logic",
+        "parse_response_body_logic",
+        "plan_rebuild_logic",
+        "prefetch_batches_engine",
+        "probe_sample_logic",
+        "process_paths_logic",
+        "process_stack_logic",
+        "prune_shards_logic",
+        "read_container_header_logic",
+        "save_cache_logic",
+        "save_container_logic",
+        "save_http_cache_logic",
+        "save_json_to_disk_logic",
+        "save_manifest_logic",
+        "scan_entries_logic",
+        "scan_image_dir_logic",
+        "shard_file_logic",
+        "shard_samples_engine",
+        "split_paths_logic",
+        "stack_samples_logic",
+        "storage_array_logic",
+        "stream_local_items_logic",
+        "stream_pipeline_engine",
+        "stream_remote_items_logic",
+        "touch_entry_logic",
+        "transform_image_to_normalized_logic",
+        "validate_dataset_integrity_logic",
+        "write_results_logic",
+    ),
+    ".features": (
+        "HOG",
+        "HOGABC",
+        "EdgeDetectorProtocol",
+        "FeatureExtraction",
+        "FeatureExtractionABC",
+        "FeatureExtractorProtocol",
+        "HOGProtocol",
+        "Prewitt",
+        "Sobel",
+        "apply_prewitt_filter_logic",
+        "apply_sobel_filter_logic",
+        "compute_hog_descriptor_logic",
+        "extract_edges_logic",
+        "extract_features_vector_logic",
+    ),
+    ".main": ("main_logic",),
+    ".nn": (
+        "ActivationABC",
+        "Conv2D",
+        "Dropout",
+        "Flatten",
+        "LayerABC",
+        "LayerProtocol",
+        "Linear",
+        "ModelABC",
+        "ModelProtocol",
+        "NeuralNetwork",
+        "OrchestratorABC",
+        "ReLU",
+        "Sequential",
+        "Sigmoid",
+        "Softmax",
+        "activation_lifetimes_logic",
+        "add_layer",
+        "allocate_activation_buffers_logic",
+        "build_layer_logic",
+        "chain_bwd",
+        "chain_fwd",
+        "col2im_logic",
+        "conv2d_bwd",
+        "conv2d_fwd",
+        "conv_output_size",
+        "dropout_bwd",
+        "dropout_fwd",
+        "flatten_bwd",
+        "flatten_fwd",
+        "im2col_logic",
+        "kernel_checksum_logic",
+        "layer_manifest_logic",
+        "layer_traits_logic",
+        "linear_bwd",
+        "linear_fwd",
+        "load",
+        "map_npz_members_logic",
+        "param_fields_logic",
+        "plan_memory_logic",
+        "predict",
+        "release_caches_logic",
+        "relu_bwd",
+        "relu_fwd",
+        "save",
+        "select_conv_engine_logic",
+        "set_training_logic",
+        "sigmoid_bwd",
+        "sigmoid_fwd",
+        "softmax_bwd",
+        "softmax_fwd",
+        "trace_activations_logic",
+        "winograd_conv2d_fwd",
+        "winograd_kernels_logic",
+        "winograd_tiles_logic",
+        "write_npz_member_logic",
+    ),
+    ".preprocessing": (
+        "ConvolutionActions",
+        "ConvolutionProtocol",
+        "DataAugmentation",
+        "DataAugmentationProtocol",
+        "ExecutionPlan",
+        "ExecutionPlanProtocol",
+        "GeometryAugmentation",
+        "GeometryAugmentationProtocol",
+        "GrayScaleProcessing",
+        "GrayScaleProtocol",
+        "ImageConverterProtocol",
+        "ImageDataPreprocessing",
+        "ImageDataPreprocessingProtocol",
+        "ImageGeometry",
+        "ImageGeometryProtocol",
+        "ImageHandler",
+        "ImageHandlerProtocol",
+        "ImageToMatrixConverter",
+        "MorphologyAugmentation",
+        "MorphologyAugmentationProtocol",
+        "NoiseAugmentation",
+        "NoiseAugmentationProtocol",
+        "Normalization",
+        "NormalizationProtocol",
+        "ParameterProviderProtocol",
+        "Pooling",
+        "PoolingProtocol",
+        "RandomUniformProvider",
+        "Thresholding",
+        "ThresholdingProtocol",
+        "TransformPipeline",
+        "TransformPipelineProtocol",
+        "WarpEngine",
+        "WarpEngineProtocol",
+        "_create_supplement_all_sides",
+        "_downscale_vectorized",
+        "_get_trace_report",
+        "_upscale_bilinear",
+        "adaptive_threshold_integral_logic",
+        "adaptive_threshold_logic",
+        "apply_filters",
+        "apply_pipeline_logic",
+        "apply_to_methods",
+        "auto_fill_color",
+        "batch_augment_engine",
+        "box_sum",
+        "calculate_block_size",
+        "calculate_fill_color",
+        "calculate_fill_colors",
+        "calculate_rotation_params",
+        "convert_color_space",
+        "convert_image_to_matrix",
+        "convolution_2d",
+        "convolve_stack",
+        "dilate",
+        "erode",
+        "gaussian_noise",
+        "gaussian_noise_batch",
+        "generate_gaussian_kernel",
+        "geometry_batch_operations",
+        "get_angle_range",
+        "get_base_grid",
+        "get_boundaries",
+        "get_number_repeats",
+        "get_uniform_value",
+        "get_uniform_values",
+        "grayscale_into",
+        "horizontal_flip",
+        "integral_image",
+        "kernel_data_processing",
+        "max_pool_logic",
+        "morphology_batch",
+        "morphology_batch_operations",
+        "morphology_filter",
+        "next_fast_len",
+        "noise_batch_operations",
+        "normalize",
+        "open_image",
+        "pad",
+        "pad_spatial",
+        "parameter_complement",
+        "prepare_angle",
+        "prepare_standard_geometry_logic",
+        "prepare_values",
+        "preprocess_logic",
+        "preprocess_stack_logic",
+        "random_shift_batch",
+        "random_shift_engine",
+        "resize",
+        "resize_into",
+        "resize_operators",
+        "resolve_arg_layout",
+        "rotate_90",
+        "rotate_90_batch",
+        "rotate_small_angle",
+        "rotate_small_angle_batch",
+        "rotation_source_coords",
+        "run_plan_logic",
+        "running_extremum",
+        "running_sum",
+        "salt_and_pepper",
+        "salt_and_pepper_batch",
+        "save_image",
+        "select_conv_backend",
+        "separable_factors",
+        "separable_morphology",
+        "separate_channels",
+        "sliding_window_engine",
+        "vertical_flip",
+        "warp_rotate",
+        "with_dimensions",
+        "z_score_inplace",
+        "z_score_normalization",
+    ),
+    ".training": (
+        "MSE",
+        "SGD",
+        "Adam",
+        "CrossEntropy",
+        "LossABC",
+        "LossProtocol",
+        "OptimizerABC",
+        "OptimizerProtocol",
+        "Trainer",
+        "TrainerABC",
+        "TrainerProtocol",
+        "compute_cross_entropy_derivative_logic",
+        "compute_cross_entropy_logic",
+        "compute_mse_derivative_logic",
+        "compute_mse_loss_logic",
+    ),
+}
+_LAZY_EXPORTS: Dict[str, str] = {
+    name: module for module, names in _LAZY_SUBMODULES.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+logging.getLogger(_package_name).debug(
+    f"Lazy exports registered for: {list(_LAZY_SUBMODULES)}"
+)
+
 __all__ = [
     "HOG",
     "HOGABC",
@@ -248,8 +403,12 @@ __all__ = [
     "T2D",
     "T3D",
     "T4D",
+    "TYPECHECK_ENV",
+    "TYPECHECK_LEVELS",
     "ActivationABC",
     "Adam",
+    "ArrayDataset",
+    "ArrayDatasetProtocol",
     "BatchData",
     "BatchProcessing",
     "BatchProcessingProtocol",
@@ -269,6 +428,9 @@ __all__ = [
     "DataDownloader",
     "DataDownloaderABC",
     "DataDownloaderProtocol",
+    "DataLoader",
+    "DataLoaderABC",
+    "DataLoaderProtocol",
     "DataProcessor",
     "DataProcessorABC",
     "DataProcessorProtocol",
@@ -279,10 +441,13 @@ __all__ = [
     "DatasetProtocol",
     "Dropout",
     "EdgeDetectorProtocol",
+    "ExecutionPlan",
+    "ExecutionPlanProtocol",
     "FeatureExtraction",
     "FeatureExtractionABC",
     "FeatureExtractorProtocol",
     "FilePath",
+    "FillValue",
     "Flatten",
     "FuncDec",
     "FuncDec",
@@ -291,6 +456,7 @@ __all__ = [
     "GrayScaleProcessing",
     "GrayScaleProtocol",
     "HOGProtocol",
+    "ImageBatch",
     "ImageBytes",
     "ImageConverterProtocol",
     "ImageDataPreprocessing",
@@ -301,6 +467,7 @@ __all__ = [
     "ImageHandler",
     "ImageHandlerProtocol",
     "ImageRGB",
+    "ImageRGBBatch",
     "ImageToMatrixConverter",
     "JsonData",
     "JsonDict",
@@ -341,9 +508,13 @@ __all__ = [
     "RawImage",
     "ReLU",
     "ResultWithMetrics",
+    "RngContext",
     "Sample",
     "Sequential",
     "Shape",
+    "ShardBuilder",
+    "ShardBuilderABC",
+    "ShardBuilderProtocol",
     "Sigmoid",
     "Sobel",
     "Softmax",
@@ -362,22 +533,24 @@ __all__ = [
     "TrainerProtocol",
     "TransformPipeline",
     "TransformPipelineProtocol",
+    "WarpEngine",
+    "WarpEngineProtocol",
     "_create_supplement_all_sides",
     "_create_supplement_all_sides",
     "_downscale_vectorized",
     "_downscale_vectorized",
-    "_get_augmentation_groups",
-    "_get_augmentation_groups",
     "_get_trace_report",
     "_get_trace_report",
-    "_pick_random_pipeline",
-    "_pick_random_pipeline",
     "_prepare_items_for_processing",
     "_upscale_bilinear",
     "_upscale_bilinear",
+    "activation_lifetimes_logic",
+    "adaptive_threshold_integral_logic",
     "adaptive_threshold_logic",
     "adaptive_threshold_logic",
     "add_layer",
+    "allocate_activation_buffers_logic",
+    "allocate_batch_slots_logic",
     "apply_filters",
     "apply_filters",
     "apply_pipeline_logic",
@@ -385,19 +558,27 @@ __all__ = [
     "apply_prewitt_filter_logic",
     "apply_sobel_filter_logic",
     "apply_to_methods",
-    "augment_engine",
-    "augment_engine",
     "auto_fill_color",
+    "batch_augment_engine",
+    "batch_indices_logic",
     "batch_transform_engine",
+    "box_sum",
+    "bucket_by_shape_logic",
+    "build_layer_logic",
     "calculate_block_size",
     "calculate_block_size",
     "calculate_fill_color",
     "calculate_fill_color",
+    "calculate_fill_colors",
     "calculate_rotation_params",
     "calculate_rotation_params",
     "chain_bwd",
     "chain_fwd",
     "class_autologger",
+    "coerce_raw_image_logic",
+    "col2im_logic",
+    "collect_rng_contexts",
+    "commit_shard_logic",
     "compute_cross_entropy_derivative_logic",
     "compute_cross_entropy_derivative_logic",
     "compute_cross_entropy_logic",
@@ -407,90 +588,175 @@ __all__ = [
     "compute_mse_derivative_logic",
     "compute_mse_loss_logic",
     "compute_mse_loss_logic",
+    "conditional_headers_logic",
+    "container_checksum_logic",
     "conv2d_bwd",
     "conv2d_fwd",
+    "conv_output_size",
     "convert_color_space",
     "convert_color_space",
     "convert_image_to_matrix",
     "convert_image_to_matrix",
+    "convert_json_to_container_logic",
     "convolution_2d",
     "convolution_2d",
+    "convolve_stack",
     "create_batches_logic",
+    "create_session_logic",
+    "create_storage_logic",
+    "decode_array_items_logic",
     "determine_pipeline_result_logic",
     "dilate",
     "dilate",
     "dropout_bwd",
     "dropout_fwd",
+    "entry_size_logic",
+    "epoch_rng_logic",
     "erode",
     "erode",
+    "evict_lru_logic",
     "extract_edges_logic",
     "extract_features_vector_logic",
     "fetch_remote_data_logic",
+    "file_seed_logic",
+    "fill_batch_slot_logic",
     "flatten_bwd",
     "flatten_fwd",
+    "flush_shard_logic",
+    "flush_stream_batch_logic",
+    "gather_batch_logic",
     "gaussian_noise",
     "gaussian_noise",
+    "gaussian_noise_batch",
     "generate_gaussian_kernel",
     "generate_gaussian_kernel",
+    "geometry_batch_operations",
     "get_angle_range",
     "get_angle_range",
+    "get_array_item_logic",
+    "get_base_grid",
     "get_boundaries",
     "get_boundaries",
     "get_dataset_item_logic",
     "get_number_repeats",
+    "get_typecheck_level",
     "get_uniform_value",
     "get_uniform_value",
+    "get_uniform_values",
     "get_v",
+    "grayscale_into",
+    "group_same_shape_logic",
+    "hash_images_logic",
+    "hash_source_logic",
     "horizontal_flip",
     "horizontal_flip",
+    "http_cache_path_logic",
+    "im2col_logic",
+    "index_entries_logic",
+    "ingest_chunk_logic",
+    "integral_image",
+    "iter_batches_logic",
+    "iter_json_items_logic",
+    "json_items_to_arrays_logic",
+    "kernel_checksum_logic",
     "kernel_data_processing",
+    "layer_manifest_logic",
+    "layer_traits_logic",
     "linear_bwd",
     "linear_fwd",
     "load",
     "load_cache_logic",
+    "load_container_logic",
+    "load_http_cache_logic",
     "load_local_json_logic",
+    "load_manifest_logic",
     "log_system_info",
-    "main",
     "main_logic",
+    "map_npz_members_logic",
     "max_pool_logic",
     "max_pool_logic",
+    "morphology_batch",
+    "morphology_batch_operations",
     "morphology_filter",
     "morphology_filter",
+    "next_fast_len",
+    "noise_batch_operations",
     "normalize",
     "normalize",
+    "normalize_stack_logic",
     "open_image",
     "open_image",
+    "open_storage_logic",
     "pad",
     "pad",
+    "pad_spatial",
+    "parallel_ingest_logic",
+    "param_fields_logic",
     "parameter_complement",
+    "parse_response_body_logic",
+    "plan_memory_logic",
+    "plan_rebuild_logic",
     "predict",
+    "prefetch_batches_engine",
     "prepare_angle",
     "prepare_standard_geometry_logic",
     "prepare_standard_geometry_logic",
     "prepare_values",
     "preprocess_logic",
     "preprocess_logic",
-    "process_single_path_logic",
+    "preprocess_stack_logic",
+    "probe_sample_logic",
+    "process_paths_logic",
+    "process_stack_logic",
+    "prune_shards_logic",
+    "random_shift_batch",
     "random_shift_engine",
     "random_shift_engine",
+    "read_container_header_logic",
+    "release_caches_logic",
     "relu_bwd",
     "relu_fwd",
+    "reseed_components",
     "resize",
     "resize",
+    "resize_into",
+    "resize_operators",
+    "resolve_arg_layout",
+    "resolve_rng",
     "rotate_90",
     "rotate_90",
+    "rotate_90_batch",
     "rotate_small_angle",
     "rotate_small_angle",
+    "rotate_small_angle_batch",
+    "rotation_source_coords",
+    "run_plan_logic",
+    "running_extremum",
+    "running_sum",
     "salt_and_pepper",
     "salt_and_pepper",
+    "salt_and_pepper_batch",
     "save",
     "save_cache_logic",
+    "save_container_logic",
+    "save_http_cache_logic",
     "save_image",
     "save_image",
     "save_json_to_disk_logic",
+    "save_manifest_logic",
+    "scan_entries_logic",
+    "scan_image_dir_logic",
+    "select_conv_backend",
+    "select_conv_engine_logic",
+    "separable_factors",
+    "separable_morphology",
     "separate_channels",
     "separate_channels",
+    "set_training_logic",
+    "set_typecheck_level",
     "setup_logging",
+    "shard_file_logic",
+    "shard_samples_engine",
     "sigmoid_bwd",
     "sigmoid_fwd",
     "silent",
@@ -498,11 +764,26 @@ __all__ = [
     "sliding_window_engine",
     "softmax_bwd",
     "softmax_fwd",
+    "split_paths_logic",
+    "stack_samples_logic",
+    "storage_array_logic",
+    "stream_local_items_logic",
+    "stream_pipeline_engine",
+    "stream_remote_items_logic",
+    "touch_entry_logic",
+    "trace_activations_logic",
     "transform_image_to_normalized_logic",
     "validate_dataset_integrity_logic",
     "vertical_flip",
     "vertical_flip",
+    "warp_rotate",
+    "winograd_conv2d_fwd",
+    "winograd_kernels_logic",
+    "winograd_tiles_logic",
     "with_dimensions",
+    "write_npz_member_logic",
+    "write_results_logic",
+    "z_score_inplace",
     "z_score_normalization",
     "z_score_normalization",
 ]
@@ -1,10 +1,12 @@
 import inspect
 import logging
 import platform
+from dataclasses import dataclass, field, fields, is_dataclass
 from functools import wraps
 from time import perf_counter
-from typing import Any, Callable, ParamSpec, cast
+from typing import Any, Callable, Dict, List, Optional, ParamSpec, Union, cast
 
+import numpy as np
 import psutil
 from rich.logging import RichHandler
 
@@ -127,7 +129,8 @@ def silent(func: Callable[P, T]) -> Callable[P, T]:
 
 def class_autologger(cls: ClassType) -> ClassType:
     cls_logger = logging.getLogger(cls.__module__)
-    setattr(cls, "logger", cls_logger)
+    if not inspect.ismemberdescriptor(getattr(cls, "logger", None)):
+        setattr(cls, "logger", cls_logger)
 
     def _wrap(f: Callable[P, T]) -> Callable[P, T]:
         return autologger(f)
@@ -164,10 +167,74 @@ def get_v(kwargs: dict[str, Any], key: str, default: T_Val) -> T_Val:
         return default
 
 
+@dataclass(frozen=True, slots=True)
+class RngContext:
+    seed: Union[None, int, np.random.SeedSequence] = None
+    seed_seq: np.random.SeedSequence = field(init=False, repr=False)
+    generator: np.random.Generator = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        seed_seq = (
+            self.seed
+            if isinstance(self.seed, np.random.SeedSequence)
+            else np.random.SeedSequence(self.seed)
+        )
+        object.__setattr__(self, "seed_seq", seed_seq)
+        object.__setattr__(
+            self, "generator", np.random.Generator(np.random.PCG64(seed_seq))
+        )
+
+    def spawn(self, n: int) -> List["RngContext"]:
+        return [RngContext(child) for child in self.seed_seq.spawn(n)]
+
+    def reseed(self, seed_seq: np.random.SeedSequence) -> None:
+        self.generator.bit_generator.state = np.random.PCG64(seed_seq).state
+        object.__setattr__(self, "seed_seq", seed_seq)
+
+
+def resolve_rng(rng: Optional[RngContext]) -> np.random.Generator:
+    return (rng if rng is not None else RngContext()).generator
+
+
+def collect_rng_contexts(obj: Any) -> List[RngContext]:
+    found: Dict[int, RngContext] = {}
+    visited: set[int] = set()
+    stack: List[Any] = [obj]
+
+    while stack:
+        current = stack.pop()
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+
+        if isinstance(current, RngContext):
+            found[id(current)] = current
+        elif is_dataclass(current) and not isinstance(current, type):
+            values = [getattr(current, f.name, None) for f in fields(current)]
+            stack.extend(reversed(values))
+        elif isinstance(current, (list, tuple)):
+            stack.extend(reversed(current))
+        elif isinstance(current, dict):
+            stack.extend(reversed(list(current.values())))
+
+    return list(found.values())
+
+
+def reseed_components(obj: Any, seed_seq: np.random.SeedSequence) -> int:
+    contexts = collect_rng_contexts(obj)
+    for context, child in zip(contexts, seed_seq.spawn(len(contexts)), strict=True):
+        context.reseed(child)
+    return len(contexts)
+
+
 __all__ = [
+    "RngContext",
     "class_autologger",
+    "collect_rng_contexts",
     "get_v",
     "log_system_info",
+    "reseed_components",
+    "resolve_rng",
     "setup_logging",
     "silent",
 ]
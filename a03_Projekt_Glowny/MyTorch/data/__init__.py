@@ -1,23 +1,45 @@
 from .base import (
     CacheManagerABC,
     DataDownloaderABC,
+    DataLoaderABC,
     DataProcessorABC,
     DatasetABC,
     ProjectManagerABC,
+    ShardBuilderABC,
 )
 from .batch import (
     BatchProcessing,
     create_batches_logic,
-    process_single_path_logic,
+    group_same_shape_logic,
+    ingest_chunk_logic,
+    iter_batches_logic,
+    parallel_ingest_logic,
+    probe_sample_logic,
+    process_paths_logic,
+    process_stack_logic,
+    split_paths_logic,
 )
 from .cache import (
     CacheManager,
+    entry_size_logic,
+    evict_lru_logic,
+    hash_source_logic,
+    index_entries_logic,
     load_cache_logic,
     save_cache_logic,
+    scan_entries_logic,
+    storage_array_logic,
+    touch_entry_logic,
 )
 from .dataset import (
+    ArrayDataset,
     Dataset,
+    create_storage_logic,
+    gather_batch_logic,
+    get_array_item_logic,
     get_dataset_item_logic,
+    open_storage_logic,
+    stack_samples_logic,
     validate_dataset_integrity_logic,
 )
 from .downloader import (
@@ -26,22 +48,71 @@ from .downloader import (
     ProjectManager,
     _prepare_items_for_processing,
     batch_transform_engine,
+    bucket_by_shape_logic,
+    coerce_raw_image_logic,
+    conditional_headers_logic,
+    container_checksum_logic,
+    convert_json_to_container_logic,
+    create_session_logic,
+    decode_array_items_logic,
     determine_pipeline_result_logic,
     fetch_remote_data_logic,
+    flush_stream_batch_logic,
+    http_cache_path_logic,
+    iter_json_items_logic,
+    json_items_to_arrays_logic,
+    load_container_logic,
+    load_http_cache_logic,
     load_local_json_logic,
+    normalize_stack_logic,
+    parse_response_body_logic,
+    read_container_header_logic,
+    save_container_logic,
+    save_http_cache_logic,
     save_json_to_disk_logic,
+    stream_local_items_logic,
+    stream_pipeline_engine,
+    stream_remote_items_logic,
     transform_image_to_normalized_logic,
+    write_results_logic,
+)
+from .loader import (
+    DataLoader,
+    allocate_batch_slots_logic,
+    batch_indices_logic,
+    epoch_rng_logic,
+    fill_batch_slot_logic,
+    prefetch_batches_engine,
 )
 from .protocols import (
+    ArrayDatasetProtocol,
     BatchProcessingProtocol,
     CacheManagerProtocol,
     DataDownloaderProtocol,
+    DataLoaderProtocol,
     DataProcessorProtocol,
     DatasetProtocol,
     ProjectManagerProtocol,
+    ShardBuilderProtocol,
+)
+from .shards import (
+    ShardBuilder,
+    commit_shard_logic,
+    file_seed_logic,
+    flush_shard_logic,
+    hash_images_logic,
+    load_manifest_logic,
+    plan_rebuild_logic,
+    prune_shards_logic,
+    save_manifest_logic,
+    scan_image_dir_logic,
+    shard_file_logic,
+    shard_samples_engine,
 )
 
 __all__ = [
+    "ArrayDataset",
+    "ArrayDatasetProtocol",
     "BatchProcessing",
     "BatchProcessingProtocol",
     "CacheManager",
@@ -50,6 +121,9 @@ __all__ = [
     "DataDownloader",
     "DataDownloaderABC",
     "DataDownloaderProtocol",
+    "DataLoader",
+    "DataLoaderABC",
+    "DataLoaderProtocol",
     "DataProcessor",
     "DataProcessorABC",
     "DataProcessorProtocol",
@@ -59,17 +133,77 @@ __all__ = [
     "ProjectManager",
     "ProjectManagerABC",
     "ProjectManagerProtocol",
+    "ShardBuilder",
+    "ShardBuilderABC",
+    "ShardBuilderProtocol",
     "_prepare_items_for_processing",
+    "allocate_batch_slots_logic",
+    "batch_indices_logic",
     "batch_transform_engine",
+    "bucket_by_shape_logic",
+    "coerce_raw_image_logic",
+    "commit_shard_logic",
+    "conditional_headers_logic",
+    "container_checksum_logic",
+    "convert_json_to_container_logic",
     "create_batches_logic",
+    "create_session_logic",
+    "create_storage_logic",
+    "decode_array_items_logic",
     "determine_pipeline_result_logic",
+    "entry_size_logic",
+    "epoch_rng_logic",
+    "evict_lru_logic",
     "fetch_remote_data_logic",
+    "file_seed_logic",
+    "fill_batch_slot_logic",
+    "flush_shard_logic",
+    "flush_stream_batch_logic",
+    "gather_batch_logic",
+    "get_array_item_logic",
     "get_dataset_item_logic",
+    "group_same_shape_logic",
+    "hash_images_logic",
+    "hash_source_logic",
+    "http_cache_path_logic",
+    "index_entries_logic",
+    "ingest_chunk_logic",
+    "iter_batches_logic",
+    "iter_json_items_logic",
+    "json_items_to_arrays_logic",
     "load_cache_logic",
+    "load_container_logic",
+    "load_http_cache_logic",
     "load_local_json_logic",
-    "process_single_path_logic",
+    "load_manifest_logic",
+    "normalize_stack_logic",
+    "open_storage_logic",
+    "parallel_ingest_logic",
+    "parse_response_body_logic",
+    "plan_rebuild_logic",
+    "prefetch_batches_engine",
+    "probe_sample_logic",
+    "process_paths_logic",
+    "process_stack_logic",
+    "prune_shards_logic",
+    "read_container_header_logic",
     "save_cache_logic",
+    "save_container_logic",
+    "save_http_cache_logic",
     "save_json_to_disk_logic",
+    "save_manifest_logic",
+    "scan_entries_logic",
+    "scan_image_dir_logic",
+    "shard_file_logic",
+    "shard_samples_engine",
+    "split_paths_logic",
+    "stack_samples_logic",
+    "storage_array_logic",
+    "stream_local_items_logic",
+    "stream_pipeline_engine",
+    "stream_remote_items_logic",
+    "touch_entry_logic",
     "transform_image_to_normalized_logic",
     "validate_dataset_integrity_logic",
+    "write_results_logic",
 ]
@@ -1,15 +1,19 @@
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
 
 from MyTorch import (
     T4D,
     BatchData,
     DataResult,
     FilePath,
+    ImageBatch,
+    ImageRGBBatch,
     JsonData,
     Label,
+    LabelsMtx,
+    MetricsDict,
     RawImage,
     Sample,
 )
@@ -24,10 +28,27 @@ class BatchProcessingABC(ABC):
 
     @abstractmethod
     def create_batches(
-        self, data: T4D, batch_size: int = 1, shuffle: bool = True, seed: int = 0
+        self,
+        data: T4D,
+        batch_size: int = 1,
+        shuffle: bool = True,
+        seed: int = 0,
+        epoch: int = 0,
     ) -> List[T4D]:
         pass
 
+    @abstractmethod
+    def iter_batches(
+        self,
+        data: T4D,
+        batch_size: int = 1,
+        shuffle: bool = True,
+        seed: int = 0,
+        epoch: int = 0,
+        out: Optional[T4D] = None,
+    ) -> Iterator[T4D]:
+        pass
+
     @abstractmethod
     def process_batch(self, paths: List[FilePath]) -> T4D:
         pass
@@ -48,6 +69,10 @@ class CacheManagerABC(ABC):
     def cache(self, data: BatchData, path: FilePath) -> bool:
         pass
 
+    @abstractmethod
+    def get_stats(self) -> MetricsDict:
+        pass
+
 
 @dataclass(frozen=True, slots=True)
 class DatasetABC(ABC):
@@ -65,6 +90,22 @@ class DatasetABC(ABC):
         pass
 
 
+@dataclass(frozen=True, slots=True)
+class DataLoaderABC(ABC):
+    logger: logging.Logger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "logger", logging.getLogger(self.__class__.__name__))
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Tuple[T4D, LabelsMtx]]:
+        pass
+
+
 @dataclass(frozen=True, slots=True)
 class DataDownloaderABC(ABC):
     logger: logging.Logger = field(init=False, repr=False)
@@ -76,10 +117,39 @@ class DataDownloaderABC(ABC):
     def fetch_data(self, source: str, force_reload: bool = False) -> DataResult:
         pass
 
+    @abstractmethod
+    def fetch_many(
+        self, sources: List[str], force_reload: bool = False
+    ) -> List[DataResult]:
+        pass
+
+    @abstractmethod
+    def stream_data(self, source: str, chunk_size: int = 1 << 16) -> Iterator[JsonData]:
+        pass
+
     @abstractmethod
     def save_to_disk(self, data: JsonData, filename: FilePath = "data.json") -> bool:
         pass
 
+    @abstractmethod
+    def save_container(
+        self,
+        data: Union[ImageBatch, ImageRGBBatch],
+        filename: FilePath = "data.mtds",
+        labels: Optional[LabelsMtx] = None,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    def load_container(
+        self, filename: FilePath, verify: bool = False
+    ) -> Tuple[Union[ImageBatch, ImageRGBBatch], Optional[LabelsMtx]]:
+        pass
+
+    @abstractmethod
+    def convert_json(self, json_path: FilePath, filename: FilePath) -> bool:
+        pass
+
 
 @dataclass(frozen=True, slots=True)
 class DataProcessorABC(ABC):
@@ -103,3 +173,15 @@ class ProjectManagerABC(ABC):
     @abstractmethod
     def run_pipeline(self, source_url: str, fast_mode: bool = False) -> str:
         pass
+
+
+@dataclass(frozen=True, slots=True)
+class ShardBuilderABC(ABC):
+    logger: logging.Logger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "logger", logging.getLogger(self.__class__.__name__))
+
+    @abstractmethod
+    def build(self, input_dir: FilePath, output_dir: FilePath) -> MetricsDict:
+        pass
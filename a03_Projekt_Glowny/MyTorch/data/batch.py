@@ -1,10 +1,15 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List
+from multiprocessing import shared_memory
+from typing import Callable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
+from common_utils import reseed_components
 from data.base import BatchProcessingABC
-from MyTorch import T4D, FilePath
+from data.loader import batch_indices_logic
+from MyTorch import T4D, FilePath, ImageBatch, Shape
 from preprocessing import ImageDataPreprocessing, ImageDataPreprocessingProtocol
 
 
@@ -13,30 +18,233 @@ def create_batches_logic(
     batch_size: int = 1,
     shuffle: bool = True,
     seed: int = 0,
+    epoch: int = 0,
 ) -> List[T4D]:
+    data = np.asarray(data)
     if data.size == 0:
         return []
 
-    rng = np.random.default_rng(seed)
-    data_copy = rng.permutation(data) if shuffle else np.copy(data)
+    size: int = batch_size if batch_size > 0 else len(data)
+    batches = batch_indices_logic(len(data), size, shuffle, seed, epoch=epoch)
+    if not shuffle:
+        return [data[idx[0] : idx[-1] + 1] for idx in batches]
+    return [np.take(data, idx, axis=0) for idx in batches]
 
-    if batch_size <= 0:
-        return [data_copy]
 
-    num_samples = len(data_copy)
-    indices = np.arange(batch_size, num_samples, batch_size)
-    return np.array_split(data_copy, indices) if num_samples > 0 else []
+def iter_batches_logic(
+    data: T4D,
+    batch_size: int = 1,
+    shuffle: bool = True,
+    seed: int = 0,
+    epoch: int = 0,
+    out: Optional[T4D] = None,
+) -> Iterator[T4D]:
+    if data.size == 0:
+        return
+
+    size: int = batch_size if batch_size > 0 else len(data)
+    batches = batch_indices_logic(len(data), size, shuffle, seed, epoch=epoch)
+    if not shuffle:
+        for idx in batches:
+            yield data[idx[0] : idx[-1] + 1]
+        return
+
+    buffer = (
+        np.empty((size,) + data.shape[1:], dtype=data.dtype) if out is None else out
+    )
+    for idx in batches:
+        yield np.take(data, idx, axis=0, out=buffer[: len(idx)])
+
+
+def group_same_shape_logic(stacks: List[ImageBatch]) -> List[Tuple[int, int]]:
+    runs: List[Tuple[int, int]] = []
+    start = 0
+    for idx in range(1, len(stacks) + 1):
+        if idx == len(stacks) or stacks[idx].shape != stacks[start].shape:
+            runs.append((start, idx))
+            start = idx
+    return runs
 
 
-def process_single_path_logic(
-    path: FilePath, preprocessor: ImageDataPreprocessingProtocol
+def process_stack_logic(
+    stacks: List[ImageBatch], preprocessor: ImageDataPreprocessingProtocol
 ) -> T4D:
-    image_results = preprocessor.preprocess(path=path)
+    channels: ImageBatch = np.concatenate(stacks, axis=0)
+    samples = preprocessor.preprocess_channels(channels)
 
-    if not image_results:
+    if not samples:
         return np.zeros((0, 0, 0, 0), dtype=np.float32)
 
-    return np.concatenate(image_results, axis=0)
+    return np.stack(samples, axis=0)
+
+
+def process_group_logic(
+    group: List[Tuple[FilePath, ImageBatch]],
+    preprocessor: ImageDataPreprocessingProtocol,
+    log_error: Callable[[str], None],
+) -> List[T4D]:
+    try:
+        samples = process_stack_logic([s for _, s in group], preprocessor)
+        return [samples] if samples.size > 0 else []
+    except Exception as e:
+        if len(group) == 1:
+            log_error(f"Error processing {group[0][0]}: {e}")
+            return []
+
+    return [
+        samples
+        for item in group
+        for samples in process_group_logic([item], preprocessor, log_error)
+    ]
+
+
+def process_paths_logic(
+    paths: List[FilePath],
+    preprocessor: ImageDataPreprocessingProtocol,
+    log_error: Callable[[str], None],
+) -> T4D:
+    loaded: List[Tuple[FilePath, ImageBatch]] = []
+    for path in paths:
+        try:
+            channels = preprocessor.load_channels(path)
+            loaded.append((path, np.stack(channels, axis=0)))
+        except Exception as e:
+            log_error(f"Error processing {path}: {e}")
+            continue
+
+    all_samples: List[T4D] = []
+    for start, end in group_same_shape_logic([s for _, s in loaded]):
+        all_samples.extend(
+            process_group_logic(loaded[start:end], preprocessor, log_error)
+        )
+
+    if not all_samples:
+        return np.array([], dtype=float).reshape(0, 0, 0, 0)
+
+    return np.concatenate(all_samples, axis=0)
+
+
+def split_paths_logic(
+    paths: List[FilePath], n_chunks: int
+) -> List[Tuple[int, List[FilePath]]]:
+    bounds = np.linspace(0, len(paths), min(n_chunks, len(paths)) + 1).astype(int)
+    return [
+        (int(start), paths[start:end])
+        for start, end in zip(bounds[:-1], bounds[1:], strict=True)
+        if end > start
+    ]
+
+
+def ingest_chunk_logic(
+    shm_name: str,
+    out_shape: Shape,
+    offset: int,
+    capacity: int,
+    paths: List[FilePath],
+    preprocessor: ImageDataPreprocessingProtocol,
+    seed_seq: Optional[np.random.SeedSequence] = None,
+) -> Tuple[int, List[str], Optional[T4D]]:
+    if seed_seq is not None:
+        reseed_components(preprocessor, seed_seq)
+
+    errors: List[str] = []
+    samples = process_paths_logic(paths, preprocessor, errors.append)
+    if samples.size == 0:
+        return 0, errors, None
+
+    if samples.shape[1:] != tuple(out_shape[1:]) or len(samples) > capacity:
+        return 0, errors, samples
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(out_shape, dtype=np.float32, buffer=shm.buf)
+        out[offset : offset + len(samples)] = samples
+        del out
+    finally:
+        shm.close()
+    return len(samples), errors, None
+
+
+def probe_sample_logic(
+    paths: List[FilePath],
+    preprocessor: ImageDataPreprocessingProtocol,
+    seed_seq: np.random.SeedSequence,
+    log_error: Callable[[str], None],
+) -> T4D:
+    probe = copy.deepcopy(preprocessor)
+    reseed_components(probe, seed_seq)
+    for path in paths:
+        samples = process_paths_logic([path], probe, log_error)
+        if samples.size > 0:
+            return samples
+    return np.array([], dtype=float).reshape(0, 0, 0, 0)
+
+
+def parallel_ingest_logic(
+    paths: List[FilePath],
+    preprocessor: ImageDataPreprocessingProtocol,
+    workers: int,
+    log_error: Callable[[str], None],
+    seed: Optional[int] = None,
+) -> T4D:
+    chunks = split_paths_logic(paths, workers * 4)
+    chunk_seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    probe_errors: List[str] = []
+    probe = probe_sample_logic(paths, preprocessor, chunk_seeds[0], probe_errors.append)
+    if probe.size == 0:
+        for message in probe_errors:
+            log_error(message)
+        return probe
+
+    samples_per_path: int = len(probe)
+    out_shape: Shape = (len(paths) * samples_per_path,) + probe.shape[1:]
+    n_bytes = int(np.prod(out_shape)) * np.dtype(np.float32).itemsize
+
+    shm = shared_memory.SharedMemory(create=True, size=max(n_bytes, 1))
+    try:
+        written: List[Tuple[int, int, Optional[T4D]]] = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    ingest_chunk_logic,
+                    shm.name,
+                    out_shape,
+                    start * samples_per_path,
+                    len(chunk) * samples_per_path,
+                    chunk,
+                    preprocessor,
+                    chunk_seed,
+                )
+                for (start, chunk), chunk_seed in zip(chunks, chunk_seeds, strict=True)
+            ]
+            for (start, chunk), future in zip(chunks, futures, strict=True):
+                try:
+                    count, errors, overflow = future.result()
+                except Exception as e:
+                    count, overflow = 0, None
+                    errors = [f"Error processing {path}: {e}" for path in chunk]
+                for message in errors:
+                    log_error(message)
+                written.append((start * samples_per_path, count, overflow))
+
+        out = np.ndarray(out_shape, dtype=np.float32, buffer=shm.buf)
+        parts: List[T4D] = []
+        for offset, count, overflow in written:
+            if overflow is not None:
+                parts.append(overflow)
+            elif count:
+                parts.append(out[offset : offset + count])
+        result = (
+            np.concatenate(parts, axis=0)
+            if parts
+            else np.array([], dtype=float).reshape(0, 0, 0, 0)
+        )
+        del out, parts
+        return result
+    finally:
+        shm.close()
+        shm.unlink()
 
 
 @dataclass(frozen=True, slots=True)
@@ -44,23 +252,38 @@ class BatchProcessing(BatchProcessingABC):
     preprocessor: ImageDataPreprocessingProtocol = field(
         default_factory=ImageDataPreprocessing
     )
+    workers: int = 1
+    seed: Optional[int] = None
 
     def create_batches(
-        self, data: T4D, batch_size: int = 1, shuffle: bool = True, seed: int = 0
+        self,
+        data: T4D,
+        batch_size: int = 1,
+        shuffle: bool = True,
+        seed: int = 0,
+        epoch: int = 0,
     ) -> List[T4D]:
-        return create_batches_logic(data, batch_size, shuffle, seed)
+        return create_batches_logic(data, batch_size, shuffle, seed, epoch)
+
+    def iter_batches(
+        self,
+        data: T4D,
+        batch_size: int = 1,
+        shuffle: bool = True,
+        seed: int = 0,
+        epoch: int = 0,
+        out: Optional[T4D] = None,
+    ) -> Iterator[T4D]:
+        return iter_batches_logic(data, batch_size, shuffle, seed, epoch, out)
 
     def process_batch(self, paths: List[FilePath]) -> T4D:
-        all_samples: List[T4D] = []
-        for path in paths:
-            try:
-                samples = process_single_path_logic(path, self.preprocessor)
-                all_samples.append(samples)
-            except Exception as e:
-                self.logger.error(f"Error processing {path}: {e}")
-                continue
-
-        if not all_samples:
-            return np.array([], dtype=float).reshape(0, 0, 0, 0)
-
-        return np.concatenate(all_samples, axis=0)
+        if self.workers > 1 and len(paths) > 1:
+            return parallel_ingest_logic(
+                paths=paths,
+                preprocessor=self.preprocessor,
+                workers=self.workers,
+                log_error=self.logger.error,
+                seed=self.seed,
+            )
+
+        return process_paths_logic(paths, self.preprocessor, self.logger.error)
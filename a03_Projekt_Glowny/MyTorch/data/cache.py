@@ -1,29 +1,180 @@
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from data.base import CacheManagerABC
-from MyTorch import BatchData, FilePath
+from MyTorch import BatchData, FilePath, JsonDict, MetricsDict
+
+ENTRY_FILE = "{index:04d}.npy"
+
+
+def hash_source_logic(
+    path: FilePath, config: JsonDict, chunk_size: int = 1 << 20
+) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def storage_array_logic(tensor: np.ndarray) -> np.ndarray:
+    if tensor.dtype == np.uint8:
+        return np.ascontiguousarray(tensor)
+    return np.ascontiguousarray(tensor, dtype=np.float32)
 
 
 def load_cache_logic(path: FilePath) -> BatchData:
-    return []
+    if not os.path.isdir(path):
+        return []
+
+    names = sorted(name for name in os.listdir(path) if name.endswith(".npy"))
+    return [np.load(os.path.join(path, name), mmap_mode="r") for name in names]
 
 
 def save_cache_logic(data: BatchData, path: FilePath) -> bool:
     if not data:
         return False
+
+    root = os.path.dirname(path) or "."
+    os.makedirs(root, exist_ok=True)
+    tmp_dir = os.path.join(root, f".tmp-{uuid.uuid4().hex}")
+    os.makedirs(tmp_dir)
+
+    try:
+        for index, tensor in enumerate(data):
+            target = os.path.join(tmp_dir, ENTRY_FILE.format(index=index))
+            with open(target, "wb") as file:
+                np.save(file, storage_array_logic(np.asarray(tensor)))
+                file.flush()
+                os.fsync(file.fileno())
+        os.rename(tmp_dir, path)
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not os.path.isdir(path):
+            raise
     return True
 
 
+def touch_entry_logic(path: FilePath) -> None:
+    now: int = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def entry_size_logic(path: FilePath) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+def scan_entries_logic(root: FilePath) -> List[Tuple[int, int, FilePath]]:
+    if not os.path.isdir(root):
+        return []
+
+    entries: List[Tuple[int, int, FilePath]] = []
+    for entry in os.scandir(root):
+        if entry.name.startswith(".") or not entry.is_dir():
+            continue
+        try:
+            entries.append(
+                (entry.stat().st_mtime_ns, entry_size_logic(entry.path), entry.path)
+            )
+        except FileNotFoundError:
+            continue
+    return sorted(entries)
+
+
+def index_entries_logic(root: FilePath) -> Dict[FilePath, int]:
+    return {path: size for _, size, path in scan_entries_logic(root)}
+
+
+def evict_lru_logic(
+    root: FilePath,
+    max_bytes: int,
+    keep: FilePath = "",
+    index: Optional[Dict[FilePath, int]] = None,
+) -> int:
+    entries = scan_entries_logic(root)
+    total: int = sum(size for _, size, _ in entries)
+    evicted: int = 0
+    if index is not None:
+        index.clear()
+        index.update({path: size for _, size, path in entries})
+
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+
+        trash = os.path.join(root, f".evict-{uuid.uuid4().hex}")
+        try:
+            os.rename(path, trash)
+        except OSError:
+            continue
+        shutil.rmtree(trash, ignore_errors=True)
+        total -= size
+        evicted += 1
+        if index is not None:
+            index.pop(path, None)
+    return evicted
+
+
 @dataclass(frozen=True, slots=True)
 class CacheManager(CacheManagerABC):
+    root: FilePath = ".cache/tensors"
+    max_bytes: int = 2 * 1024**3
+    config: JsonDict = field(default_factory=dict)
+    counters: Dict[str, int] = field(
+        default_factory=lambda: {"hits": 0, "misses": 0, "evictions": 0},
+        init=False,
+        repr=False,
+    )
+    sizes: Dict[FilePath, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.sizes.update(index_entries_logic(self.root))
+
+    def entry_path(self, path: FilePath) -> FilePath:
+        return os.path.join(self.root, hash_source_logic(path, self.config))
+
     def load(self, path: FilePath) -> BatchData:
         try:
-            return load_cache_logic(path)
+            entry = self.entry_path(path)
+            data = load_cache_logic(entry)
+            if data:
+                touch_entry_logic(entry)
         except Exception as e:
             self.logger.error(f"Failed to load cache from {path}: {e}")
-            return []
+            data = []
+
+        self.counters["hits" if data else "misses"] += 1
+        return data
 
     def cache(self, data: BatchData, path: FilePath) -> bool:
         if not data:
             return False
-        return save_cache_logic(data, path)
+
+        try:
+            entry = self.entry_path(path)
+            saved = save_cache_logic(data, entry)
+            touch_entry_logic(entry)
+            self.sizes[entry] = entry_size_logic(entry)
+            if sum(self.sizes.values()) > self.max_bytes:
+                self.counters["evictions"] += evict_lru_logic(
+                    self.root, self.max_bytes, keep=entry, index=self.sizes
+                )
+            return saved
+        except Exception as e:
+            self.logger.error(f"Failed to cache {path}: {e}")
+            return False
+
+    def get_stats(self) -> MetricsDict:
+        return dict(self.counters)
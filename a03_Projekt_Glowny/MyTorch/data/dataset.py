@@ -1,10 +1,16 @@
+import os
 from dataclasses import dataclass, field
-from typing import Tuple, cast
+from typing import Optional, Tuple, Union, cast
 
-from MyTorch import BatchData, Label, LabelsMtx, Sample
+import numpy as np
+
+from MyTorch import T4D, BatchData, Label, LabelsMtx, Sample, Shape
 
 from .base import DatasetABC
 
+DATA_FILE = "data.npy"
+LABELS_FILE = "labels.npy"
+
 
 def validate_dataset_integrity_logic(data: BatchData, labels: LabelsMtx) -> bool:
     if not data or labels.size == 0:
@@ -25,6 +31,84 @@ def get_dataset_item_logic(
     return sample_item, label_item
 
 
+def stack_samples_logic(samples: BatchData, out: Optional[T4D] = None) -> T4D:
+    arrays = [np.asarray(sample) for sample in samples]
+    if arrays and arrays[0].ndim == 2:
+        arrays = [array[np.newaxis] for array in arrays]
+    if out is not None:
+        return np.stack(arrays, out=out)
+    return np.ascontiguousarray(np.stack(arrays), dtype=np.float32)
+
+
+def create_storage_logic(
+    path: str, n_samples: int, sample_shape: Shape, dtype: type = np.float32
+) -> Tuple[T4D, LabelsMtx]:
+    os.makedirs(path, exist_ok=True)
+    data = np.lib.format.open_memmap(
+        os.path.join(path, DATA_FILE),
+        mode="w+",
+        dtype=dtype,
+        shape=(n_samples,) + tuple(sample_shape),
+    )
+    labels = np.lib.format.open_memmap(
+        os.path.join(path, LABELS_FILE), mode="w+", dtype=np.int64, shape=(n_samples,)
+    )
+    return data, labels
+
+
+def open_storage_logic(path: str, mode: str = "r") -> Tuple[T4D, LabelsMtx]:
+    data = np.load(os.path.join(path, DATA_FILE), mmap_mode=mode)
+    labels = np.load(os.path.join(path, LABELS_FILE), mmap_mode=mode)
+    return data, labels
+
+
+def get_array_item_logic(
+    data: T4D, labels: LabelsMtx, index: Union[int, slice]
+) -> Tuple[T4D, Union[Label, LabelsMtx]]:
+    if isinstance(index, slice):
+        return data[index], labels[index]
+    return data[index], int(labels[index])
+
+
+def gather_batch_logic(
+    data: T4D, labels: LabelsMtx, indices: LabelsMtx, out: Optional[T4D] = None
+) -> Tuple[T4D, LabelsMtx]:
+    if indices.size > 1 and np.all(np.diff(indices) == 1):
+        run = slice(int(indices[0]), int(indices[-1]) + 1)
+        return data[run], labels[run]
+    return np.take(data, indices, axis=0, out=out), labels[indices]
+
+
+@dataclass(frozen=True, slots=True)
+class ArrayDataset(DatasetABC):
+    data: T4D = field(repr=False)
+    labels: LabelsMtx = field(repr=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if len(self.data) != len(self.labels):
+            error_msg = f"Integrity check failed: data_len={len(self.data)}, labels_len={len(self.labels)}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Tuple[T4D, Union[Label, LabelsMtx]]:
+        try:
+            return get_array_item_logic(self.data, self.labels, index)
+        except IndexError:
+            self.logger.error(f"Index {index} out of bounds (size: {len(self)})")
+            raise
+
+    def get_batch(
+        self, indices: LabelsMtx, out: Optional[T4D] = None
+    ) -> Tuple[T4D, LabelsMtx]:
+        return gather_batch_logic(self.data, self.labels, indices, out)
+
+
 @dataclass(frozen=True, slots=True)
 class Dataset(DatasetABC):
     data: BatchData = field(repr=False)
@@ -1,14 +1,46 @@
+import codecs
+import hashlib
 import json
 import os
+import struct
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from json import JSONDecodeError
-from typing import List, Literal, cast, overload
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
-from MyTorch import BatchData, DataResult, FilePath, ImageGray, JsonData, RawImage
+from MyTorch import (
+    BatchData,
+    DataResult,
+    FilePath,
+    ImageBatch,
+    ImageGray,
+    ImageRGBBatch,
+    JsonData,
+    JsonDict,
+    LabelsMtx,
+    RawImage,
+    Shape,
+)
 
 from .base import (
     DataDownloaderABC,
@@ -17,6 +49,17 @@ from .base import (
 )
 from .protocols import DataDownloaderProtocol, DataProcessorProtocol
 
+RESULT_FILE = "part-{batch:05d}-{run:02d}.npy"
+GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+CONTAINER_MAGIC = b"MTDS"
+CONTAINER_VERSION = 1
+CONTAINER_HEADER = struct.Struct("<4sBBBxQ4IQQI")
+CONTAINER_DATA_OFFSET = 64
+CONTAINER_DTYPES: Dict[int, np.dtype] = {
+    0x08: np.dtype(np.uint8),
+    0x0D: np.dtype(np.float32),
+}
+
 
 def save_json_to_disk_logic(data: JsonData, filename: FilePath) -> bool:
     try:
@@ -27,19 +70,178 @@ def save_json_to_disk_logic(data: JsonData, filename: FilePath) -> bool:
         return False
 
 
-def fetch_remote_data_logic(url: str, timeout: int = 10) -> DataResult:
+def create_session_logic(pool_size: int = 8) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def http_cache_path_logic(cache_dir: FilePath, url: str) -> FilePath:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.http")
+
+
+def load_http_cache_logic(cache_dir: FilePath, url: str) -> Tuple[JsonDict, bytes]:
+    path = http_cache_path_logic(cache_dir, url)
+    if not cache_dir or not os.path.exists(path):
+        return {}, b""
     try:
-        response = requests.get(url, timeout=timeout)
+        with open(path, "rb") as file:
+            header, _, body = file.read().partition(b"\n")
+        meta = json.loads(header)
+    except (IOError, ValueError):
+        return {}, b""
+    if meta.get("url") != url:
+        return {}, b""
+    return meta, body
+
+
+def conditional_headers_logic(meta: JsonDict) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def save_http_cache_logic(
+    cache_dir: FilePath, url: str, content: bytes, headers: Mapping[str, str]
+) -> bool:
+    meta = {
+        "url": url,
+        "etag": headers.get("ETag", ""),
+        "last_modified": headers.get("Last-Modified", ""),
+    }
+    if not meta["etag"] and not meta["last_modified"]:
+        return False
+
+    os.makedirs(cache_dir, exist_ok=True)
+    path = http_cache_path_logic(cache_dir, url)
+    tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+    with open(tmp_path, "wb") as file:
+        file.write(json.dumps(meta).encode("utf-8") + b"\n")
+        file.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def parse_response_body_logic(content: bytes) -> DataResult:
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content
+
+
+def fetch_remote_data_logic(
+    url: str,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None,
+    cache_dir: FilePath = "",
+) -> DataResult:
+    meta, body = load_http_cache_logic(cache_dir, url)
+    client = session if session is not None else requests
+    try:
+        response = client.get(
+            url, timeout=timeout, headers=conditional_headers_logic(meta)
+        )
+        if response.status_code == 304 and meta:
+            return parse_response_body_logic(body)
         if response.status_code == 200:
-            try:
-                return response.json()
-            except ValueError:
-                return response.content
+            if cache_dir:
+                save_http_cache_logic(
+                    cache_dir, url, response.content, response.headers
+                )
+            return parse_response_body_logic(response.content)
         return {}
     except (RequestException, Exception):
         return {}
 
 
+def decode_array_items_logic(
+    decoder: json.JSONDecoder, buffer: str, final: bool = False
+) -> Tuple[List[JsonData], str, bool]:
+    items: List[JsonData] = []
+    pos: int = 0
+    size: int = len(buffer)
+
+    while True:
+        while pos < size and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos == size:
+            return items, "", False
+        if buffer[pos] == "]":
+            return items, buffer[pos + 1 :], True
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except JSONDecodeError:
+            if final:
+                raise
+            return items, buffer[pos:], False
+
+        if end == size and not final:
+            return items, buffer[pos:], False
+        items.append(item)
+        pos = end
+
+
+def iter_json_items_logic(chunks: Iterable[bytes]) -> Iterator[JsonData]:
+    stream = iter(chunks)
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer: str = ""
+    started: bool = False
+
+    for chunk in stream:
+        buffer += text.decode(chunk)
+        if not started:
+            buffer = buffer.lstrip()
+            if not buffer:
+                continue
+            if buffer[0] != "[":
+                rest = "".join(text.decode(part) for part in stream)
+                yield json.loads(buffer + rest + text.decode(b"", final=True))
+                return
+            buffer, started = buffer[1:], True
+
+        items, buffer, done = decode_array_items_logic(decoder, buffer)
+        yield from items
+        if done:
+            return
+
+    buffer += text.decode(b"", final=True)
+    if not started:
+        return
+
+    items, buffer, done = decode_array_items_logic(decoder, buffer, final=True)
+    yield from items
+    if not done:
+        raise ValueError("Truncated JSON array")
+
+
+def stream_remote_items_logic(
+    url: str,
+    timeout: int = 10,
+    chunk_size: int = 1 << 16,
+    session: Optional[requests.Session] = None,
+) -> Iterator[JsonData]:
+    client = session if session is not None else requests
+    with client.get(url, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+            return
+        yield from iter_json_items_logic(response.iter_content(chunk_size))
+
+
+def stream_local_items_logic(
+    path: FilePath, chunk_size: int = 1 << 16
+) -> Iterator[JsonData]:
+    with open(path, "rb") as file:
+        yield from iter_json_items_logic(iter(lambda: file.read(chunk_size), b""))
+
+
 def load_local_json_logic(path: FilePath) -> DataResult:
     if not path or not os.path.exists(path):
         return {}
@@ -50,23 +252,186 @@ def load_local_json_logic(path: FilePath) -> DataResult:
         return {}
 
 
+def container_checksum_logic(data: np.ndarray, labels: Optional[LabelsMtx]) -> int:
+    checksum = zlib.crc32(memoryview(data).cast("B"))
+    if labels is not None:
+        checksum = zlib.crc32(memoryview(labels).cast("B"), checksum)
+    return checksum
+
+
+def save_container_logic(
+    data: Union[ImageBatch, ImageRGBBatch],
+    filename: FilePath,
+    labels: Optional[LabelsMtx] = None,
+) -> bool:
+    code = next(
+        (code for code, dtype in CONTAINER_DTYPES.items() if dtype == data.dtype), None
+    )
+    if code is None or not 1 <= data.ndim <= 5:
+        return False
+    if labels is not None and len(labels) != len(data):
+        return False
+
+    data = np.ascontiguousarray(data)
+    if labels is not None:
+        labels = np.ascontiguousarray(labels, dtype="<i8")
+
+    dims = tuple(data.shape[1:]) + (0,) * (5 - data.ndim)
+    labels_offset: int = 0
+    if labels is not None:
+        labels_offset = -(-(CONTAINER_DATA_OFFSET + data.nbytes) // 8) * 8
+
+    header = CONTAINER_HEADER.pack(
+        CONTAINER_MAGIC,
+        CONTAINER_VERSION,
+        code,
+        data.ndim - 1,
+        len(data),
+        *dims,
+        CONTAINER_DATA_OFFSET,
+        labels_offset,
+        container_checksum_logic(data, labels),
+    )
+
+    tmp_path = f"{filename}.tmp-{uuid.uuid4().hex}"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(header.ljust(CONTAINER_DATA_OFFSET, b"\0"))
+            file.write(memoryview(data).cast("B"))
+            if labels is not None:
+                file.write(b"\0" * (labels_offset - file.tell()))
+                file.write(memoryview(labels).cast("B"))
+        os.replace(tmp_path, filename)
+        return True
+    except (IOError, TypeError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def read_container_header_logic(filename: FilePath) -> JsonDict:
+    with open(filename, "rb") as file:
+        raw = file.read(CONTAINER_HEADER.size)
+    if len(raw) < CONTAINER_HEADER.size:
+        raise ValueError(f"Truncated container header: {filename}")
+
+    magic, version, code, ndim, count, *rest = CONTAINER_HEADER.unpack(raw)
+    dims, (data_offset, labels_offset, checksum) = rest[:4], rest[4:]
+    if magic != CONTAINER_MAGIC or version != CONTAINER_VERSION:
+        raise ValueError(f"Not a dataset container: {filename}")
+    if code not in CONTAINER_DTYPES:
+        raise ValueError(f"Unknown container dtype code: {code:#04x}")
+
+    return {
+        "dtype": CONTAINER_DTYPES[code],
+        "shape": (count,) + tuple(dims[:ndim]),
+        "data_offset": data_offset,
+        "labels_offset": labels_offset,
+        "checksum": checksum,
+    }
+
+
+def load_container_logic(
+    filename: FilePath, verify: bool = False
+) -> Tuple[Union[ImageBatch, ImageRGBBatch], Optional[LabelsMtx]]:
+    header = read_container_header_logic(filename)
+    shape: Shape = header["shape"]
+
+    data = np.memmap(
+        filename,
+        dtype=header["dtype"],
+        mode="r",
+        offset=header["data_offset"],
+        shape=shape,
+    )
+    labels: Optional[LabelsMtx] = None
+    if header["labels_offset"]:
+        labels = np.memmap(
+            filename,
+            dtype="<i8",
+            mode="r",
+            offset=header["labels_offset"],
+            shape=(shape[0],),
+        )
+
+    if verify and container_checksum_logic(data, labels) != header["checksum"]:
+        raise ValueError(f"Checksum mismatch in container: {filename}")
+    return data, labels
+
+
+def json_items_to_arrays_logic(
+    items: List[JsonData],
+) -> Tuple[Union[ImageBatch, ImageRGBBatch], Optional[LabelsMtx]]:
+    images: List[np.ndarray] = []
+    labels: List[int] = []
+    for item in items:
+        if isinstance(item, dict):
+            images.append(np.asarray(item["image"]))
+            if "label" in item:
+                labels.append(int(item["label"]))
+        else:
+            images.append(np.asarray(item))
+
+    data = np.stack(images, axis=0)
+    is_bytes = np.issubdtype(data.dtype, np.integer) and (
+        data.size == 0 or (data.min() >= 0 and data.max() <= 255)
+    )
+    data = data.astype(np.uint8 if is_bytes else np.float32)
+
+    if labels and len(labels) != len(images):
+        raise ValueError("Labels present on only some JSON items")
+    return data, np.asarray(labels, dtype=np.int64) if labels else None
+
+
+def convert_json_to_container_logic(json_path: FilePath, filename: FilePath) -> bool:
+    raw_data = load_local_json_logic(json_path)
+    items = _prepare_items_for_processing(raw_data)
+    if not items:
+        return False
+
+    data, labels = json_items_to_arrays_logic(cast(List[JsonData], items))
+    return save_container_logic(data, filename, labels)
+
+
+def bucket_by_shape_logic(items: List[RawImage]) -> Dict[Shape, List[int]]:
+    buckets: Dict[Shape, List[int]] = {}
+    for idx, item in enumerate(items):
+        shape: Shape = np.shape(item)
+        if len(shape) in (2, 3) and 0 not in shape:
+            buckets.setdefault(shape, []).append(idx)
+    return buckets
+
+
+def normalize_stack_logic(
+    stack: Union[ImageBatch, ImageRGBBatch],
+    grayscale: bool = True,
+    out: Optional[Union[ImageBatch, ImageRGBBatch]] = None,
+) -> Union[ImageBatch, ImageRGBBatch]:
+    if grayscale and stack.ndim == 4:
+        if stack.shape[-1] >= 3:
+            return np.matmul(stack[..., :3], GRAY_WEIGHTS / 255.0, out=out)
+        stack = stack[..., 0]
+    return np.multiply(stack, np.float32(1.0 / 255.0), out=out, dtype=np.float32)
+
+
 def transform_image_to_normalized_logic(
     item: RawImage, grayscale: bool = True
 ) -> ImageGray:
-    img = np.array(item).astype(np.float32) / 255.0
+    img = normalize_stack_logic(np.asarray(item)[np.newaxis], grayscale)[0]
 
     assert img.ndim == 2, f"Expected 2D ImageGray, got {img.ndim}D"
 
     return img
 
 
-def batch_transform_engine(items: List[RawImage], grayscale: bool = True) -> BatchData:
-    processed: List[ImageGray] = []
-    for item in items:
-        res = transform_image_to_normalized_logic(item, grayscale)
-        if res.size > 0:
-            processed.append(res)
-    return processed
+def batch_transform_engine(
+    items: List[RawImage], grayscale: bool = True
+) -> List[Union[ImageBatch, ImageRGBBatch]]:
+    blocks: List[Union[ImageBatch, ImageRGBBatch]] = []
+    for indices in bucket_by_shape_logic(items).values():
+        stack = np.stack([np.asarray(items[idx]) for idx in indices], axis=0)
+        blocks.append(normalize_stack_logic(stack, grayscale))
+    return blocks
 
 
 def determine_pipeline_result_logic(success_count: int, fast_mode: bool = False) -> str:
@@ -77,6 +442,66 @@ def determine_pipeline_result_logic(success_count: int, fast_mode: bool = False)
     return "1" if fast_mode else success_msg
 
 
+def coerce_raw_image_logic(item: DataResult) -> Optional[RawImage]:
+    if isinstance(item, list):
+        try:
+            item = np.asarray(item, dtype=np.uint8)
+        except (TypeError, ValueError):
+            return None
+    if isinstance(item, np.ndarray) and item.ndim == 3:
+        return item
+    return None
+
+
+def write_results_logic(data: BatchData, output_dir: FilePath, index: int) -> int:
+    os.makedirs(output_dir, exist_ok=True)
+    for run, block in enumerate(data):
+        target = os.path.join(output_dir, RESULT_FILE.format(batch=index, run=run))
+        np.save(target, block)
+    return len(data)
+
+
+def flush_stream_batch_logic(
+    batch: List[RawImage],
+    processor: DataProcessorProtocol,
+    output_dir: FilePath,
+    index: int,
+) -> int:
+    processed = processor.process_batch(batch)
+    if output_dir and processed:
+        write_results_logic(processed, output_dir, index)
+    return sum(len(block) for block in processed)
+
+
+def stream_pipeline_engine(
+    items: Iterable[DataResult],
+    processor: DataProcessorProtocol,
+    batch_size: int = 256,
+    output_dir: FilePath = "",
+    log_debug: Callable[[str], None] = lambda _: None,
+) -> int:
+    success_count: int = 0
+    batch: List[RawImage] = []
+    index: int = 0
+
+    for item in items:
+        image = coerce_raw_image_logic(item)
+        if image is None:
+            log_debug(f"Skipping non-image item: {type(item).__name__}")
+            continue
+
+        batch.append(image)
+        if len(batch) >= batch_size:
+            success_count += flush_stream_batch_logic(
+                batch, processor, output_dir, index
+            )
+            batch, index = [], index + 1
+
+    if batch:
+        success_count += flush_stream_batch_logic(batch, processor, output_dir, index)
+    return success_count
+
+
 def _prepare_items_for_processing(raw_data: DataResult) -> List[DataResult]:
     if not raw_data:
         return []
@@ -90,17 +515,26 @@ def _prepare_items_for_processing(raw_data: DataResult) -> List[DataResult]:
 @dataclass(frozen=True, slots=True)
 class DataDownloader(DataDownloaderABC):
     timeout: int = 10
+    workers: int = 8
+    cache_dir: FilePath = ""
+    session: requests.Session = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         super().__post_init__()
         if self.timeout > 60:
             self.logger.warning(f"High timeout detected: {self.timeout}s")
+        object.__setattr__(self, "session", create_session_logic(self.workers))
 
     def fetch_data(self, source: str, force_reload: bool = False) -> DataResult:
         is_url = source.startswith(("http://", "https://"))
 
         if is_url or force_reload:
-            result = fetch_remote_data_logic(source, timeout=self.timeout)
+            result = fetch_remote_data_logic(
+                source,
+                timeout=self.timeout,
+                session=self.session,
+                cache_dir=self.cache_dir,
+            )
             if not result:
                 self.logger.error(f"Remote fetch failed or returned empty: {source}")
                 return {}
@@ -117,12 +551,67 @@ class DataDownloader(DataDownloaderABC):
 
         return result
 
+    def fetch_many(
+        self, sources: List[str], force_reload: bool = False
+    ) -> List[DataResult]:
+        if not sources:
+            return []
+
+        workers: int = max(1, min(self.workers, len(sources)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(lambda source: self.fetch_data(source, force_reload), sources)
+            )
+
+    def stream_data(self, source: str, chunk_size: int = 1 << 16) -> Iterator[JsonData]:
+        is_url = source.startswith(("http://", "https://"))
+        if not is_url and not os.path.exists(source):
+            self.logger.warning(f"File not found: {source}")
+            return
+
+        try:
+            if is_url:
+                yield from stream_remote_items_logic(
+                    source, self.timeout, chunk_size, self.session
+                )
+            else:
+                yield from stream_local_items_logic(source, chunk_size)
+        except (RequestException, OSError, ValueError) as e:
+            self.logger.error(f"Streaming from {source} stopped: {e}")
+
     def save_to_disk(self, data: JsonData, filename: FilePath = "data.json") -> bool:
         success = save_json_to_disk_logic(data, filename)
         if not success:
             self.logger.error(f"Failed to save JSON to: {filename}")
         return success
 
+    def save_container(
+        self,
+        data: Union[ImageBatch, ImageRGBBatch],
+        filename: FilePath = "data.mtds",
+        labels: Optional[LabelsMtx] = None,
+    ) -> bool:
+        success = save_container_logic(data, filename, labels)
+        if not success:
+            self.logger.error(f"Failed to save container to: {filename}")
+        return success
+
+    def load_container(
+        self, filename: FilePath, verify: bool = False
+    ) -> Tuple[Union[ImageBatch, ImageRGBBatch], Optional[LabelsMtx]]:
+        return load_container_logic(filename, verify)
+
+    def convert_json(self, json_path: FilePath, filename: FilePath) -> bool:
+        try:
+            success = convert_json_to_container_logic(json_path, filename)
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.error(f"Failed to convert {json_path}: {e}")
+            return False
+
+        if not success:
+            self.logger.error(f"No convertible items in: {json_path}")
+        return success
+
 
 @dataclass(frozen=True, slots=True)
 class DataProcessor(DataProcessorABC):
@@ -133,7 +622,7 @@ class DataProcessor(DataProcessorABC):
 
         processed_items = batch_transform_engine(items, grayscale)
 
-        success_count = len(processed_items)
+        success_count = sum(len(block) for block in processed_items)
         total_count = len(items)
 
         if success_count < total_count:
@@ -151,6 +640,9 @@ class DataProcessor(DataProcessorABC):
 class ProjectManager(ProjectManagerABC):
     downloader: DataDownloaderProtocol = field(default_factory=DataDownloader)
     processor: DataProcessorProtocol = field(default_factory=DataProcessor)
+    stream: bool = False
+    batch_size: int = 256
+    output_dir: FilePath = ""
 
     @overload
     def run_pipeline(self, source_url: str, fast_mode: Literal[True]) -> str: ...
@@ -163,14 +655,27 @@ class ProjectManager(ProjectManagerABC):
             f"Starting pipeline | Source: {source_url} | FastMode: {fast_mode}"
         )
 
+        if self.stream:
+            success_count = stream_pipeline_engine(
+                items=self.downloader.stream_data(source_url),
+                processor=self.processor,
+                batch_size=self.batch_size,
+                output_dir=self.output_dir,
+                log_debug=self.logger.debug,
+            )
+            result = determine_pipeline_result_logic(success_count, fast_mode)
+            self.logger.info(f"Execution finished. Result: {result}")
+            return result
+
         raw_data = self.downloader.fetch_data(source_url)
 
         items_to_process = _prepare_items_for_processing(raw_data)
 
         valid_images: List[RawImage] = []
         for item in items_to_process:
-            if isinstance(item, np.ndarray) and item.ndim == 3:
-                valid_images.append(item)
+            image = coerce_raw_image_logic(item)
+            if image is not None:
+                valid_images.append(image)
             else:
                 self.logger.debug(f"Skipping non-image item: {type(item).__name__}")
 
@@ -180,7 +685,8 @@ class ProjectManager(ProjectManagerABC):
 
         processed_data = self.processor.process_batch(valid_images)
 
-        result = determine_pipeline_result_logic(len(processed_data), fast_mode)
+        success_count = sum(len(block) for block in processed_data)
+        result = determine_pipeline_result_logic(success_count, fast_mode)
 
         self.logger.info(f"Execution finished. Result: {result}")
         return result
@@ -0,0 +1,135 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from MyTorch import T4D, LabelsMtx
+
+from .base import DataLoaderABC
+from .protocols import ArrayDatasetProtocol
+
+BatchSlot = Tuple[T4D, LabelsMtx]
+
+
+def epoch_rng_logic(seed: int, epoch: int = 0) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(epoch,)))
+
+
+def batch_indices_logic(
+    n_samples: int,
+    batch_size: int,
+    shuffle: bool = True,
+    seed: int = 0,
+    drop_last: bool = False,
+    epoch: int = 0,
+) -> List[LabelsMtx]:
+    order = (
+        epoch_rng_logic(seed, epoch).permutation(n_samples)
+        if shuffle
+        else np.arange(n_samples)
+    )
+    stop: int = n_samples - n_samples % batch_size if drop_last else n_samples
+    return [order[start : start + batch_size] for start in range(0, stop, batch_size)]
+
+
+def allocate_batch_slots_logic(
+    dataset: ArrayDatasetProtocol, batch_size: int, n_slots: int
+) -> List[BatchSlot]:
+    if len(dataset) == 0:
+        return []
+
+    sample, _ = dataset[0]
+    return [
+        (
+            np.empty((batch_size,) + sample.shape, dtype=sample.dtype),
+            np.empty(batch_size, dtype=np.int64),
+        )
+        for _ in range(n_slots)
+    ]
+
+
+def fill_batch_slot_logic(
+    dataset: ArrayDatasetProtocol, indices: LabelsMtx, slot: BatchSlot
+) -> BatchSlot:
+    n: int = len(indices)
+    data_buf, label_buf = slot[0][:n], slot[1][:n]
+    data, labels = dataset.get_batch(indices, out=data_buf)
+    if data is not data_buf:
+        np.copyto(data_buf, data)
+    label_buf[:] = labels
+    return data_buf, label_buf
+
+
+def prefetch_batches_engine(
+    dataset: ArrayDatasetProtocol,
+    batches: List[LabelsMtx],
+    slots: List[BatchSlot],
+    workers: int = 1,
+) -> Iterator[BatchSlot]:
+    free: List[int] = list(range(len(slots)))
+    pending: Deque[Tuple[int, Future]] = deque()
+    submitted: int = 0
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        for _ in range(len(batches)):
+            while free and submitted < len(batches):
+                slot = free.pop()
+                future = pool.submit(
+                    fill_batch_slot_logic, dataset, batches[submitted], slots[slot]
+                )
+                pending.append((slot, future))
+                submitted += 1
+
+            slot, future = pending.popleft()
+            yield future.result()
+            free.append(slot)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(frozen=True, slots=True)
+class DataLoader(DataLoaderABC):
+    dataset: ArrayDatasetProtocol = field(repr=False)
+    batch_size: int = 32
+    shuffle: bool = True
+    seed: int = 0
+    drop_last: bool = False
+    prefetch: int = 2
+    workers: int = 1
+    slots: List[BatchSlot] = field(init=False, repr=False)
+    counters: Dict[str, int] = field(
+        default_factory=lambda: {"epoch": 0}, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if self.batch_size <= 0 or self.prefetch <= 0:
+            error_msg = f"Invalid loader config: batch_size={self.batch_size}, prefetch={self.prefetch}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        slots = allocate_batch_slots_logic(
+            self.dataset, self.batch_size, self.prefetch + 1
+        )
+        object.__setattr__(self, "slots", slots)
+
+    def __len__(self) -> int:
+        n_samples: int = len(self.dataset)
+        if self.drop_last:
+            return n_samples // self.batch_size
+        return -(-n_samples // self.batch_size)
+
+    def __iter__(self) -> Iterator[BatchSlot]:
+        batches = batch_indices_logic(
+            len(self.dataset),
+            self.batch_size,
+            self.shuffle,
+            self.seed,
+            self.drop_last,
+            self.counters["epoch"],
+        )
+        self.counters["epoch"] += 1
+        return prefetch_batches_engine(self.dataset, batches, self.slots, self.workers)
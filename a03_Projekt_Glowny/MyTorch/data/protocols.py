@@ -1,12 +1,16 @@
-from typing import List, Literal, Protocol, Tuple, overload
+from typing import Iterator, List, Literal, Optional, Protocol, Tuple, Union, overload
 
 from MyTorch import (
     T4D,
     BatchData,
     DataResult,
     FilePath,
+    ImageBatch,
+    ImageRGBBatch,
     JsonData,
     Label,
+    LabelsMtx,
+    MetricsDict,
     RawImage,
     Sample,
 )
@@ -14,9 +18,24 @@ from MyTorch import (
 
 class BatchProcessingProtocol(Protocol):
     def create_batches(
-        self, data: T4D, batch_size: int = 1, shuffle: bool = True, seed: int = 0
+        self,
+        data: T4D,
+        batch_size: int = 1,
+        shuffle: bool = True,
+        seed: int = 0,
+        epoch: int = 0,
     ) -> List[T4D]: ...
 
+    def iter_batches(
+        self,
+        data: T4D,
+        batch_size: int = 1,
+        shuffle: bool = True,
+        seed: int = 0,
+        epoch: int = 0,
+        out: Optional[T4D] = None,
+    ) -> Iterator[T4D]: ...
+
     def process_batch(self, paths: List[FilePath]) -> T4D: ...
 
 
@@ -25,6 +44,8 @@ class CacheManagerProtocol(Protocol):
 
     def load(self, path: FilePath) -> BatchData: ...
 
+    def get_stats(self) -> MetricsDict: ...
+
 
 class DatasetProtocol(Protocol):
     def __len__(self) -> int: ...
@@ -32,13 +53,52 @@ class DatasetProtocol(Protocol):
     def __getitem__(self, index: int) -> Tuple[Sample, Label]: ...
 
 
+class ArrayDatasetProtocol(Protocol):
+    def __len__(self) -> int: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Tuple[T4D, Union[Label, LabelsMtx]]: ...
+
+    def get_batch(
+        self, indices: LabelsMtx, out: Optional[T4D] = None
+    ) -> Tuple[T4D, LabelsMtx]: ...
+
+
+class DataLoaderProtocol(Protocol):
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[Tuple[T4D, LabelsMtx]]: ...
+
+
 class DataDownloaderProtocol(Protocol):
     def fetch_data(self, source: str, force_reload: bool = False) -> DataResult: ...
 
+    def fetch_many(
+        self, sources: List[str], force_reload: bool = False
+    ) -> List[DataResult]: ...
+
+    def stream_data(
+        self, source: str, chunk_size: int = 1 << 16
+    ) -> Iterator[JsonData]: ...
+
     def save_to_disk(
         self, data: JsonData, filename: FilePath = "data.json"
     ) -> bool: ...
 
+    def save_container(
+        self,
+        data: Union[ImageBatch, ImageRGBBatch],
+        filename: FilePath = "data.mtds",
+        labels: Optional[LabelsMtx] = None,
+    ) -> bool: ...
+
+    def load_container(
+        self, filename: FilePath, verify: bool = False
+    ) -> Tuple[Union[ImageBatch, ImageRGBBatch], Optional[LabelsMtx]]: ...
+
+    def convert_json(self, json_path: FilePath, filename: FilePath) -> bool: ...
+
 
 class DataProcessorProtocol(Protocol):
     def process_batch(
@@ -54,3 +114,7 @@ class ProjectManagerProtocol(Protocol):
     def run_pipeline(self, source_url: str, fast_mode: Literal[False]) -> str: ...
 
     def run_pipeline(self, source_url: str, fast_mode: bool = False) -> str: ...
+
+
+class ShardBuilderProtocol(Protocol):
+    def build(self, input_dir: FilePath, output_dir: FilePath) -> MetricsDict: ...
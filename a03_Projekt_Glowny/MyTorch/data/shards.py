@@ -0,0 +1,224 @@
+import json
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from common_utils import reseed_components
+from data.base import ShardBuilderABC
+from MyTorch import FilePath, ImageBatch, JsonDict, MetricsDict
+from preprocessing import ImageDataPreprocessing, ImageDataPreprocessingProtocol
+
+from .batch import process_paths_logic
+from .cache import hash_source_logic
+from .downloader import save_container_logic
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff")
+MANIFEST_FILE = "manifest.json"
+SHARD_FILE = "shard-{index:05d}.mtds"
+
+
+def scan_image_dir_logic(root: FilePath) -> List[FilePath]:
+    paths: List[FilePath] = []
+    for directory, _, files in os.walk(root):
+        for name in files:
+            if name.lower().endswith(IMAGE_SUFFIXES):
+                paths.append(os.path.join(directory, name))
+    return sorted(paths)
+
+
+def hash_images_logic(
+    paths: List[FilePath], config: JsonDict, workers: int = 1
+) -> Dict[FilePath, str]:
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        digests = pool.map(lambda path: hash_source_logic(path, config), paths)
+        return dict(zip(paths, digests, strict=True))
+
+
+def load_manifest_logic(output_dir: FilePath) -> JsonDict:
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {"samples": [], "shards": [], "failed": {}}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_manifest_logic(manifest: JsonDict, output_dir: FilePath) -> None:
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def plan_rebuild_logic(
+    manifest: JsonDict, hashes: Dict[FilePath, str]
+) -> Tuple[JsonDict, List[FilePath]]:
+    samples = [s for s in manifest["samples"] if hashes.get(s["source"]) == s["hash"]]
+    failed = {
+        path: digest
+        for path, digest in manifest.get("failed", {}).items()
+        if hashes.get(path) == digest
+    }
+    done = {sample["source"] for sample in samples} | set(failed)
+    pending = [path for path in hashes if path not in done]
+    return {**manifest, "samples": samples, "failed": failed}, pending
+
+
+def file_seed_logic(seed: int, digest: str) -> np.random.SeedSequence:
+    return np.random.SeedSequence(seed, spawn_key=(int(digest[:16], 16),))
+
+
+def shard_file_logic(
+    path: FilePath,
+    preprocessor: ImageDataPreprocessingProtocol,
+    seed_seq: Optional[np.random.SeedSequence] = None,
+) -> Tuple[ImageBatch, List[str]]:
+    if seed_seq is not None:
+        reseed_components(preprocessor, seed_seq)
+
+    errors: List[str] = []
+    samples = process_paths_logic([path], preprocessor, errors.append)
+    return np.asarray(samples, dtype=np.float32), errors
+
+
+def shard_samples_engine(
+    paths: List[FilePath],
+    preprocessor: ImageDataPreprocessingProtocol,
+    workers: int = 1,
+    seeds: Optional[List[np.random.SeedSequence]] = None,
+) -> Iterator[Tuple[FilePath, ImageBatch, List[str]]]:
+    seeds = seeds if seeds is not None else [None] * len(paths)
+    if workers <= 1:
+        for path, seed_seq in zip(paths, seeds, strict=True):
+            yield (path, *shard_file_logic(path, preprocessor, seed_seq))
+        return
+
+    window: int = workers * 16
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(paths), window):
+            chunk = paths[start : start + window]
+            results = pool.map(
+                shard_file_logic,
+                chunk,
+                [preprocessor] * len(chunk),
+                seeds[start : start + window],
+            )
+            for path, (samples, errors) in zip(chunk, results, strict=True):
+                yield path, samples, errors
+
+
+def flush_shard_logic(
+    buffer: ImageBatch, count: int, output_dir: FilePath, index: int
+) -> JsonDict:
+    name = SHARD_FILE.format(index=index)
+    if not save_container_logic(buffer[:count], os.path.join(output_dir, name)):
+        raise IOError(f"Failed to write shard: {name}")
+    return {"index": index, "file": name, "count": count}
+
+
+def commit_shard_logic(
+    manifest: JsonDict,
+    buffer: ImageBatch,
+    count: int,
+    staged: List[JsonDict],
+    output_dir: FilePath,
+    index: int,
+) -> None:
+    manifest["shards"].append(flush_shard_logic(buffer, count, output_dir, index))
+    manifest["samples"] += staged
+    save_manifest_logic(manifest, output_dir)
+
+
+def prune_shards_logic(manifest: JsonDict, output_dir: FilePath) -> int:
+    used = {sample["shard"] for sample in manifest["samples"]}
+    stale = [shard for shard in manifest["shards"] if shard["index"] not in used]
+    for shard in stale:
+        path = os.path.join(output_dir, shard["file"])
+        if os.path.exists(path):
+            os.remove(path)
+    manifest["shards"] = [s for s in manifest["shards"] if s["index"] in used]
+    return len(stale)
+
+
+@dataclass(frozen=True, slots=True)
+class ShardBuilder(ShardBuilderABC):
+    preprocessor: ImageDataPreprocessingProtocol = field(
+        default_factory=ImageDataPreprocessing
+    )
+    shard_size: int = 4096
+    workers: int = 1
+    config: JsonDict = field(default_factory=dict)
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+    def build(self, input_dir: FilePath, output_dir: FilePath) -> MetricsDict:
+        os.makedirs(output_dir, exist_ok=True)
+        paths = scan_image_dir_logic(input_dir)
+        hashes = hash_images_logic(paths, self.config, self.workers)
+        manifest, pending = plan_rebuild_logic(load_manifest_logic(output_dir), hashes)
+        manifest.update(shard_size=self.shard_size, config=self.config)
+        self.logger.info(
+            f"Sharding {input_dir}: {len(pending)} new or changed of {len(paths)}"
+        )
+
+        index: int = max((s["index"] for s in manifest["shards"]), default=-1) + 1
+        buffer = np.empty((0,), dtype=np.float32)
+        fill: int = 0
+        staged: List[JsonDict] = []
+
+        seeds = [file_seed_logic(self.seed, hashes[path]) for path in pending]
+        for path, samples, errors in shard_samples_engine(
+            pending, self.preprocessor, self.workers, seeds
+        ):
+            for message in errors:
+                self.logger.error(message)
+
+            if buffer.size == 0 and samples.size > 0:
+                buffer = np.empty(
+                    (self.shard_size,) + samples.shape[1:], dtype=np.float32
+                )
+            if samples.size == 0 or samples.shape[1:] != buffer.shape[1:]:
+                self.logger.warning(f"No usable samples from {path}")
+                manifest["failed"][path] = hashes[path]
+                continue
+
+            if fill and fill + len(samples) > self.shard_size:
+                commit_shard_logic(manifest, buffer, fill, staged, output_dir, index)
+                index, fill, staged = index + 1, 0, []
+            if len(samples) > len(buffer):
+                buffer = np.empty(samples.shape, dtype=np.float32)
+
+            buffer[fill : fill + len(samples)] = samples
+            staged += [
+                {"source": path, "hash": hashes[path], "shard": index, "offset": offset}
+                for offset in range(fill, fill + len(samples))
+            ]
+            fill += len(samples)
+            if fill >= self.shard_size:
+                commit_shard_logic(manifest, buffer, fill, staged, output_dir, index)
+                index, fill, staged = index + 1, 0, []
+
+        if fill:
+            commit_shard_logic(manifest, buffer, fill, staged, output_dir, index)
+        pruned = prune_shards_logic(manifest, output_dir)
+        save_manifest_logic(manifest, output_dir)
+
+        stats: MetricsDict = {
+            "files": len(paths),
+            "skipped": len(paths) - len(pending),
+            "processed": len(pending),
+            "failed": len(manifest["failed"]),
+            "samples": len(manifest["samples"]),
+            "shards": len(manifest["shards"]),
+            "pruned": pruned,
+        }
+        self.logger.info(f"Sharding finished: {stats}")
+        return stats
@@ -5,6 +5,7 @@ import pytest
 
 from common_utils import log_system_info, setup_logging
 from core import BrainEngine
+from data import ShardBuilder
 
 
 def main_logic():
@@ -16,7 +17,10 @@ def main_logic():
     engine = BrainEngine()
 
     if len(sys.argv) < 2:
-        print("Use: python main.py [test|learn|guess <path>]")
+        print(
+            "Use: python main.py "
+            "[test|learn|guess <path>|build <input_dir> <output_dir> [workers]]"
+        )
         return
 
     mode = sys.argv[1].lower()
@@ -31,6 +35,11 @@ def main_logic():
         path = sys.argv[2]
         engine.recognize_digit(path)
 
+    elif mode == "build":
+        workers = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+        builder = ShardBuilder(preprocessor=engine.preprocessor, workers=workers)
+        builder.build(input_dir=sys.argv[2], output_dir=sys.argv[3])
+
 
 if __name__ == "__main__":
     main_logic()
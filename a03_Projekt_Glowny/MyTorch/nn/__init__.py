@@ -10,30 +10,50 @@ from .layers import (
     ReLU,
     Sigmoid,
     Softmax,
+    col2im_logic,
     conv2d_bwd,
     conv2d_fwd,
+    conv_output_size,
     dropout_bwd,
     dropout_fwd,
     flatten_bwd,
     flatten_fwd,
+    im2col_logic,
+    kernel_checksum_logic,
     linear_bwd,
     linear_fwd,
     relu_bwd,
     relu_fwd,
+    select_conv_engine_logic,
     sigmoid_bwd,
     sigmoid_fwd,
     softmax_bwd,
     softmax_fwd,
+    winograd_conv2d_fwd,
+    winograd_kernels_logic,
+    winograd_tiles_logic,
 )
 from .model import (
     NeuralNetwork,
     Sequential,
+    activation_lifetimes_logic,
     add_layer,
+    allocate_activation_buffers_logic,
+    build_layer_logic,
     chain_bwd,
     chain_fwd,
+    layer_manifest_logic,
+    layer_traits_logic,
     load,
+    map_npz_members_logic,
+    param_fields_logic,
+    plan_memory_logic,
     predict,
+    release_caches_logic,
     save,
+    set_training_logic,
+    trace_activations_logic,
+    write_npz_member_logic,
 )
 
 __all__ = [
@@ -52,24 +72,44 @@ __all__ = [
     "Sequential",
     "Sigmoid",
     "Softmax",
+    "activation_lifetimes_logic",
     "add_layer",
+    "allocate_activation_buffers_logic",
+    "build_layer_logic",
     "chain_bwd",
     "chain_fwd",
+    "col2im_logic",
     "conv2d_bwd",
     "conv2d_fwd",
+    "conv_output_size",
     "dropout_bwd",
     "dropout_fwd",
     "flatten_bwd",
     "flatten_fwd",
+    "im2col_logic",
+    "kernel_checksum_logic",
+    "layer_manifest_logic",
+    "layer_traits_logic",
     "linear_bwd",
     "linear_fwd",
     "load",
+    "map_npz_members_logic",
+    "param_fields_logic",
+    "plan_memory_logic",
     "predict",
+    "release_caches_logic",
     "relu_bwd",
     "relu_fwd",
     "save",
+    "select_conv_engine_logic",
+    "set_training_logic",
     "sigmoid_bwd",
     "sigmoid_fwd",
     "softmax_bwd",
     "softmax_fwd",
+    "trace_activations_logic",
+    "winograd_conv2d_fwd",
+    "winograd_kernels_logic",
+    "winograd_tiles_logic",
+    "write_npz_member_logic",
 ]
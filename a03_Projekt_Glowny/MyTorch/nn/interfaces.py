@@ -1,18 +1,22 @@
 import logging
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import TYPE_CHECKING, ContextManager, Protocol
 
 import numpy as np
 
 from MyTorch import (
     T4D,
     FilePath,
-    Sequential,
 )
 
+if TYPE_CHECKING:
+    from .model import Sequential
+
 
 class ModelProtocol(Protocol):
+    def inference(self) -> ContextManager[None]: ...
+
     def predict(self, x: T4D) -> T4D: ...
 
     def save(self, path: FilePath) -> None: ...
@@ -30,7 +34,7 @@ class OrchestratorABC(ABC):
 
 @dataclass(frozen=True, slots=True)
 class ModelABC(ABC):
-    model: Sequential = field(default_factory=Sequential, repr=False)
+    model: "Sequential" = field(repr=False)
     logger: logging.Logger = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -11,8 +11,16 @@ from .activation import (
 )
 from .conv_layer import (
     Conv2D,
+    col2im_logic,
     conv2d_bwd,
     conv2d_fwd,
+    conv_output_size,
+    im2col_logic,
+    kernel_checksum_logic,
+    select_conv_engine_logic,
+    winograd_conv2d_fwd,
+    winograd_kernels_logic,
+    winograd_tiles_logic,
 )
 from .dropout import (
     Dropout,
@@ -42,18 +50,26 @@ __all__ = [
     "ReLU",
     "Sigmoid",
     "Softmax",
+    "col2im_logic",
     "conv2d_bwd",
     "conv2d_fwd",
+    "conv_output_size",
     "dropout_bwd",
     "dropout_fwd",
     "flatten_bwd",
     "flatten_fwd",
+    "im2col_logic",
+    "kernel_checksum_logic",
     "linear_bwd",
     "linear_fwd",
     "relu_bwd",
     "relu_fwd",
+    "select_conv_engine_logic",
     "sigmoid_bwd",
     "sigmoid_fwd",
     "softmax_bwd",
     "softmax_fwd",
+    "winograd_conv2d_fwd",
+    "winograd_kernels_logic",
+    "winograd_tiles_logic",
 ]
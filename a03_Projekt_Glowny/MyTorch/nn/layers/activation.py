@@ -1,23 +1,28 @@
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
-from interfaces import ActivationABC
 
 from MyTorch import T
 
+from .interfaces import ActivationABC
 
-def relu_fwd(x: T) -> T:
-    return np.maximum(x, 0)
+
+def relu_fwd(x: T, out: Optional[T] = None) -> T:
+    return np.maximum(x, 0, out=out)
 
 
 def relu_bwd(grad: T, out: T) -> T:
     return grad * (out > 0)
 
 
-def sigmoid_fwd(x: T) -> T:
+def sigmoid_fwd(x: T, out: Optional[T] = None) -> T:
     one = np.array(1.0, dtype=x.dtype)
-    x_clipped = np.clip(x, -500.0, 500.0)
-    return one / (one + np.exp(-x_clipped))
+    result = np.clip(x, -500.0, 500.0, out=out)
+    np.negative(result, out=result)
+    np.exp(result, out=result)
+    result += one
+    return np.divide(one, result, out=result)
 
 
 def sigmoid_bwd(grad: T, last_output: T) -> T:
@@ -34,8 +39,8 @@ def softmax_bwd(grad: T, last_output: T) -> T:
 
 @dataclass(frozen=True, slots=True)
 class ReLU(ActivationABC):
-    def forward(self, x: T) -> T:
-        out = relu_fwd(x)
+    def forward(self, x: T, out: Optional[T] = None) -> T:
+        out = relu_fwd(x, out)
         object.__setattr__(self, "_last_output", out)
         return out
 
@@ -45,8 +50,8 @@ class ReLU(ActivationABC):
 
 @dataclass(frozen=True, slots=True)
 class Sigmoid(ActivationABC):
-    def forward(self, x: T) -> T:
-        out = sigmoid_fwd(x)
+    def forward(self, x: T, out: Optional[T] = None) -> T:
+        out = sigmoid_fwd(x, out)
         object.__setattr__(self, "_last_output", out)
         return out
 
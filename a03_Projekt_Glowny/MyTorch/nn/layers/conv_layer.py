@@ -1,32 +1,166 @@
+import zlib
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import Literal, Optional, Tuple
 
 import numpy as np
-from interfaces import LayerABC
+from numpy.lib.stride_tricks import sliding_window_view
 
-from MyTorch import T4D, T
+from common_utils import RngContext
+from MyTorch import T2D, T4D, Shape, T
 
+from .interfaces import LayerABC
 
-def conv2d_fwd(x: T4D, kernels: T4D, biases: T, stride: int = 1) -> T4D:
-    return np.array([], dtype=float)
+ConvEngine = Literal["im2col", "winograd"]
+
+WINOGRAD_G = np.array(
+    [[1, 0, 0], [0.5, 0.5, 0.5], [0.5, -0.5, 0.5], [0, 0, 1]], dtype=float
+)
+
+
+def conv_output_size(size: int, kernel_size: int, stride: int = 1) -> int:
+    return (size - kernel_size) // stride + 1
+
+
+def im2col_logic(
+    x: T4D, kernel_size: int, stride: int = 1, out: Optional[T2D] = None
+) -> T2D:
+    n, c, h, w = x.shape
+    oh = conv_output_size(h, kernel_size, stride)
+    ow = conv_output_size(w, kernel_size, stride)
+
+    windows = sliding_window_view(x, (kernel_size, kernel_size), axis=(2, 3))
+    windows = windows[:, :, ::stride, ::stride]
+
+    if out is None:
+        out = np.empty((c * kernel_size * kernel_size, n * oh * ow), dtype=x.dtype)
+    view = out.reshape(c, kernel_size, kernel_size, n, oh, ow)
+    np.copyto(view, windows.transpose(1, 4, 5, 0, 2, 3), casting="same_kind")
+    return out
+
+
+def col2im_logic(cols: T2D, x_shape: Shape, kernel_size: int, stride: int = 1) -> T4D:
+    n, c, h, w = x_shape
+    oh = conv_output_size(h, kernel_size, stride)
+    ow = conv_output_size(w, kernel_size, stride)
+
+    blocks = cols.reshape(c, kernel_size, kernel_size, n, oh, ow)
+    result = np.zeros((n, c, h, w), dtype=cols.dtype)
+    for i in range(kernel_size):
+        rows = slice(i, i + stride * oh, stride)
+        for j in range(kernel_size):
+            columns = slice(j, j + stride * ow, stride)
+            result[:, :, rows, columns] += blocks[:, i, j].transpose(1, 0, 2, 3)
+    return result
+
+
+def conv2d_fwd(
+    x: T4D,
+    kernels: T4D,
+    biases: T,
+    stride: int = 1,
+    cols: Optional[T2D] = None,
+    out: Optional[T4D] = None,
+) -> T4D:
+    n, _, h, w = x.shape
+    o, _, k, _ = kernels.shape
+    oh, ow = conv_output_size(h, k, stride), conv_output_size(w, k, stride)
+
+    cols = im2col_logic(x, k, stride, out=cols)
+    result = kernels.reshape(o, -1) @ cols
+    result = result.reshape(o, n, oh, ow).transpose(1, 0, 2, 3)
+    return np.add(result, biases.reshape(1, o, 1, 1), out=out)
 
 
 def conv2d_bwd(
-    grad: T4D, x_cache: T4D, kernels: T4D, stride: int = 1
+    grad: T4D,
+    x_cache: T4D,
+    kernels: T4D,
+    stride: int = 1,
+    cols: Optional[T2D] = None,
 ) -> Tuple[T4D, T4D, T]:
-    d_x: T4D = np.array([], dtype=float)
-    d_kernels: T4D = np.array([], dtype=float)
-    d_biases: T = np.array([], dtype=float)
+    o, _, k, _ = kernels.shape
+    if cols is None:
+        cols = im2col_logic(x_cache, k, stride)
+
+    grad_cols = grad.transpose(1, 0, 2, 3).reshape(o, -1)
+    d_kernels: T4D = (grad_cols @ cols.T).reshape(kernels.shape)
+    d_biases: T = grad.sum(axis=(0, 2, 3))
+    d_x: T4D = col2im_logic(
+        kernels.reshape(o, -1).T @ grad_cols, x_cache.shape, k, stride
+    )
 
     return d_x, d_kernels, d_biases
 
 
+def select_conv_engine_logic(kernel_size: int, stride: int = 1) -> ConvEngine:
+    return "winograd" if kernel_size == 3 and stride == 1 else "im2col"
+
+
+def kernel_checksum_logic(kernels: T4D) -> int:
+    data = np.ascontiguousarray(kernels)
+    return zlib.crc32(memoryview(data).cast("B"))
+
+
+def winograd_kernels_logic(kernels: T4D) -> T4D:
+    return np.einsum("ik,ockl,jl->ijoc", WINOGRAD_G, kernels, WINOGRAD_G, optimize=True)
+
+
+def winograd_tiles_logic(x: T4D, out: Optional[T4D] = None) -> Tuple[T4D, int, int]:
+    n, c, h, w = x.shape
+    th, tw = -(-(h - 2) // 2), -(-(w - 2) // 2)
+    padded = np.zeros((c, n, 2 * th + 2, 2 * tw + 2), dtype=x.dtype)
+    padded[:, :, :h, :w] = x.transpose(1, 0, 2, 3)
+
+    d = [padded[..., j : j + 2 * tw : 2] for j in range(4)]
+    columns = [d[0] - d[2], d[1] + d[2], d[2] - d[1], d[1] - d[3]]
+
+    if out is None:
+        out = np.empty((4, 4, c, n * th * tw), dtype=x.dtype)
+    tiles = out.reshape(4, 4, c, n, th, tw)
+    for j, column in enumerate(columns):
+        r = [column[:, :, i : i + 2 * th : 2] for i in range(4)]
+        np.subtract(r[0], r[2], out=tiles[0, j])
+        np.add(r[1], r[2], out=tiles[1, j])
+        np.subtract(r[2], r[1], out=tiles[2, j])
+        np.subtract(r[1], r[3], out=tiles[3, j])
+    return out, th, tw
+
+
+def winograd_conv2d_fwd(
+    x: T4D,
+    transformed: T4D,
+    biases: T,
+    tiles: Optional[T4D] = None,
+    out: Optional[T4D] = None,
+) -> T4D:
+    n, _, h, w = x.shape
+    o = transformed.shape[2]
+
+    tiles, th, tw = winograd_tiles_logic(
+        x.astype(transformed.dtype, copy=False), out=tiles
+    )
+    m = transformed @ tiles
+    rows = [m[0] + m[1] + m[2], m[1] - m[2] - m[3]]
+
+    result = np.empty((n, o, th, 2, tw, 2), dtype=m.dtype)
+    for i, row in enumerate(rows):
+        top = (row[0] + row[1] + row[2]).reshape(o, n, th, tw)
+        bottom = (row[1] - row[2] - row[3]).reshape(o, n, th, tw)
+        result[:, :, :, i, :, 0] = top.transpose(1, 0, 2, 3)
+        result[:, :, :, i, :, 1] = bottom.transpose(1, 0, 2, 3)
+
+    result = result.reshape(n, o, 2 * th, 2 * tw)[:, :, : h - 2, : w - 2]
+    return np.add(result, biases.reshape(1, o, 1, 1), out=out)
+
+
 @dataclass(frozen=True, slots=True)
 class Conv2D(LayerABC):
     in_channels: int
     out_channels: int
     kernel_size: int
     stride: int = 1
+    engine: Literal["auto", "im2col", "winograd"] = "auto"
+    rng: RngContext = field(default_factory=RngContext)
 
     kernels: T4D = field(
         init=False, repr=False, default_factory=lambda: np.array([], dtype=float)
@@ -34,26 +168,99 @@ class Conv2D(LayerABC):
     biases: T = field(
         init=False, repr=False, default_factory=lambda: np.array([], dtype=float)
     )
+    grad_kernels: T4D = field(
+        init=False, repr=False, default_factory=lambda: np.array([], dtype=float)
+    )
+    grad_biases: T = field(
+        init=False, repr=False, default_factory=lambda: np.array([], dtype=float)
+    )
     _input_cache: T4D = field(
         init=False, repr=False, default_factory=lambda: np.array([], dtype=float)
     )
+    _col_buffer: Tuple[Shape, T2D] = field(
+        init=False, repr=False, default_factory=tuple
+    )
+    _tile_buffer: Tuple[Shape, T4D] = field(
+        init=False, repr=False, default_factory=tuple
+    )
+    _winograd_cache: Tuple[int, T4D] = field(
+        init=False, repr=False, default_factory=tuple
+    )
+    active_engine: ConvEngine = field(init=False, default="im2col")
 
     def __post_init__(self) -> None:
         super().__post_init__()
 
         if self.kernels.size == 0:
-            kernels_val = np.random.randn(
-                self.out_channels, self.in_channels, self.kernel_size, self.kernel_size
-            ).astype(float)
+            kernels_val = self.rng.generator.standard_normal(
+                (
+                    self.out_channels,
+                    self.in_channels,
+                    self.kernel_size,
+                    self.kernel_size,
+                )
+            )
             object.__setattr__(self, "kernels", kernels_val)
 
         if self.biases.size == 0:
             biases_val = np.zeros(self.out_channels, dtype=float)
             object.__setattr__(self, "biases", biases_val)
 
-    def forward(self, x: T4D) -> T4D:
+        supported = select_conv_engine_logic(self.kernel_size, self.stride)
+        engine = supported if self.engine == "auto" else self.engine
+        if engine == "winograd" and supported != "winograd":
+            raise ValueError(
+                f"Winograd requires kernel_size=3 and stride=1, got "
+                f"kernel_size={self.kernel_size}, stride={self.stride}"
+            )
+        object.__setattr__(self, "active_engine", engine)
+        self.logger.info(f"Using {engine} engine")
+
+    def col_buffer(self, shape: Shape) -> T2D:
+        if not self._col_buffer or self._col_buffer[0] != shape:
+            n, c, h, w = shape
+            oh = conv_output_size(h, self.kernel_size, self.stride)
+            ow = conv_output_size(w, self.kernel_size, self.stride)
+            rows: int = c * self.kernel_size * self.kernel_size
+            buffer = np.empty((rows, n * oh * ow), dtype=self.kernels.dtype)
+            object.__setattr__(self, "_col_buffer", (shape, buffer))
+            self.logger.debug(f"Allocated column buffer {buffer.shape} for {shape}")
+        return self._col_buffer[1]
+
+    def tile_buffer(self, shape: Shape) -> T4D:
+        if not self._tile_buffer or self._tile_buffer[0] != shape:
+            n, c, h, w = shape
+            tiles: int = n * -(-(h - 2) // 2) * -(-(w - 2) // 2)
+            buffer = np.empty((4, 4, c, tiles), dtype=self.kernels.dtype)
+            object.__setattr__(self, "_tile_buffer", (shape, buffer))
+            self.logger.debug(f"Allocated tile buffer {buffer.shape} for {shape}")
+        return self._tile_buffer[1]
+
+    def winograd_kernels(self) -> T4D:
+        checksum = kernel_checksum_logic(self.kernels)
+        if not self._winograd_cache or self._winograd_cache[0] != checksum:
+            transformed = winograd_kernels_logic(self.kernels)
+            object.__setattr__(self, "_winograd_cache", (checksum, transformed))
+            self.logger.debug(f"Transformed kernels {self.kernels.shape}")
+        return self._winograd_cache[1]
+
+    def forward(self, x: T4D, out: Optional[T4D] = None) -> T4D:
         object.__setattr__(self, "_input_cache", x)
-        return conv2d_fwd(x, self.kernels, self.biases, self.stride)
+        if self.active_engine == "winograd":
+            tiles = self.tile_buffer(x.shape)
+            return winograd_conv2d_fwd(
+                x, self.winograd_kernels(), self.biases, tiles, out
+            )
+
+        cols = self.col_buffer(x.shape)
+        return conv2d_fwd(x, self.kernels, self.biases, self.stride, cols, out)
 
     def backward(self, grad: T4D) -> T4D:
-        return conv2d_bwd(grad, self._input_cache, self.kernels, self.stride)[0]
+        x = self._input_cache
+        cols = self.col_buffer(x.shape)
+        if self.active_engine == "winograd":
+            im2col_logic(x, self.kernel_size, self.stride, out=cols)
+        d_x, d_kernels, d_biases = conv2d_bwd(grad, x, self.kernels, self.stride, cols)
+        object.__setattr__(self, "grad_kernels", d_kernels)
+        object.__setattr__(self, "grad_biases", d_biases)
+        return d_x
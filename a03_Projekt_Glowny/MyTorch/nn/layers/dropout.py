@@ -1,20 +1,34 @@
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
-from interfaces import LayerABC
 
+from common_utils import RngContext, resolve_rng
 from MyTorch import M4D, T4D
 
+from .interfaces import LayerABC
 
-def dropout_fwd(x: T4D, probability: float, training: bool = True) -> Tuple[T4D, M4D]:
+
+def dropout_fwd(
+    x: T4D,
+    probability: float,
+    training: bool = True,
+    rng: Optional[RngContext] = None,
+    out: Optional[T4D] = None,
+) -> Tuple[T4D, M4D]:
     if not training or probability <= 0.0:
-        return x, np.ones(x.shape, dtype=bool)
+        if out is not None and out is not x:
+            np.copyto(out, x)
+        return x if out is None else out, np.array([], dtype=bool)
 
-    mask = np.random.random(x.shape) > probability
+    mask = resolve_rng(rng).random(x.shape, dtype=np.float32) > probability
 
     scale = 1.0 / (1.0 - probability)
-    result = (x * mask * scale).astype(np.float32)
+    if out is None:
+        result = (x * mask * scale).astype(np.float32)
+    else:
+        result = np.multiply(x, mask, out=out)
+        result *= scale
 
     return result, mask
 
@@ -27,6 +41,7 @@ def dropout_bwd(grad: T4D, mask: M4D, probability: float) -> T4D:
 class Dropout(LayerABC):
     probability: float = 0.5
     training: bool = True
+    rng: RngContext = field(default_factory=RngContext)
 
     _mask: M4D = field(
         init=False, repr=False, default_factory=lambda: np.array([], dtype=bool)
@@ -37,8 +52,8 @@ class Dropout(LayerABC):
         if not (0 <= self.probability < 1):
             raise ValueError(f"Probability {self.probability} must be in range [0, 1)")
 
-    def forward(self, x: T4D) -> T4D:
-        result, mask = dropout_fwd(x, self.probability, self.training)
+    def forward(self, x: T4D, out: Optional[T4D] = None) -> T4D:
+        result, mask = dropout_fwd(x, self.probability, self.training, self.rng, out)
         object.__setattr__(self, "_mask", mask)
         return result
 
@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
 
 import numpy as np
-from interfaces import LayerABC
 
 from MyTorch import T2D, T4D, Shape
 
+from .interfaces import LayerABC
+
 
 def flatten_fwd(x: T4D) -> tuple[T2D, Shape]:
     original_shape = x.shape
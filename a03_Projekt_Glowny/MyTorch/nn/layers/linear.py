@@ -1,14 +1,19 @@
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
-from interfaces import LayerABC
 
 from MyTorch import T2D
 
+from .interfaces import LayerABC
 
-def linear_fwd(x: T2D, weights: T2D, bias: T2D) -> T2D:
-    return (x @ weights + bias).astype(np.float32)
+
+def linear_fwd(x: T2D, weights: T2D, bias: T2D, out: Optional[T2D] = None) -> T2D:
+    if out is None:
+        return (x @ weights + bias).astype(np.float32)
+    np.matmul(x, weights, out=out)
+    out += bias
+    return out
 
 
 def linear_bwd(grad: T2D, x_cache: T2D, weights: T2D) -> Tuple[T2D, T2D, T2D]:
@@ -42,9 +47,9 @@ class Linear(LayerABC):
             b_val = np.zeros((1, self.out_features), dtype=np.float32)
             object.__setattr__(self, "bias", b_val)
 
-    def forward(self, x: T2D) -> T2D:
+    def forward(self, x: T2D, out: Optional[T2D] = None) -> T2D:
         object.__setattr__(self, "_input_cache", x)
-        return linear_fwd(x, self.weights, self.bias)
+        return linear_fwd(x, self.weights, self.bias, out)
 
     def backward(self, grad: T2D) -> T2D:
         grad_input, grad_w, grad_b = linear_bwd(grad, self._input_cache, self.weights)
@@ -1,49 +1,362 @@
-from dataclasses import dataclass, field
-from typing import List
+import json
+import os
+import struct
+import uuid
+import zipfile
+from contextlib import contextmanager
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import numpy as np
-from interfaces import ModelABC, OrchestratorABC
 
-from MyTorch import T4D, FilePath
-from nn import LayerProtocol, Sequential
+from MyTorch import T4D, FilePath, JsonDict, Shape, T
 
+from .interfaces import ModelABC, OrchestratorABC
+from .layers import (
+    Conv2D,
+    Dropout,
+    Flatten,
+    LayerProtocol,
+    Linear,
+    ReLU,
+    Sigmoid,
+    Softmax,
+)
 
-def chain_fwd(layers: List[LayerProtocol], x: T4D) -> T4D:
-    return np.array([], dtype=np.float32).reshape(0, 0, 0, 0)
+MemoryPlan = Tuple[List[int], List[bool]]
+ActivationSpec = Tuple[Shape, np.dtype]
+
+OUT_LAYERS = (Linear, Conv2D, ReLU, Sigmoid, Dropout)
+INPLACE_LAYERS = (ReLU, Dropout)
+CACHE_FIELDS = ("_input_cache", "_last_output", "_mask")
+
+LAYER_TYPES = {
+    cls.__name__: cls
+    for cls in (Conv2D, Dropout, Flatten, Linear, ReLU, Sigmoid, Softmax)
+}
+MANIFEST_MEMBER = "manifest.json"
+PARAM_MEMBER = "{index:04d}.{name}"
+MEMBER_ALIGN = 64
+ALIGN_EXTRA_ID = 0x4D54
+
+
+def layer_traits_logic(layer: LayerProtocol) -> Tuple[bool, bool, bool]:
+    known = isinstance(layer, OUT_LAYERS + (Flatten, Softmax))
+    saves_input = hasattr(layer, "_input_cache") or not known
+    saves_output = hasattr(layer, "_last_output") or not known
+    return saves_input, saves_output, isinstance(layer, OUT_LAYERS)
+
+
+def activation_lifetimes_logic(
+    layers: List[LayerProtocol], training: bool = True
+) -> Tuple[List[int], List[bool], Dict[int, Tuple[int, int]]]:
+    last_step: int = 2 * len(layers) - 1
+    groups: List[int] = []
+    inplace: List[bool] = []
+    spans: Dict[int, List[int]] = {-1: [-1, 0]}
+    retained: Set[int] = set()
+
+    for i, layer in enumerate(layers):
+        saves_input, saves_output, writes_out = layer_traits_logic(layer)
+        src: int = groups[-1] if groups else -1
+        spans[src][1] = max(spans[src][1], i)
+        if training and saves_input:
+            spans[src][1] = max(spans[src][1], last_step - i)
+            retained.add(src)
+
+        in_place = isinstance(layer, INPLACE_LAYERS) and src not in retained | {-1}
+        group: int = i if writes_out and not in_place else src
+        spans.setdefault(group, [i, i])
+        if training and saves_output:
+            spans[group][1] = max(spans[group][1], last_step - i)
+            retained.add(group)
+
+        groups.append(group)
+        inplace.append(in_place)
+    return groups, inplace, {g: (start, end) for g, (start, end) in spans.items()}
+
+
+def plan_memory_logic(layers: List[LayerProtocol], training: bool = True) -> MemoryPlan:
+    groups, inplace, spans = activation_lifetimes_logic(layers, training)
+    output: int = groups[-1] if groups else -1
+    slots: List[int] = [-1] * len(layers)
+    slot_ends: List[int] = []
+
+    for i, group in enumerate(groups):
+        if group != i or group == output:
+            continue
+        start, end = spans[group]
+        free = [slot for slot, last in enumerate(slot_ends) if last < start]
+        slots[i] = free[0] if free else len(slot_ends)
+        if free:
+            slot_ends[slots[i]] = end
+        else:
+            slot_ends.append(end)
+    return slots, inplace
+
+
+def trace_activations_logic(
+    layers: List[LayerProtocol], x: T4D, keep_caches: bool = True
+) -> Tuple[T4D, List[ActivationSpec]]:
+    specs: List[ActivationSpec] = []
+    for layer in layers:
+        x = layer.forward(x)
+        specs.append((x.shape, x.dtype))
+        if not keep_caches:
+            release_caches_logic(layer)
+    return x, specs
+
+
+def allocate_activation_buffers_logic(
+    plan: MemoryPlan, specs: List[ActivationSpec]
+) -> List[Optional[T]]:
+    slots, _ = plan
+    sizes: List[int] = [0] * (max(slots, default=-1) + 1)
+    for slot, (shape, dtype) in zip(slots, specs, strict=True):
+        if slot >= 0:
+            sizes[slot] = max(sizes[slot], int(np.prod(shape)) * dtype.itemsize)
+
+    pools = [np.empty(size, dtype=np.uint8) for size in sizes]
+    buffers: List[Optional[T]] = []
+    for slot, (shape, dtype) in zip(slots, specs, strict=True):
+        if slot < 0:
+            buffers.append(None)
+            continue
+        nbytes: int = int(np.prod(shape)) * dtype.itemsize
+        buffers.append(pools[slot][:nbytes].view(dtype).reshape(shape))
+    return buffers
+
+
+def release_caches_logic(layer: LayerProtocol) -> None:
+    for name in CACHE_FIELDS:
+        if hasattr(layer, name):
+            empty = np.array([], dtype=getattr(layer, name).dtype)
+            object.__setattr__(layer, name, empty)
+
+
+def chain_fwd(
+    layers: List[LayerProtocol],
+    x: T4D,
+    plan: Optional[MemoryPlan] = None,
+    buffers: Optional[List[Optional[T]]] = None,
+    keep_caches: bool = True,
+) -> T4D:
+    inplace = plan[1] if plan is not None else [False] * len(layers)
+    buffers = buffers if buffers is not None else [None] * len(layers)
+
+    for layer, in_place, out in zip(layers, inplace, buffers, strict=True):
+        if in_place:
+            x = layer.forward(x, out=x)
+        elif out is not None:
+            x = layer.forward(x, out=out)
+        else:
+            x = layer.forward(x)
+        if not keep_caches:
+            release_caches_logic(layer)
+    return x
 
 
 def chain_bwd(layers: List[LayerProtocol], grad: T4D) -> T4D:
-    return np.array([], dtype=np.float32).reshape(0, 0, 0, 0)
+    for layer in reversed(layers):
+        grad = layer.backward(grad)
+        release_caches_logic(layer)
+    return grad
 
 
 def add_layer(layers: List[LayerProtocol], layer: LayerProtocol) -> None:
-    pass
+    layers.append(layer)
+
 
+def set_training_logic(
+    model: "Sequential", states: List[Optional[bool]]
+) -> List[Optional[bool]]:
+    units = [model, *model.layers]
+    previous = [getattr(unit, "training", None) for unit in units]
+    for unit, state in zip(units, states, strict=True):
+        if state is not None and hasattr(unit, "training"):
+            object.__setattr__(unit, "training", state)
+    return previous
 
-def predict(model: Sequential, x: T4D) -> T4D:
-    return np.array([], dtype=np.float32).reshape(0, 0, 0, 0)
 
+def predict(
+    model: "Sequential", x: T4D, chunk_size: int = 256, out: Optional[T] = None
+) -> T:
+    n: int = len(x)
+    if n == 0:
+        return np.empty((0,), dtype=np.float32) if out is None else out
 
-def save(model: Sequential, path: FilePath) -> None:
-    """save zrobić w .npz"""
+    for start in range(0, n, chunk_size):
+        chunk = model.forward(x[start : start + chunk_size])
+        if out is None:
+            out = np.empty((n,) + chunk.shape[1:], dtype=chunk.dtype)
+        out[start : start + len(chunk)] = chunk
+    return out
 
 
-def load(model: Sequential, path: FilePath) -> None:
-    """load zrobić w .npz"""
+def param_fields_logic(layer: LayerProtocol) -> List[str]:
+    return [
+        f.name
+        for f in fields(layer)
+        if not f.init
+        and not f.name.startswith(("_", "grad_"))
+        and isinstance(getattr(layer, f.name), np.ndarray)
+    ]
+
+
+def layer_manifest_logic(layer: LayerProtocol) -> JsonDict:
+    name = type(layer).__name__
+    if LAYER_TYPES.get(name) is not type(layer) or not is_dataclass(layer):
+        raise ValueError(f"Cannot serialise layer of type {name}")
+
+    args = {
+        f.name: getattr(layer, f.name)
+        for f in fields(layer)
+        if f.init and isinstance(getattr(layer, f.name), (bool, int, float, str))
+    }
+    return {"type": name, "args": args, "params": param_fields_logic(layer)}
+
+
+def write_npz_member_logic(archive: zipfile.ZipFile, name: str, array: T) -> None:
+    array = np.ascontiguousarray(array)
+    info = zipfile.ZipInfo(f"{name}.npy", date_time=(1980, 1, 1, 0, 0, 0))
+    big: bool = array.nbytes + 4096 > zipfile.ZIP64_LIMIT
+
+    start: int = archive.fp.tell() + 30 + len(info.filename.encode()) + 4
+    pad: int = -(start + (20 if big else 0)) % MEMBER_ALIGN
+    info.extra = struct.pack("<HH", ALIGN_EXTRA_ID, pad) + bytes(pad)
+
+    with archive.open(info, "w", force_zip64=big) as member:
+        np.lib.format.write_array(member, array, allow_pickle=False)
+
+
+def map_npz_members_logic(path: FilePath) -> Tuple[JsonDict, Dict[str, T]]:
+    arrays: Dict[str, T] = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        manifest = json.loads(archive.read(MANIFEST_MEMBER))
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Compressed member {info.filename} cannot be mapped")
+
+            file.seek(info.header_offset + 26)
+            name_len, extra_len = struct.unpack("<HH", file.read(4))
+            file.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(file)
+            read_header = (
+                np.lib.format.read_array_header_1_0
+                if version == (1, 0)
+                else np.lib.format.read_array_header_2_0
+            )
+            shape, fortran, dtype = read_header(file)
+
+            key = info.filename[: -len(".npy")]
+            if int(np.prod(shape)) == 0:
+                arrays[key] = np.empty(shape, dtype=dtype)
+                continue
+            arrays[key] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="c",
+                offset=file.tell(),
+                shape=shape,
+                order="F" if fortran else "C",
+            )
+    return manifest, arrays
+
+
+def build_layer_logic(spec: JsonDict, params: Dict[str, T]) -> LayerProtocol:
+    cls = LAYER_TYPES.get(spec["type"])
+    if cls is None:
+        raise ValueError(f"Unknown layer type: {spec['type']}")
+
+    layer = cls.__new__(cls)
+    for f in fields(cls):
+        if f.name in spec["args"]:
+            value = spec["args"][f.name]
+        elif f.name in params:
+            value = params[f.name]
+        elif f.default is not MISSING:
+            value = f.default
+        elif f.default_factory is not MISSING:
+            value = f.default_factory()
+        else:
+            continue
+        object.__setattr__(layer, f.name, value)
+    layer.__post_init__()
+    return layer
+
+
+def save(model: "Sequential", path: FilePath) -> None:
+    manifest: JsonDict = {
+        "format": 1,
+        "layers": [layer_manifest_logic(layer) for layer in model.layers],
+    }
+
+    root = os.path.dirname(path) or "."
+    os.makedirs(root, exist_ok=True)
+    tmp_path = os.path.join(root, f".tmp-{uuid.uuid4().hex}.npz")
+    try:
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED) as archive:
+            archive.writestr(MANIFEST_MEMBER, json.dumps(manifest))
+            for index, (layer, spec) in enumerate(
+                zip(model.layers, manifest["layers"], strict=True)
+            ):
+                for name in spec["params"]:
+                    member = PARAM_MEMBER.format(index=index, name=name)
+                    write_npz_member_logic(archive, member, getattr(layer, name))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load(model: "Sequential", path: FilePath) -> None:
+    manifest, arrays = map_npz_members_logic(path)
+    layers: List[LayerProtocol] = []
+    for index, spec in enumerate(manifest["layers"]):
+        params = {
+            name: arrays[PARAM_MEMBER.format(index=index, name=name)]
+            for name in spec["params"]
+        }
+        layers.append(build_layer_logic(spec, params))
+
+    model.layers.clear()
+    for layer in layers:
+        model.add(layer)
 
 
 @dataclass(frozen=True, slots=True)
 class Sequential(OrchestratorABC):
     layers: List[LayerProtocol] = field(default_factory=list, repr=False)
+    training: bool = True
+    _plans: Dict[Tuple[Shape, bool], Tuple[MemoryPlan, List[Optional[T]]]] = field(
+        init=False, repr=False, default_factory=dict
+    )
 
     def __post_init__(self) -> None:
         super().__post_init__()
 
     def add(self, layer: LayerProtocol) -> None:
         add_layer(self.layers, layer)
+        self._plans.clear()
 
     def forward(self, x: T4D) -> T4D:
-        return chain_fwd(self.layers, x)
+        key = (x.shape, self.training)
+        if key in self._plans:
+            plan, buffers = self._plans[key]
+            result = chain_fwd(self.layers, x, plan, buffers, self.training)
+        else:
+            result, specs = trace_activations_logic(self.layers, x, self.training)
+            plan = plan_memory_logic(self.layers, self.training)
+            buffers = allocate_activation_buffers_logic(plan, specs)
+            self._plans[key] = (plan, buffers)
+
+            self.logger.debug(
+                f"Planned {len(specs)} activations for {x.shape} into "
+                f"{max(plan[0], default=-1) + 1} buffers, in-place: {sum(plan[1])}"
+            )
+        return result
 
     def backward(self, grad: T4D) -> T4D:
         return chain_bwd(self.layers, grad)
@@ -52,12 +365,24 @@ class Sequential(OrchestratorABC):
 @dataclass(frozen=True, slots=True)
 class NeuralNetwork(ModelABC):
     model: Sequential = field(default_factory=Sequential)
+    chunk_size: int = 256
 
     def __post_init__(self) -> None:
         super().__post_init__()
 
-    def predict(self, x: T4D) -> T4D:
-        return predict(self.model, x)
+    @contextmanager
+    def inference(self) -> Iterator[None]:
+        states = [False] * (len(self.model.layers) + 1)
+        previous = set_training_logic(self.model, states)
+        try:
+            yield
+        finally:
+            set_training_logic(self.model, previous)
+
+    def predict(self, x: T4D, out: Optional[T] = None) -> T:
+        with self.inference():
+            self.logger.debug(f"Predicting {len(x)} samples by {self.chunk_size}")
+            return predict(self.model, x, self.chunk_size, out)
 
     def save(self, path: FilePath) -> None:
         self.logger.info(f"Saving model to {path}")
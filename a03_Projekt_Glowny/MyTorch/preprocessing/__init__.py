@@ -5,21 +5,29 @@ from .augmentation import (
     NoiseAugmentation,
     RandomUniformProvider,
     _create_supplement_all_sides,
-    _get_augmentation_groups,
     _get_trace_report,
-    _pick_random_pipeline,
-    augment_engine,
+    batch_augment_engine,
     dilate,
     erode,
     gaussian_noise,
+    gaussian_noise_batch,
+    geometry_batch_operations,
     get_boundaries,
     get_uniform_value,
+    get_uniform_values,
     horizontal_flip,
+    morphology_batch,
+    morphology_batch_operations,
     morphology_filter,
+    noise_batch_operations,
+    random_shift_batch,
     random_shift_engine,
     rotate_90,
+    rotate_90_batch,
     rotate_small_angle,
+    rotate_small_angle_batch,
     salt_and_pepper,
+    salt_and_pepper_batch,
     sliding_window_engine,
     vertical_flip,
 )
@@ -32,12 +40,17 @@ from .convolution import (
     ConvolutionActions,
     apply_filters,
     convolution_2d,
+    convolve_stack,
+    next_fast_len,
+    select_conv_backend,
+    separable_factors,
 )
 from .decorators import (
     apply_to_methods,
     auto_fill_color,
     calculate_block_size,
     calculate_fill_color,
+    calculate_fill_colors,
     calculate_rotation_params,
     get_angle_range,
     get_number_repeats,
@@ -45,6 +58,7 @@ from .decorators import (
     parameter_complement,
     prepare_angle,
     prepare_values,
+    resolve_arg_layout,
     with_dimensions,
 )
 from .geometry import (
@@ -52,26 +66,36 @@ from .geometry import (
     _downscale_vectorized,
     _upscale_bilinear,
     pad,
+    pad_spatial,
     prepare_standard_geometry_logic,
     resize,
+    resize_operators,
 )
 from .grayscale import GrayScaleProcessing, convert_color_space
 from .io_image import ImageHandler, open_image, save_image
+from .morphology import running_extremum, separable_morphology
 from .normalization import (
     Normalization,
     normalize,
     z_score_normalization,
 )
 from .pipeline import (
+    ExecutionPlan,
     ImageDataPreprocessing,
     TransformPipeline,
     apply_pipeline_logic,
+    grayscale_into,
     preprocess_logic,
+    preprocess_stack_logic,
+    resize_into,
+    run_plan_logic,
+    z_score_inplace,
 )
 from .pooling import Pooling, max_pool_logic
 from .protocols import (
     ConvolutionProtocol,
     DataAugmentationProtocol,
+    ExecutionPlanProtocol,
     GeometryAugmentationProtocol,
     GrayScaleProtocol,
     ImageConverterProtocol,
@@ -85,18 +109,26 @@ from .protocols import (
     PoolingProtocol,
     ThresholdingProtocol,
     TransformPipelineProtocol,
+    WarpEngineProtocol,
 )
 from .thresholding import (
     Thresholding,
+    adaptive_threshold_integral_logic,
     adaptive_threshold_logic,
+    box_sum,
     generate_gaussian_kernel,
+    integral_image,
+    running_sum,
 )
+from .warp import WarpEngine, get_base_grid, rotation_source_coords, warp_rotate
 
 __all__ = [
     "ConvolutionActions",
     "ConvolutionProtocol",
     "DataAugmentation",
     "DataAugmentationProtocol",
+    "ExecutionPlan",
+    "ExecutionPlanProtocol",
     "GeometryAugmentation",
     "GeometryAugmentationProtocol",
     "GrayScaleProcessing",
@@ -123,53 +155,85 @@ __all__ = [
     "ThresholdingProtocol",
     "TransformPipeline",
     "TransformPipelineProtocol",
+    "WarpEngine",
+    "WarpEngineProtocol",
     "_create_supplement_all_sides",
     "_downscale_vectorized",
-    "_get_augmentation_groups",
     "_get_trace_report",
-    "_pick_random_pipeline",
     "_upscale_bilinear",
+    "adaptive_threshold_integral_logic",
     "adaptive_threshold_logic",
     "apply_filters",
     "apply_pipeline_logic",
     "apply_to_methods",
-    "augment_engine",
     "auto_fill_color",
+    "batch_augment_engine",
+    "box_sum",
     "calculate_block_size",
     "calculate_fill_color",
+    "calculate_fill_colors",
     "calculate_rotation_params",
     "convert_color_space",
     "convert_image_to_matrix",
     "convolution_2d",
+    "convolve_stack",
     "dilate",
     "erode",
     "gaussian_noise",
+    "gaussian_noise_batch",
     "generate_gaussian_kernel",
+    "geometry_batch_operations",
     "get_angle_range",
+    "get_base_grid",
     "get_boundaries",
     "get_number_repeats",
     "get_uniform_value",
+    "get_uniform_values",
+    "grayscale_into",
     "horizontal_flip",
+    "integral_image",
     "kernel_data_processing",
     "max_pool_logic",
+    "morphology_batch",
+    "morphology_batch_operations",
     "morphology_filter",
+    "next_fast_len",
+    "noise_batch_operations",
     "normalize",
     "open_image",
     "pad",
+    "pad_spatial",
     "parameter_complement",
     "prepare_angle",
     "prepare_standard_geometry_logic",
     "prepare_values",
     "preprocess_logic",
+    "preprocess_stack_logic",
+    "random_shift_batch",
     "random_shift_engine",
     "resize",
+    "resize_into",
+    "resize_operators",
+    "resolve_arg_layout",
     "rotate_90",
+    "rotate_90_batch",
     "rotate_small_angle",
+    "rotate_small_angle_batch",
+    "rotation_source_coords",
+    "run_plan_logic",
+    "running_extremum",
+    "running_sum",
     "salt_and_pepper",
+    "salt_and_pepper_batch",
     "save_image",
+    "select_conv_backend",
+    "separable_factors",
+    "separable_morphology",
     "separate_channels",
     "sliding_window_engine",
     "vertical_flip",
+    "warp_rotate",
     "with_dimensions",
+    "z_score_inplace",
     "z_score_normalization",
 ]
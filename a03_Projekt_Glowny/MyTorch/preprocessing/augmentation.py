@@ -1,92 +1,45 @@
-import random
 from dataclasses import dataclass, field
 from typing import (
     Callable,
     Dict,
     List,
+    Optional,
     Tuple,
 )
 
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 
-from common_utils import class_autologger
-from MyTorch import T2D, ImageGray, JsonData, Padded
+from common_utils import RngContext, class_autologger, resolve_rng
+from MyTorch import (
+    T1D,
+    T2D,
+    FillValue,
+    ImageBatch,
+    ImageGray,
+    LabelsMtx,
+    Padded,
+)
 
 from .base import AugmentationABC, GeometryABC, MorphologyABC, NoiseABC, ProviderABC
 from .decorators import (
     apply_to_methods,
     auto_fill_color,
+    calculate_fill_color,
     kernel_data_processing,
+    prepare_angle,
     with_dimensions,
 )
+from .geometry import pad_spatial
+from .morphology import separable_morphology
 from .protocols import (
     GeometryAugmentationProtocol,
     MorphologyAugmentationProtocol,
     NoiseAugmentationProtocol,
     ParameterProviderProtocol,
+    WarpEngineProtocol,
 )
-
-
-def _pick_random_pipeline(
-    available_keys: List[str],
-    groups: Dict[str, List[Tuple[Callable, str]]],
-    num_samples: int = 3,
-) -> Tuple[List[Tuple[Callable, str]], List[str]]:
-    selected_keys: List[str] = random.sample(
-        available_keys, min(len(available_keys), num_samples)
-    )
-    pipeline: List[Tuple[Callable, str]] = [
-        random.choice(groups[k]) for k in selected_keys
-    ]
-    return pipeline, selected_keys
-
-
-def _get_augmentation_groups(
-    geometry: GeometryAugmentationProtocol,
-    noise: NoiseAugmentationProtocol,
-    morphology: MorphologyAugmentationProtocol,
-) -> Dict[str, List[Tuple[Callable, str]]]:
-    return {
-        "geometry": [
-            (getattr(geometry, m), m) for m in dir(geometry) if not m.startswith("_")
-        ],
-        "noise": [(getattr(noise, m), m) for m in dir(noise) if not m.startswith("_")],
-        "morphology": [
-            (getattr(morphology, m), m)
-            for m in dir(morphology)
-            if not m.startswith("_")
-        ],
-    }
-
-
-def augment_engine(
-    m_arr: ImageGray,
-    repeats: int,
-    max_attempts: int,
-    pipeline_provider: Callable[[], List[Tuple[Callable, str]]],
-    orig_px: int,
-    min_area_ratio: float = 0.5,
-) -> Tuple[List[ImageGray], List[List[str]], int]:
-    results: List[ImageGray] = list()
-    histories: List[List[str]] = list()
-    attempts: int = 0
-
-    while len(results) < repeats and attempts < max_attempts:
-        attempts += 1
-        pipeline: List[Tuple[Callable, str]] = pipeline_provider()
-        current_m: ImageGray = m_arr.copy()
-        current_history: List[str] = [name for _, name in pipeline]
-
-        for func, _ in pipeline:
-            current_m = func(current_m)
-
-        current_px: int = int(np.sum(current_m > 0))
-        if current_px >= (orig_px * min_area_ratio):
-            results.append(current_m)
-            histories.append(current_history)
-
-    return results, histories, attempts
+from .warp import WarpEngine, warp_rotate
 
 
 def _get_trace_report(idx: int, history: List[str]) -> str:
@@ -95,27 +48,22 @@ def _get_trace_report(idx: int, history: List[str]) -> str:
 
 
 def horizontal_flip(M: ImageGray) -> ImageGray:
-    return np.asanyarray(M)[:, ::-1]
+    return np.asanyarray(M)[..., :, ::-1]
 
 
 def vertical_flip(M: ImageGray) -> ImageGray:
-    return np.asanyarray(M)[::-1, :]
+    return np.asanyarray(M)[..., ::-1, :]
 
 
 def rotate_90(M: ImageGray, is_right: bool = True) -> ImageGray:
     k: int = -1 if is_right else 1
-    return np.rot90(np.asanyarray(M), k=k).copy()
+    return np.rot90(np.asanyarray(M), k=k, axes=(-2, -1)).copy()
 
 
 def _create_supplement_all_sides(
-    M: ImageGray, dx: int, dy: int, shade_gray_color: int
+    M: ImageGray, dx: int, dy: int, shade_gray_color: FillValue
 ) -> ImageGray:
-    return np.pad(
-        M,
-        pad_width=((abs(dy), abs(dy)), (abs(dx), abs(dx))),
-        mode="constant",
-        constant_values=shade_gray_color,
-    ).astype(np.float32)
+    return pad_spatial(M, (abs(dy), abs(dy)), (abs(dx), abs(dx)), fill=shade_gray_color)
 
 
 def rotate_small_angle(
@@ -136,26 +84,29 @@ def rotate_small_angle(
     mask = (xf >= 0) & (xf < w - 1) & (yf >= 0) & (yf < h - 1)
     xi, yi = xf[mask].astype(int), yf[mask].astype(int)
 
-    new_m[y_new[mask], x_new[mask]] = M[yi, xi]
+    new_m[..., y_new[mask], x_new[mask]] = M[..., yi, xi]
     return new_m.astype(np.float32)
 
 
 def random_shift_engine(
-    M: ImageGray, h: int, w: int, dx: int, dy: int, sx: int, sy: int, fill: int
+    M: ImageGray, h: int, w: int, dx: int, dy: int, sx: int, sy: int, fill: FillValue
 ) -> ImageGray:
-    padded = np.pad(
-        M,
-        pad_width=((abs(dy), abs(dy)), (abs(dx), abs(dx))),
-        mode="constant",
-        constant_values=fill,
-    ).astype(np.float32)
+    padded = pad_spatial(M, (abs(dy), abs(dy)), (abs(dx), abs(dx)), fill=fill)
 
-    shifted: ImageGray = padded[sy : sy + h, sx : sx + w].copy()
+    shifted: ImageGray = padded[..., sy : sy + h, sx : sx + w].copy()
     return shifted
 
 
-def get_uniform_value(low: float, high: float) -> float:
-    return random.uniform(low, high)
+def get_uniform_value(
+    low: float, high: float, rng: Optional[RngContext] = None
+) -> float:
+    return float(resolve_rng(rng).uniform(low, high))
+
+
+def get_uniform_values(
+    low: float, high: float, n: int, rng: Optional[RngContext] = None
+) -> T1D:
+    return resolve_rng(rng).uniform(low, high, n).astype(np.float32)
 
 
 def gaussian_noise(M: ImageGray, std: float, noise_map: ImageGray) -> ImageGray:
@@ -172,17 +123,22 @@ def salt_and_pepper(M: ImageGray, prob: float, random_map: ImageGray) -> ImageGr
 
 
 def dilate(M: ImageGray, kernel_size: int, sliding_window_func: Callable) -> ImageGray:
-    return sliding_window_func(M, kernel_size, pad_value=0.0)
+    return sliding_window_func(
+        M,
+        kernel_size,
+        op_func=np.maximum,
+        pad_value=0,
+    )
 
 
 def erode(
-    M: ImageGray, kernel_size: int, fill: int, sliding_window_func: Callable
+    M: ImageGray, kernel_size: int, fill: FillValue, sliding_window_func: Callable
 ) -> ImageGray:
     return sliding_window_func(
         M,
         kernel_size,
-        op_func=lambda win, axes: np.min(win, axis=axes),
-        pad_value=float(fill),
+        op_func=np.minimum,
+        pad_value=fill,
     )
 
 
@@ -194,7 +150,7 @@ def get_boundaries(M: ImageGray, eroded: ImageGray) -> ImageGray:
 def morphology_filter(
     M: ImageGray,
     kernel_size: int,
-    fill: int,
+    fill: FillValue,
     mode: str,
     dilate_func: Callable,
     erode_func: Callable,
@@ -209,25 +165,244 @@ def sliding_window_engine(
     kernel_size: int,
     pad_before: int,
     pad_after: int,
-    pad_value: int,
+    pad_value: FillValue,
     op_func: Callable,
 ) -> ImageGray:
-    h, w = M_arr.shape
-    padded: Padded = np.pad(
-        M_arr,
-        pad_width=((pad_before, pad_after), (pad_before, pad_after)),
-        mode="constant",
-        constant_values=float(pad_value),
+    h, w = M_arr.shape[-2:]
+    padded: Padded = pad_spatial(
+        M_arr, (pad_before, pad_after), (pad_before, pad_after), fill=pad_value
     )
-    windows = sliding_window_view(padded, (kernel_size, kernel_size))
-    result: ImageGray = op_func(windows, (2, 3)).astype(np.float32)
-    return result[:h, :w]
+    windows = sliding_window_view(padded, (kernel_size, kernel_size), axis=(-2, -1))
+    result: ImageGray = op_func(windows, (-2, -1)).astype(np.float32)
+    return result[..., :h, :w]
+
+
+def rotate_90_batch(M: ImageBatch, is_right: LabelsMtx) -> ImageBatch:
+    right = is_right.astype(bool)
+    out: ImageBatch = np.empty((M.shape[0], M.shape[-1], M.shape[-2]), dtype=np.float32)
+    out[right] = rotate_90(M[right], is_right=True)
+    out[~right] = rotate_90(M[~right], is_right=False)
+    return out
+
+
+def rotate_small_angle_batch(M: ImageBatch, angles: T1D, fill: FillValue) -> ImageBatch:
+    return warp_rotate(M, angles, fill, mode="nearest")
+
+
+def random_shift_batch(
+    M: ImageBatch,
+    dx: LabelsMtx,
+    dy: LabelsMtx,
+    sx: LabelsMtx,
+    sy: LabelsMtx,
+    fill: FillValue,
+    max_shift: int = 4,
+) -> ImageBatch:
+    n, h, w = M.shape
+    padded = pad_spatial(M, (max_shift, max_shift), (max_shift, max_shift), fill=fill)
+    windows = sliding_window_view(padded, (h, w), axis=(-2, -1))
+    oy = max_shift - np.abs(dy) + sy
+    ox = max_shift - np.abs(dx) + sx
+    shifted: ImageBatch = windows[np.arange(n), oy, ox].copy()
+    return shifted
+
+
+def gaussian_noise_batch(M: ImageBatch, std: T1D, noise_map: ImageBatch) -> ImageBatch:
+    noisy = M + noise_map * std[:, np.newaxis, np.newaxis]
+    return np.clip(noisy, 0.0, 255.0).astype(np.float32)
+
+
+def salt_and_pepper_batch(
+    M: ImageBatch, prob: T1D, random_map: ImageBatch
+) -> ImageBatch:
+    result: ImageBatch = M.astype(np.float32)
+    half_prob = (prob / 2.0)[:, np.newaxis, np.newaxis]
+    result[random_map < half_prob] = 0.0
+    result[random_map > 1.0 - half_prob] = 255.0
+    return result
+
+
+def morphology_batch(
+    M: ImageBatch,
+    kernel_size: LabelsMtx,
+    op_func: Callable[[ImageBatch, int, FillValue], ImageBatch],
+) -> ImageBatch:
+    fill = calculate_fill_color(M)
+    out: ImageBatch = np.empty(M.shape, dtype=np.float32)
+    for k in np.unique(kernel_size):
+        sel = kernel_size == k
+        out[sel] = op_func(M[sel], int(k), fill[sel])
+    return out
+
+
+def _dilate_batch(M: ImageBatch, kernel_size: int, fill: FillValue) -> ImageBatch:
+    return dilate(M, kernel_size, separable_morphology)
+
+
+def _erode_batch(M: ImageBatch, kernel_size: int, fill: FillValue) -> ImageBatch:
+    return erode(M, kernel_size, fill, separable_morphology)
+
+
+def _boundaries_batch(M: ImageBatch, kernel_size: int, fill: FillValue) -> ImageBatch:
+    return get_boundaries(M, _erode_batch(M, kernel_size, fill))
+
+
+def _morphology_filter_batch(
+    M: ImageBatch, kernel_size: LabelsMtx, is_open: LabelsMtx
+) -> ImageBatch:
+    out: ImageBatch = np.empty(M.shape, dtype=np.float32)
+    for mode, sel in (("open", is_open == 1), ("close", is_open == 0)):
+        if not sel.any():
+            continue
+        out[sel] = morphology_batch(
+            M[sel],
+            kernel_size[sel],
+            lambda x, k, f, mode=mode: morphology_filter(
+                M=x,
+                kernel_size=k,
+                fill=f,
+                mode=mode,
+                dilate_func=lambda y, j: _dilate_batch(y, j, 0),
+                erode_func=_erode_batch,
+            ),
+        )
+    return out
+
+
+def geometry_batch_operations(
+    angle_provider: ParameterProviderProtocol, rng: RngContext
+) -> Dict[str, Callable[[ImageBatch], ImageBatch]]:
+    def shift(M: ImageBatch) -> ImageBatch:
+        n: int = len(M)
+        is_right = rng.generator.random(n) < 0.5
+        dx_abs = rng.generator.integers(1, 5, n)
+        dx = np.where(is_right, dx_abs, -dx_abs).astype(np.int64)
+        dy = rng.generator.integers(-4, 5, n).astype(np.int64)
+        sx = np.floor(rng.generator.random(n) * (2 * np.abs(dx) + 1)).astype(np.int64)
+        sy = np.floor(rng.generator.random(n) * (2 * np.abs(dy) + 1)).astype(np.int64)
+        max_shift = int(np.max(np.abs(np.concatenate((dx, dy)))))
+        fill = calculate_fill_color(M)
+        return random_shift_batch(M, dx, dy, sx, sy, fill, max_shift)
+
+    return {
+        "horizontal_flip": horizontal_flip,
+        "vertical_flip": vertical_flip,
+        "rotate_90": lambda M: rotate_90_batch(M, rng.generator.random(len(M)) < 0.5),
+        "rotate_small_angle": lambda M: rotate_small_angle_batch(
+            M, angle_provider.get_values(len(M), rng), calculate_fill_color(M)
+        ),
+        "random_shift": shift,
+    }
+
+
+def noise_batch_operations(
+    std_provider: ParameterProviderProtocol,
+    prob_provider: ParameterProviderProtocol,
+    rng: RngContext,
+) -> Dict[str, Callable[[ImageBatch], ImageBatch]]:
+    return {
+        "gaussian_noise": lambda M: gaussian_noise_batch(
+            M,
+            std_provider.get_values(len(M), rng),
+            rng.generator.standard_normal(M.shape, dtype=np.float32),
+        ),
+        "salt_and_pepper": lambda M: salt_and_pepper_batch(
+            M,
+            prob_provider.get_values(len(M), rng),
+            rng.generator.random(M.shape, dtype=np.float32),
+        ),
+    }
+
+
+def morphology_batch_operations(
+    kernel_provider: ParameterProviderProtocol, rng: RngContext
+) -> Dict[str, Callable[[ImageBatch], ImageBatch]]:
+    def kernels(M: ImageBatch) -> LabelsMtx:
+        sizes = np.floor(kernel_provider.get_values(len(M), rng))
+        return np.maximum(sizes, 1).astype(np.int64)
+
+    return {
+        "dilate": lambda M: morphology_batch(M, kernels(M), _dilate_batch),
+        "erode": lambda M: morphology_batch(M, kernels(M), _erode_batch),
+        "get_boundaries": lambda M: morphology_batch(M, kernels(M), _boundaries_batch),
+        "morphology_filter": lambda M: _morphology_filter_batch(
+            M, kernels(M), (rng.generator.random(len(M)) < 0.5).astype(np.int64)
+        ),
+    }
+
+
+def _draw_batch_pipelines(
+    n: int,
+    group_sizes: List[int],
+    num_steps: int = 3,
+    rng: Optional[RngContext] = None,
+) -> List[LabelsMtx]:
+    generator = resolve_rng(rng)
+    sizes = np.array(group_sizes, dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    keys = np.argsort(generator.random((n, len(sizes))), axis=1)[:, :num_steps]
+    picks = np.floor(generator.random(keys.shape) * sizes[keys]).astype(np.int64)
+    return list((offsets[keys] + picks).T)
+
+
+def _apply_batch_step(
+    current: List[ImageGray],
+    codes: LabelsMtx,
+    operations: List[Callable[[ImageBatch], ImageBatch]],
+) -> List[ImageGray]:
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = dict()
+    for idx, (code, m) in enumerate(zip(codes, current, strict=True)):
+        buckets.setdefault((int(code), m.shape), list()).append(idx)
+
+    updated: List[ImageGray] = list(current)
+    for (code, _), indices in buckets.items():
+        out = operations[code](np.stack([current[i] for i in indices]))
+        for idx, m in zip(indices, out, strict=True):
+            updated[idx] = m
+    return updated
+
+
+def batch_augment_engine(
+    m_arr: ImageGray,
+    repeats: int,
+    max_attempts: int,
+    groups: List[Dict[str, Callable[[ImageBatch], ImageBatch]]],
+    orig_px: int,
+    min_area_ratio: float = 0.5,
+    rng: Optional[RngContext] = None,
+) -> Tuple[List[ImageGray], List[List[str]], int]:
+    groups = [group for group in groups if group]
+    names: List[str] = [name for group in groups for name in group]
+    operations = [op for group in groups for op in group.values()]
+    group_sizes: List[int] = [len(group) for group in groups]
+
+    results: List[ImageGray] = list()
+    histories: List[List[str]] = list()
+    attempts: int = 0
+
+    while len(results) < repeats and attempts < max_attempts:
+        n = min(repeats - len(results), max_attempts - attempts)
+        attempts += n
+        steps = _draw_batch_pipelines(n, group_sizes, rng=rng)
+
+        batch = np.repeat(m_arr[np.newaxis].astype(np.float32), n, axis=0)
+        current: List[ImageGray] = list(batch)
+        for codes in steps:
+            current = _apply_batch_step(current, codes, operations)
+
+        current_px = np.array([np.count_nonzero(m > 0) for m in current])
+        for idx in np.flatnonzero(current_px >= orig_px * min_area_ratio):
+            results.append(current[idx])
+            histories.append([names[codes[idx]] for codes in steps])
+
+    return results, histories, attempts
 
 
 @class_autologger
 @apply_to_methods(
     [auto_fill_color, with_dimensions], ["rotate_small_angle", "random_shift"]
 )
+@apply_to_methods(prepare_angle, "rotate_small_angle")
 @dataclass(frozen=True, slots=True)
 class GeometryAugmentation(GeometryABC):
     angle_provider: ParameterProviderProtocol = field(
@@ -236,6 +411,8 @@ class GeometryAugmentation(GeometryABC):
     shift_provider: ParameterProviderProtocol = field(
         default_factory=lambda: RandomUniformProvider(-10.0, 10.0)
     )
+    warp: WarpEngineProtocol = field(default_factory=WarpEngine)
+    rng: RngContext = field(default_factory=RngContext)
     _transformation_matrix_cache: T2D = field(
         init=False, repr=False, default_factory=lambda: np.array([], dtype=np.float32)
     )
@@ -257,25 +434,14 @@ class GeometryAugmentation(GeometryABC):
         M: ImageGray,
         h: int,
         w: int,
-        params: JsonData,
         angle: float = 0.0,
-        fill: int = 0,
+        fill: FillValue = 0,
+        is_right: bool = True,
     ) -> ImageGray:
-        assert isinstance(params, dict)
-
-        return rotate_small_angle(
-            M=M,
-            h=h,
-            w=w,
-            cos_a=float(params["cos_a"]),
-            sin_a=float(params["sin_a"]),
-            cx=float(params["cx"]),
-            cy=float(params["cy"]),
-            new_m=params["new_matrix"],
-        )
+        return self.warp.rotate(M, angle, fill)
 
     def _create_supplement_all_sides(
-        self, M: ImageGray, x_y_axis: Tuple[int, int], shade_gray_color: int
+        self, M: ImageGray, x_y_axis: Tuple[int, int], shade_gray_color: FillValue
     ) -> ImageGray:
         dx, dy = x_y_axis
         return _create_supplement_all_sides(M, dx, dy, shade_gray_color)
@@ -285,22 +451,27 @@ class GeometryAugmentation(GeometryABC):
         M: ImageGray,
         h: int,
         w: int,
-        fill: int = 0,
+        fill: FillValue = 0,
         is_right: bool = True,
     ) -> ImageGray:
-        dx, dy = (
-            (random.randint(1, 4), random.randint(-4, 4))
-            if is_right
-            else (random.randint(-4, -1), random.randint(-4, 4))
-        )
-        sx, sy = random.randint(0, abs(dx) * 2), random.randint(0, abs(dy) * 2)
+        generator = self.rng.generator
+        dx = int(generator.integers(1, 5) if is_right else generator.integers(-4, 0))
+        dy = int(generator.integers(-4, 5))
+        sx = int(generator.integers(0, abs(dx) * 2 + 1))
+        sy = int(generator.integers(0, abs(dy) * 2 + 1))
         return random_shift_engine(M=M, h=h, w=w, dx=dx, dy=dy, sx=sx, sy=sy, fill=fill)
 
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]:
+        return geometry_batch_operations(self.angle_provider, rng or self.rng)
+
 
 @dataclass(frozen=True, slots=True)
 class RandomUniformProvider(ProviderABC):
     low: float = 0.0
     high: float = 1.0
+    rng: RngContext = field(default_factory=RngContext)
 
     def __post_init__(self) -> None:
         super().__post_init__()
@@ -308,8 +479,11 @@ class RandomUniformProvider(ProviderABC):
             object.__setattr__(self, "low", self.high)
             object.__setattr__(self, "high", self.low)
 
-    def get_value(self) -> float:
-        return get_uniform_value(self.low, self.high)
+    def get_value(self, rng: Optional[RngContext] = None) -> float:
+        return get_uniform_value(self.low, self.high, rng or self.rng)
+
+    def get_values(self, n: int, rng: Optional[RngContext] = None) -> T1D:
+        return get_uniform_values(self.low, self.high, n, rng or self.rng)
 
 
 @dataclass(frozen=True, slots=True)
@@ -320,55 +494,67 @@ class NoiseAugmentation(NoiseABC):
     prob_provider: ParameterProviderProtocol = field(
         default_factory=lambda: RandomUniformProvider(0.01, 0.05)
     )
+    rng: RngContext = field(default_factory=RngContext)
 
     def __post_init__(self) -> None:
         super().__post_init__()
 
     def gaussian_noise(self, M: ImageGray, std: float = 0.0) -> ImageGray:
-        actual_std: float = std if std > 0.0 else self.std_provider.get_value()
-        noise_map: ImageGray = np.random.standard_normal(M.shape).astype(np.float32)
+        actual_std: float = std if std > 0.0 else self.std_provider.get_value(self.rng)
+        noise_map: ImageGray = self.rng.generator.standard_normal(
+            M.shape, dtype=np.float32
+        )
         return gaussian_noise(M, actual_std, noise_map)
 
     def salt_and_pepper(self, M: ImageGray, prob: float = 0.0) -> ImageGray:
-        actual_prob: float = prob if prob > 0.0 else self.prob_provider.get_value()
-        random_map: ImageGray = np.random.random(M.shape).astype(np.float32)
+        actual_prob: float = (
+            prob if prob > 0.0 else self.prob_provider.get_value(self.rng)
+        )
+        random_map: ImageGray = self.rng.generator.random(M.shape, dtype=np.float32)
         return salt_and_pepper(M, actual_prob, random_map)
 
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]:
+        return noise_batch_operations(
+            self.std_provider, self.prob_provider, rng or self.rng
+        )
+
 
 @class_autologger
 @apply_to_methods(auto_fill_color, ["erode", "get_boundaries", "morphology_filter"])
 @apply_to_methods(kernel_data_processing, ["dilate", "erode", "get_boundaries"])
 @dataclass(frozen=True, slots=True)
 class MorphologyAugmentation(MorphologyABC):
+    kernel_provider: ParameterProviderProtocol = field(
+        default_factory=lambda: RandomUniformProvider(2.0, 4.0)
+    )
+    rng: RngContext = field(default_factory=RngContext)
+
     def __post_init__(self) -> None:
         super().__post_init__()
 
-    def _sliding_window_engine(
-        self, M: ImageGray, kernel_size: int, op_func: Callable, pad_value: int = 0
+    def _morphology_engine(
+        self,
+        M: ImageGray,
+        kernel_size: int,
+        op_func: Callable,
+        pad_value: FillValue = 0,
     ) -> ImageGray:
-        pad_before: int = (kernel_size - 1) // 2
-        pad_after: int = kernel_size // 2
-        return sliding_window_engine(
-            M_arr=M,
-            kernel_size=kernel_size,
-            pad_before=pad_before,
-            pad_after=pad_after,
-            pad_value=pad_value,
-            op_func=op_func,
-        )
+        return separable_morphology(M, kernel_size, op_func, pad_value)
 
     def dilate(self, M: ImageGray, kernel_size: int) -> ImageGray:
-        return dilate(M, kernel_size, self._sliding_window_engine)
+        return dilate(M, kernel_size, self._morphology_engine)
 
-    def erode(self, M: ImageGray, kernel_size: int, fill: int = 0) -> ImageGray:
-        return erode(M, kernel_size, fill, self._sliding_window_engine)
+    def erode(self, M: ImageGray, kernel_size: int, fill: FillValue = 0) -> ImageGray:
+        return erode(M, kernel_size, fill, self._morphology_engine)
 
     def get_boundaries(self, M: ImageGray, kernel_size: int = 2) -> ImageGray:
         eroded: ImageGray = self.erode(M, kernel_size=kernel_size)
         return get_boundaries(M, eroded)
 
     def morphology_filter(
-        self, M: ImageGray, kernel_size: int, fill: int = 0, mode: str = "open"
+        self, M: ImageGray, kernel_size: int, fill: FillValue = 0, mode: str = "open"
     ) -> ImageGray:
         return morphology_filter(
             M=M,
@@ -379,6 +565,11 @@ class MorphologyAugmentation(MorphologyABC):
             erode_func=self.erode,
         )
 
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]:
+        return morphology_batch_operations(self.kernel_provider, rng or self.rng)
+
 
 @dataclass(frozen=True, slots=True)
 class DataAugmentation(AugmentationABC):
@@ -387,16 +578,10 @@ class DataAugmentation(AugmentationABC):
     morphology: MorphologyAugmentationProtocol = field(
         default_factory=MorphologyAugmentation
     )
-    _cached_groups: Dict[str, List[Tuple[Callable, str]]] = field(
-        init=False, repr=False, default_factory=dict
-    )
+    rng: RngContext = field(default_factory=RngContext)
 
     def __post_init__(self) -> None:
         super().__post_init__()
-        groups: Dict[str, List[Tuple[Callable, str]]] = _get_augmentation_groups(
-            self.geometry, self.noise, self.morphology
-        )
-        object.__setattr__(self, "_cached_groups", groups)
 
     def augment(
         self, M: ImageGray, repeats: int = 1, debug: bool = False
@@ -404,12 +589,17 @@ class DataAugmentation(AugmentationABC):
         orig_px: int = int(np.sum(M > 0))
         max_attempts: int = repeats * 100
 
-        results, histories, attempts = augment_engine(
+        results, histories, attempts = batch_augment_engine(
             m_arr=M,
             repeats=repeats,
             max_attempts=max_attempts,
-            pipeline_provider=self._pick_random_pipeline,
+            groups=[
+                self.geometry.batch_operations(self.rng),
+                self.noise.batch_operations(self.rng),
+                self.morphology.batch_operations(self.rng),
+            ],
             orig_px=orig_px,
+            rng=self.rng,
         )
 
         if debug:
@@ -417,11 +607,6 @@ class DataAugmentation(AugmentationABC):
 
         return results
 
-    def _pick_random_pipeline(self) -> List[Tuple[Callable, str]]:
-        available_keys: List[str] = list(self._cached_groups.keys())
-        pipeline, _ = _pick_random_pipeline(available_keys, self._cached_groups)
-        return pipeline
-
     def _display_debug_plots(
         self, result: List[ImageGray], histories: List[List[str]]
     ) -> None:
@@ -1,9 +1,20 @@
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Tuple, Union
-
-from MyTorch import T2D, FilePath, ImageGray, ImageRGB, JsonData, Padded, Shape
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from common_utils import RngContext
+from MyTorch import (
+    T1D,
+    T2D,
+    FilePath,
+    FillValue,
+    ImageBatch,
+    ImageGray,
+    ImageRGB,
+    Padded,
+    Shape,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,9 +39,9 @@ class GeometryABC(ABC):
         M: ImageGray,
         h: int,
         w: int,
-        params: JsonData,
         angle: float = 0.0,
-        fill: int = 0,
+        fill: FillValue = 0,
+        is_right: bool = True,
     ) -> ImageGray: ...
 
     @abstractmethod
@@ -39,10 +50,15 @@ class GeometryABC(ABC):
         M: ImageGray,
         h: int,
         w: int,
-        fill: int = 0,
+        fill: FillValue = 0,
         is_right: bool = True,
     ) -> ImageGray: ...
 
+    @abstractmethod
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]: ...
+
 
 @dataclass(frozen=True, slots=True)
 class ProviderABC(ABC):
@@ -52,7 +68,10 @@ class ProviderABC(ABC):
         object.__setattr__(self, "logger", logging.getLogger(self.__class__.__name__))
 
     @abstractmethod
-    def get_value(self) -> float: ...
+    def get_value(self, rng: Optional[RngContext] = None) -> float: ...
+
+    @abstractmethod
+    def get_values(self, n: int, rng: Optional[RngContext] = None) -> T1D: ...
 
 
 @dataclass(frozen=True, slots=True)
@@ -68,6 +87,11 @@ class NoiseABC(ABC):
     @abstractmethod
     def salt_and_pepper(self, M: ImageGray, prob: float = 0.0) -> ImageGray: ...
 
+    @abstractmethod
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]: ...
+
 
 @dataclass(frozen=True, slots=True)
 class MorphologyABC(ABC):
@@ -80,16 +104,23 @@ class MorphologyABC(ABC):
     def dilate(self, M: ImageGray, kernel_size: int) -> ImageGray: ...
 
     @abstractmethod
-    def erode(self, M: ImageGray, kernel_size: int, fill: int = 0) -> ImageGray: ...
+    def erode(
+        self, M: ImageGray, kernel_size: int, fill: FillValue = 0
+    ) -> ImageGray: ...
 
     @abstractmethod
     def get_boundaries(self, M: ImageGray, kernel_size: int = 2) -> ImageGray: ...
 
     @abstractmethod
     def morphology_filter(
-        self, M: ImageGray, kernel_size: int, fill: int = 0, mode: str = "open"
+        self, M: ImageGray, kernel_size: int, fill: FillValue = 0, mode: str = "open"
     ) -> ImageGray: ...
 
+    @abstractmethod
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]: ...
+
 
 @dataclass(frozen=True, slots=True)
 class AugmentationABC(ABC):
@@ -159,7 +190,7 @@ class GrayScaleABC(ABC):
 
     @abstractmethod
     def convert_color_space(
-        self, M: Union[ImageGray, ImageRGB], to_gray: bool = True
+        self, M: Union[ImageGray, ImageRGB], to_gray: bool = True, batched: bool = False
     ) -> Union[ImageGray, ImageRGB]: ...
 
 
@@ -213,6 +244,19 @@ class NormalizationABC(ABC):
     ) -> ImageGray: ...
 
 
+@dataclass(frozen=True, slots=True)
+class ExecutionPlanABC(ABC):
+    logger: logging.Logger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "logger", logging.getLogger(self.__class__.__name__))
+
+    @abstractmethod
+    def run(
+        self, matrix: ImageRGB, augment_func: Callable[[ImageGray], List[ImageGray]]
+    ) -> List[ImageGray]: ...
+
+
 @dataclass(frozen=True, slots=True)
 class TransformPipelineABC(ABC):
     logger: logging.Logger = field(init=False, repr=False)
@@ -221,7 +265,12 @@ class TransformPipelineABC(ABC):
         object.__setattr__(self, "logger", logging.getLogger(self.__class__.__name__))
 
     @abstractmethod
-    def apply(self, matrix: ImageRGB) -> List[ImageGray]: ...
+    def apply(self, matrix: ImageRGB, batched: bool = False) -> List[ImageGray]: ...
+
+    @abstractmethod
+    def compile(
+        self, input_shape: Shape, batched: bool = False
+    ) -> "ExecutionPlanABC": ...
 
 
 @dataclass(frozen=True, slots=True)
@@ -234,6 +283,12 @@ class ImageDataPreprocessingABC(ABC):
     @abstractmethod
     def preprocess(self, path: FilePath) -> List[List[ImageGray]]: ...
 
+    @abstractmethod
+    def load_channels(self, path: FilePath) -> List[ImageGray]: ...
+
+    @abstractmethod
+    def preprocess_channels(self, channels: ImageBatch) -> List[ImageGray]: ...
+
 
 @dataclass(frozen=True, slots=True)
 class PoolingABC(ABC):
@@ -268,3 +323,20 @@ class ThresholdingABC(ABC):
         c: int = 2,
         auto_params: bool = True,
     ) -> ImageGray: ...
+
+
+@dataclass(frozen=True, slots=True)
+class WarpABC(ABC):
+    logger: logging.Logger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "logger", logging.getLogger(self.__class__.__name__))
+
+    @abstractmethod
+    def rotate(
+        self,
+        M: Union[ImageGray, ImageBatch],
+        angles: Union[float, T1D],
+        fill: FillValue = 0,
+        out: Optional[Union[ImageGray, ImageBatch]] = None,
+    ) -> Union[ImageGray, ImageBatch]: ...
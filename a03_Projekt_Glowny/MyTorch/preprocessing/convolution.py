@@ -1,48 +1,160 @@
 from dataclasses import dataclass, field
-from itertools import product
-from typing import Callable, List
+from typing import Callable, Dict, List, Literal, Optional, Tuple
 
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 
-from MyTorch import T2D, ImageGray, Padded
+from MyTorch import T, T1D, T2D, T3D, ImageGray, Padded, Shape
 
 from .base import ConvolutionABC
 from .geometry import ImageGeometry
 from .protocols import ImageGeometryProtocol
 
 
-def convolution_2d(M: Padded, filters: List[T2D]) -> List[ImageGray]:
-    if not filters:
-        return [M.astype(np.float32)]
+def separable_factors(f: T2D, rtol: float = 1e-6) -> Optional[Tuple[T1D, T1D]]:
+    i, j = np.unravel_index(np.argmax(np.abs(f)), f.shape)
+    pivot = float(f[i, j])
+    if pivot == 0.0:
+        return None
+
+    col = f[:, j].astype(np.float32)
+    row = (f[i, :] / pivot).astype(np.float32)
+    if not np.allclose(np.outer(col, row), f, rtol=rtol, atol=rtol * abs(pivot)):
+        return None
+    return col, row
+
+
+def next_fast_len(n: int) -> int:
+    best = 2 * n
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            p = p35
+            while p < n:
+                p *= 2
+            best = min(best, p)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def select_conv_backend(
+    image_shape: Shape, kernel_shape: Shape, n_filters: int, is_separable: bool
+) -> str:
+    h, w = image_shape[-2:]
+    fh, fw = kernel_shape
+    if is_separable and fh * fw > fh + fw:
+        return "separable"
+
+    direct_cost = (h - fh + 1) * (w - fw + 1) * fh * fw * n_filters
+    fft_size = next_fast_len(h + fh - 1) * next_fast_len(w + fw - 1)
+    fft_cost = 4 * fft_size * np.log2(fft_size) * (n_filters + 1)
+    return "fft" if fft_cost < direct_cost else "direct"
+
+
+def _conv_direct(M: ImageGray, kernels: T3D) -> T:
+    _, fh, fw = kernels.shape
+    windows = sliding_window_view(M, (fh, fw), axis=(-2, -1))
+    out = np.tensordot(windows, kernels, axes=([-2, -1], [1, 2]))
+    return np.moveaxis(out, -1, 0).astype(np.float32)
+
+
+def _conv_separable(M: ImageGray, cols: T2D, rows: T2D) -> T:
+    h, w = M.shape[-2:]
+    oh, ow = h - cols.shape[1] + 1, w - rows.shape[1] + 1
+    lead = (-1,) + (1,) * M.ndim
+
+    row_pass = np.zeros((rows.shape[0],) + M.shape[:-1] + (ow,), dtype=np.float32)
+    for k in range(rows.shape[1]):
+        row_pass += rows[:, k].reshape(lead) * M[..., k : k + ow]
+
+    out = np.zeros(row_pass.shape[:-2] + (oh, ow), dtype=np.float32)
+    for k in range(cols.shape[1]):
+        out += cols[:, k].reshape(lead) * row_pass[..., k : k + oh, :]
+    return out
+
 
-    results: List[ImageGray] = list()
+def _conv_fft(M: ImageGray, kernels: T3D) -> T:
+    h, w = M.shape[-2:]
+    _, fh, fw = kernels.shape
+    size = (next_fast_len(h + fh - 1), next_fast_len(w + fw - 1))
+    image_spec = np.fft.rfft2(M.astype(np.float64), s=size)
+    kernel_spec = np.fft.rfft2(kernels[:, ::-1, ::-1].astype(np.float64), s=size)
+    kernel_spec = kernel_spec.reshape(
+        (kernels.shape[0],) + (1,) * (M.ndim - 2) + kernel_spec.shape[-2:]
+    )
+    full = np.fft.irfft2(image_spec[np.newaxis] * kernel_spec, s=size)
+    return full[..., fh - 1 : h, fw - 1 : w].astype(np.float32)
 
-    for f in filters:
-        fh, fw = f.shape
-        windows = sliding_window_view(M, (fh, fw))
-        conv_result = np.einsum("ij,hwij->hw", f, windows).astype(np.float32)
-        results.append(conv_result)
 
+def convolve_stack(M: ImageGray, kernels: T3D, backend: str = "auto") -> T:
+    factors = [separable_factors(k) for k in kernels]
+    is_separable = all(f is not None for f in factors)
+    if backend == "auto":
+        backend = select_conv_backend(
+            M.shape, kernels.shape[1:], kernels.shape[0], is_separable
+        )
+
+    if backend == "fft":
+        return _conv_fft(M, kernels)
+    if backend == "separable" and is_separable:
+        cols = np.stack([f[0] for f in factors if f is not None])
+        rows = np.stack([f[1] for f in factors if f is not None])
+        return _conv_separable(M.astype(np.float32), cols, rows)
+    return _conv_direct(M, kernels.astype(np.float32))
+
+
+def _convolve_grouped(M: ImageGray, filters: List[T2D], backend: str) -> List[T]:
+    groups: Dict[Shape, List[int]] = dict()
+    for idx, f in enumerate(filters):
+        groups.setdefault(f.shape, list()).append(idx)
+
+    results: List[T] = [np.empty(0, dtype=np.float32)] * len(filters)
+    for indices in groups.values():
+        kernels = np.stack([filters[i] for i in indices])
+        for i, res in zip(indices, convolve_stack(M, kernels, backend), strict=True):
+            results[i] = res
     return results
 
 
+def convolution_2d(
+    M: Padded, filters: List[T2D], backend: str = "auto"
+) -> List[ImageGray]:
+    if not filters:
+        return [M.astype(np.float32)]
+
+    return _convolve_grouped(M, filters, backend)
+
+
 def apply_filters(
     channels: List[ImageGray],
     filters: List[T2D],
     pad_func: Callable[[ImageGray, int, int], Padded],
+    backend: str = "auto",
 ) -> List[ImageGray]:
-    final_results: List[ImageGray] = list()
-    for f, channel in product(filters, channels):
-        M_padded = pad_func(channel, 0, 0)
-        conv_res = convolution_2d(M_padded, [f])
-        final_results.extend(conv_res)
-    return final_results
+    if not channels or not filters:
+        return list()
+
+    padded: List[Padded] = [pad_func(channel, 0, 0) for channel in channels]
+    by_shape: Dict[Shape, List[int]] = dict()
+    for idx, m in enumerate(padded):
+        by_shape.setdefault(m.shape, list()).append(idx)
+
+    grid: List[List[ImageGray]] = [list(padded) for _ in filters]
+    for indices in by_shape.values():
+        stack = np.stack([padded[i] for i in indices])
+        for f_idx, per_filter in enumerate(_convolve_grouped(stack, filters, backend)):
+            for c_idx, res in zip(indices, per_filter, strict=True):
+                grid[f_idx][c_idx] = res
+
+    return [res for per_filter in grid for res in per_filter]
 
 
 @dataclass(frozen=True, slots=True)
 class ConvolutionActions(ConvolutionABC):
     geometry: ImageGeometryProtocol = field(default_factory=ImageGeometry)
+    backend: Literal["auto", "direct", "separable", "fft"] = "auto"
 
     def __post_init__(self) -> None:
         super().__post_init__()
@@ -50,11 +162,14 @@ class ConvolutionActions(ConvolutionABC):
     def convolution_2d(
         self, M: ImageGray, filters: List[T2D] = list()
     ) -> List[ImageGray]:
-        return convolution_2d(M, filters)
+        return convolution_2d(M, filters, self.backend)
 
     def apply_filters(
         self, channels: List[ImageGray], filters: List[T2D] = list()
     ) -> List[ImageGray]:
         return apply_filters(
-            channels=channels, filters=filters, pad_func=self.geometry.pad
+            channels=channels,
+            filters=filters,
+            pad_func=self.geometry.pad,
+            backend=self.backend,
         )
@@ -1,13 +1,17 @@
+import inspect
 import logging
 import math
-import random
 from functools import wraps
 from typing import (
     Any,
     Callable,
+    Dict,
     List,
     Literal,
+    Optional,
     ParamSpec,
+    Tuple,
+    TypeAlias,
     Union,
     cast,
     overload,
@@ -15,27 +19,118 @@ from typing import (
 
 import numpy as np
 
-from MyTorch import ClassType, ImageGray, JsonData, Shape, T
+from common_utils import RngContext, resolve_rng
+from MyTorch import ClassType, FillValue, ImageGray, JsonData, Shape, T
 
 P = ParamSpec("P")
+ArgLayout: TypeAlias = Dict[str, Optional[int]]
+ArgSlot: TypeAlias = Tuple[Optional[int], str]
 logger = logging.getLogger(__name__)
 
+VAR_KEYWORD = "**"
+MATRIX_NAMES = ("M", "matrix")
 
-def calculate_fill_color(M: ImageGray) -> int:
-    values, counts = np.unique(M, return_counts=True)
-    return int(values[np.argmax(counts)])
+
+def resolve_arg_layout(func: Callable) -> ArgLayout:
+    layout: ArgLayout = dict()
+    for pos, param in enumerate(inspect.signature(func).parameters.values()):
+        if param.kind == param.VAR_KEYWORD:
+            layout[VAR_KEYWORD] = None
+        elif param.kind == param.KEYWORD_ONLY:
+            layout[param.name] = None
+        elif param.kind != param.VAR_POSITIONAL:
+            layout[param.name] = pos
+    return layout
+
+
+def _accepts(layout: ArgLayout, name: str) -> bool:
+    return name in layout or VAR_KEYWORD in layout
+
+
+def _is_passed(pos: Optional[int], args: Tuple[Any, ...]) -> bool:
+    return pos is not None and pos < len(args)
+
+
+def _bound_arg(slot: ArgSlot, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    pos, name = slot
+    return args[cast(int, pos)] if _is_passed(pos, args) else kwargs.get(name)
+
+
+def _matrix_slot(layout: Optional[ArgLayout]) -> Optional[ArgSlot]:
+    if layout is None:
+        return None
+    name = next((n for n in MATRIX_NAMES if n in layout), None)
+    return (layout[name], name) if name is not None else None
+
+
+def _find_matrix(
+    args: Tuple[Any, ...], kwargs: Dict[str, Any], slot: Optional[ArgSlot]
+) -> ImageGray:
+    if slot is not None:
+        return cast(ImageGray, _bound_arg(slot, args, kwargs))
+
+    return next(
+        (arg for arg in args if isinstance(arg, np.ndarray)),
+        np.array([], dtype=np.float32),
+    )
+
+
+def _quantised_codes(M: ImageGray) -> Optional[ImageGray]:
+    if M.dtype == np.uint8:
+        return M
+    if M.size == 0 or M.dtype == np.bool_:
+        return None
+    if M.min() < 0 or M.max() > 255:
+        return None
+    if np.issubdtype(M.dtype, np.integer):
+        return M.astype(np.uint8)
+    codes = M.astype(np.uint8)
+    return codes if np.array_equal(codes, M) else None
+
+
+def _bincount_fill_colors(codes: ImageGray) -> FillValue:
+    flat = codes.reshape(-1, codes.shape[-2] * codes.shape[-1]).astype(np.intp)
+    offsets = (np.arange(flat.shape[0]) * 256)[:, np.newaxis]
+    counts = np.bincount((flat + offsets).ravel(), minlength=flat.shape[0] * 256)
+    modes = counts.reshape(-1, 256).argmax(axis=1)
+    return modes.astype(np.int64).reshape(codes.shape[:-2])
+
+
+def _sorted_fill_colors(M: ImageGray) -> FillValue:
+    flat = np.sort(M.reshape(-1, M.shape[-2] * M.shape[-1]), axis=1)
+    idx = np.arange(flat.shape[1])
+    is_run_start = np.ones(flat.shape, dtype=bool)
+    is_run_start[:, 1:] = flat[:, 1:] != flat[:, :-1]
+    run_start = np.maximum.accumulate(np.where(is_run_start, idx, 0), axis=1)
+    longest_run_end = np.argmax(idx - run_start, axis=1)
+    modes = flat[np.arange(flat.shape[0]), longest_run_end]
+    return modes.astype(np.int64).reshape(M.shape[:-2])
+
+
+def calculate_fill_colors(M: ImageGray) -> FillValue:
+    codes = _quantised_codes(M)
+    if codes is not None:
+        return _bincount_fill_colors(codes)
+    return _sorted_fill_colors(M)
+
+
+def calculate_fill_color(M: ImageGray) -> FillValue:
+    if M.ndim > 2:
+        return calculate_fill_colors(M)
+    return int(calculate_fill_colors(M[np.newaxis])[0])
 
 
 def calculate_rotation_params(
-    M: ImageGray, h: int, w: int, angle: float, fill: int
+    M: ImageGray, h: int, w: int, angle: float, fill: FillValue
 ) -> JsonData:
     rad = math.radians(angle)
+    fill_plane = np.asarray(fill)[..., np.newaxis, np.newaxis]
     return {
         "cos_a": math.cos(rad),
         "sin_a": math.sin(rad),
         "cx": w / 2.0,
         "cy": h / 2.0,
-        "new_matrix": np.full((h, w), fill, dtype=M.dtype),
+        "new_matrix": np.full(M.shape[:-2] + (h, w), fill_plane, dtype=M.dtype),
     }
 
 
@@ -50,60 +145,77 @@ def calculate_block_size(h: int, w: int) -> int:
     return max(3, b_size)
 
 
-def auto_fill_color(func: Callable[P, T]) -> Callable[P, T]:
+def auto_fill_color(
+    func: Callable[P, T], layout: Optional[ArgLayout] = None
+) -> Callable[P, T]:
+    if layout is not None and not _accepts(layout, "fill"):
+        return func
+    m_slot = _matrix_slot(layout)
+    fill_pos = layout.get("fill") if layout is not None else None
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        if "fill" not in kwargs:
-            m_input = next(
-                (arg for arg in args if isinstance(arg, np.ndarray)),
-                np.array([], dtype=np.float32),
-            )
-            kwargs["fill"] = calculate_fill_color(cast(ImageGray, m_input))
+        if "fill" not in kwargs and not _is_passed(fill_pos, args):
+            m_input = _find_matrix(args, kwargs, m_slot)
+            kwargs["fill"] = calculate_fill_color(m_input)
         return func(*args, **kwargs)
 
     return wrapper
 
 
-def with_dimensions(func: Callable[P, T]) -> Callable[P, T]:
+def with_dimensions(
+    func: Callable[P, T], layout: Optional[ArgLayout] = None
+) -> Callable[P, T]:
+    if layout is not None and not _accepts(layout, "h"):
+        return func
+    m_slot = _matrix_slot(layout)
+    h_pos = layout.get("h") if layout is not None else None
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        m_input = next(
-            (arg for arg in args if isinstance(arg, np.ndarray)),
-            np.array([], dtype=np.float32),
-        )
-        h, w = m_input.shape[:2]
+        if _is_passed(h_pos, args):
+            return func(*args, **kwargs)
+        m_input = _find_matrix(args, kwargs, m_slot)
+        h, w = m_input.shape[-2:]
         kwargs["h"], kwargs["w"] = int(h), int(w)
         return func(*args, **kwargs)
 
     return wrapper
 
 
+def _instance_rng(args: Tuple[Any, ...]) -> np.random.Generator:
+    rng = getattr(args[0], "rng", None) if args else None
+    return resolve_rng(rng if isinstance(rng, RngContext) else None)
+
+
 def prepare_angle(func: Callable[P, T]) -> Callable[P, T]:
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         is_right = bool(kwargs.get("is_right", True))
         low, high = get_angle_range(is_right)
         if "angle" not in kwargs:
-            kwargs["angle"] = float(random.randint(low, high))
+            generator = _instance_rng(args)
+            kwargs["angle"] = float(generator.integers(low, high + 1))
         return func(*args, **kwargs)
 
     return wrapper
 
 
-def prepare_values(func: Callable[P, T]) -> Callable[P, T]:
+def prepare_values(
+    func: Callable[P, T], layout: Optional[ArgLayout] = None
+) -> Callable[P, T]:
+    m_slot = _matrix_slot(layout)
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         h = int(cast(Any, kwargs.get("h", 0)))
         w = int(cast(Any, kwargs.get("w", 0)))
         angle = float(cast(Any, kwargs.get("angle", 0.0)))
-        fill = int(cast(Any, kwargs.get("fill", 0)))
+        fill = cast(FillValue, kwargs.get("fill", 0))
+        fill = fill if isinstance(fill, np.ndarray) else int(fill)
 
-        m_input = next(
-            (arg for arg in args if isinstance(arg, np.ndarray)),
-            np.array([], dtype=np.float32),
-        )
-
-        params = calculate_rotation_params(cast(ImageGray, m_input), h, w, angle, fill)
+        m_input = _find_matrix(args, kwargs, m_slot)
+        params = calculate_rotation_params(m_input, h, w, angle, fill)
 
         kwargs["params"] = cast(JsonData, params)
         kwargs["angle"] = angle
@@ -118,21 +230,33 @@ def get_number_repeats(func: Callable[P, T]) -> Callable[P, T]:
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         if "repeats" not in kwargs:
-            kwargs["repeats"] = cast(Any, random.randrange(2, 5))
+            kwargs["repeats"] = cast(Any, int(_instance_rng(args).integers(2, 5)))
         return func(*args, **kwargs)
 
     return wrapper
 
 
-def kernel_data_processing(func: Callable[P, T]) -> Callable[P, T]:
+def kernel_data_processing(
+    func: Callable[P, T], layout: Optional[ArgLayout] = None
+) -> Callable[P, T]:
+    if layout is not None and not _accepts(layout, "r"):
+        return func
+    k_slot: ArgSlot = (
+        layout.get("kernel_size") if layout is not None else None,
+        "kernel_size",
+    )
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        k_size = kwargs.get("kernel_size")
-        if k_size is None and args:
-            for arg in args:
-                if isinstance(arg, int):
-                    k_size = arg
-                    break
+        if layout is not None:
+            k_size = _bound_arg(k_slot, args, kwargs)
+        else:
+            k_size = kwargs.get("kernel_size")
+            if k_size is None and args:
+                for arg in args:
+                    if isinstance(arg, int):
+                        k_size = arg
+                        break
 
         if k_size is not None:
             r_val = (int(cast(Any, k_size)) - 1) // 2
@@ -143,16 +267,17 @@ def kernel_data_processing(func: Callable[P, T]) -> Callable[P, T]:
     return wrapper
 
 
-def parameter_complement(func: Callable[P, T]) -> Callable[P, T]:
+def parameter_complement(
+    func: Callable[P, T], layout: Optional[ArgLayout] = None
+) -> Callable[P, T]:
+    m_slot = _matrix_slot(layout)
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        m_input = next(
-            (arg for arg in args if isinstance(arg, np.ndarray)),
-            np.array([], dtype=np.float32),
-        )
+        m_input = _find_matrix(args, kwargs, m_slot)
 
         if bool(kwargs.get("auto_params", False)):
-            h, w = m_input.shape[:2]
+            h, w = m_input.shape[-2:]
             kwargs["block_size"] = cast(Any, calculate_block_size(int(h), int(w)))
             kwargs["c"] = cast(Any, 7)
 
@@ -161,6 +286,13 @@ def parameter_complement(func: Callable[P, T]) -> Callable[P, T]:
     return wrapper
 
 
+def _accepts_layout(decorator: Callable) -> bool:
+    try:
+        return "layout" in inspect.signature(decorator).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 @overload
 def apply_to_methods(
     decorators: Union[Callable, List[Callable]],
@@ -184,6 +316,7 @@ def apply_to_methods(
 ) -> Callable[[ClassType], ClassType]:
     decs = decorators if isinstance(decorators, list) else [decorators]
     exclude_names = exclude if isinstance(exclude, list) else [exclude]
+    compilable = [_accepts_layout(dec) for dec in decs]
 
     def class_rebuilder(cls: ClassType) -> ClassType:
         if method_names == "all":
@@ -206,9 +339,12 @@ def apply_to_methods(
                 is_static = isinstance(attr, staticmethod)
                 is_class = isinstance(attr, classmethod)
                 target = attr.__func__ if (is_static or is_class) else attr
+                layout = resolve_arg_layout(target)
 
-                for dec in reversed(decs):
-                    target = dec(target)
+                for dec, is_compilable in zip(
+                    reversed(decs), reversed(compilable), strict=True
+                ):
+                    target = dec(target, layout) if is_compilable else dec(target)
 
                 if is_static:
                     target = staticmethod(target)
@@ -226,6 +362,7 @@ __all__ = [
     "auto_fill_color",
     "calculate_block_size",
     "calculate_fill_color",
+    "calculate_fill_colors",
     "calculate_rotation_params",
     "get_angle_range",
     "get_number_repeats",
@@ -233,5 +370,6 @@ __all__ = [
     "parameter_complement",
     "prepare_angle",
     "prepare_values",
+    "resolve_arg_layout",
     "with_dimensions",
 ]
@@ -1,20 +1,46 @@
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
 
 import numpy as np
 
-from MyTorch import ImageGray, Padded, Shape
+from MyTorch import T2D, FillValue, ImageGray, Padded, Shape
 
 from .base import ImageGeometryABC
 
 
+def pad_spatial(
+    M: ImageGray,
+    pad_h: Tuple[int, int],
+    pad_w: Tuple[int, int],
+    fill: FillValue = 0,
+    mode: str = "constant",
+) -> Padded:
+    pad_width = ((0, 0),) * (M.ndim - 2) + (pad_h, pad_w)
+    if mode != "constant":
+        return np.pad(M, pad_width=pad_width, mode=mode).astype(np.float32)
+
+    fill_arr = np.asarray(fill, dtype=np.float32)
+    if fill_arr.ndim == 0:
+        return np.pad(
+            M, pad_width=pad_width, mode="constant", constant_values=float(fill_arr)
+        ).astype(np.float32)
+
+    h, w = M.shape[-2:]
+    padded: Padded = np.empty(
+        M.shape[:-2] + (h + sum(pad_h), w + sum(pad_w)), dtype=np.float32
+    )
+    padded[...] = fill_arr[..., np.newaxis, np.newaxis]
+    padded[..., pad_h[0] : pad_h[0] + h, pad_w[0] : pad_w[0] + w] = M
+    return padded
+
+
 def pad(M: ImageGray, pad_value: int, padding: int) -> Padded:
-    return np.pad(
-        M, pad_width=padding, mode="constant", constant_values=float(pad_value)
-    ).astype(np.float32)
+    return pad_spatial(M, (padding, padding), (padding, padding), pad_value)
 
 
 def _upscale_bilinear(M: ImageGray, target_size: Shape) -> ImageGray:
-    curr_h, curr_w = M.shape
+    curr_h, curr_w = M.shape[-2:]
     new_h, new_w = target_size
 
     if (curr_h, curr_w) == (new_h, new_w):
@@ -31,10 +57,10 @@ def _upscale_bilinear(M: ImageGray, target_size: Shape) -> ImageGray:
     y_weight = (y_coords - y_low)[:, np.newaxis]
     x_weight = (x_coords - x_low)[np.newaxis, :]
 
-    top_left = M[y_low][:, x_low]
-    top_right = M[y_low][:, x_high]
-    bottom_left = M[y_high][:, x_low]
-    bottom_right = M[y_high][:, x_high]
+    top_left = M[..., y_low, :][..., x_low]
+    top_right = M[..., y_low, :][..., x_high]
+    bottom_left = M[..., y_high, :][..., x_low]
+    bottom_right = M[..., y_high, :][..., x_high]
 
     top_row_mixed = top_left * (1.0 - x_weight) + top_right * x_weight
     bottom_row_mixed = bottom_left * (1.0 - x_weight) + bottom_right * x_weight
@@ -45,26 +71,26 @@ def _upscale_bilinear(M: ImageGray, target_size: Shape) -> ImageGray:
 
 
 def _downscale_vectorized(M: ImageGray, target_size: Shape) -> ImageGray:
-    curr_h, curr_w = M.shape
+    curr_h, curr_w = M.shape[-2:]
     new_h, new_w = target_size
     h_f, w_f = curr_h // new_h, curr_w // new_w
 
     if h_f >= 1 and w_f >= 1:
         return (
-            M[: new_h * h_f, : new_w * w_f]
-            .reshape(new_h, h_f, new_w, w_f)
-            .mean(axis=(1, 3))
+            M[..., : new_h * h_f, : new_w * w_f]
+            .reshape(M.shape[:-2] + (new_h, h_f, new_w, w_f))
+            .mean(axis=(-3, -1))
             .astype(np.float32)
         )
 
-    res = np.zeros((new_h, new_w), dtype=np.float32)
+    res = np.zeros(M.shape[:-2] + (new_h, new_w), dtype=np.float32)
     h_end, w_end = min(curr_h, new_h), min(curr_w, new_w)
-    res[:h_end, :w_end] = M[:h_end, :w_end]
+    res[..., :h_end, :w_end] = M[..., :h_end, :w_end]
     return res.astype(np.float32)
 
 
 def resize(M: ImageGray, new_size: Shape) -> ImageGray:
-    curr_h, curr_w = M.shape
+    curr_h, curr_w = M.shape[-2:]
     new_h, new_w = new_size
 
     if (curr_h, curr_w) == (new_h, new_w):
@@ -76,6 +102,46 @@ def resize(M: ImageGray, new_size: Shape) -> ImageGray:
     return _downscale_vectorized(M, (new_h, new_w))
 
 
+def _bilinear_operator(curr: int, new: int) -> T2D:
+    coords = np.linspace(0, curr - 1, new)
+    low = np.floor(coords).astype(int)
+    high = np.clip(np.ceil(coords).astype(int), 0, curr - 1)
+    weight = coords - low
+
+    operator = np.zeros((new, curr), dtype=np.float64)
+    np.add.at(operator, (np.arange(new), low), 1.0 - weight)
+    np.add.at(operator, (np.arange(new), high), weight)
+    return operator
+
+
+def _block_mean_operator(curr: int, new: int) -> T2D:
+    factor: int = curr // new
+    operator = np.zeros((new, curr), dtype=np.float64)
+    rows = np.repeat(np.arange(new), factor)
+    operator[rows, np.arange(new * factor)] = 1.0 / factor
+    return operator
+
+
+@lru_cache(maxsize=32)
+def resize_operators(curr_size: Shape, new_size: Shape) -> Tuple[T2D, T2D]:
+    (curr_h, curr_w), (new_h, new_w) = curr_size, new_size
+
+    if (curr_h, curr_w) == (new_h, new_w):
+        row_op, col_op = np.eye(new_h), np.eye(new_w)
+    elif curr_h < new_h or curr_w < new_w:
+        row_op = _bilinear_operator(curr_h, new_h)
+        col_op = _bilinear_operator(curr_w, new_w)
+    else:
+        row_op = _block_mean_operator(curr_h, new_h)
+        col_op = _block_mean_operator(curr_w, new_w)
+
+    row_op = row_op.astype(np.float32)
+    col_op_t = np.ascontiguousarray(col_op.T, dtype=np.float32)
+    row_op.setflags(write=False)
+    col_op_t.setflags(write=False)
+    return row_op, col_op_t
+
+
 def prepare_standard_geometry_logic(
     M: ImageGray, target_size: Shape, padding: int, pad_value: int
 ) -> Padded:
@@ -83,9 +149,7 @@ def prepare_standard_geometry_logic(
     inner_w: int = int(target_size[1] - 2 * padding)
 
     resized = resize(M, (inner_h, inner_w))
-    return np.pad(
-        resized, pad_width=padding, mode="constant", constant_values=float(pad_value)
-    ).astype(np.float32)
+    return pad_spatial(resized, (padding, padding), (padding, padding), pad_value)
 
 
 @dataclass(frozen=True, slots=True)
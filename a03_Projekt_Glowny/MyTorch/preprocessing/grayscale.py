@@ -9,26 +9,34 @@ from .base import GrayScaleABC
 
 
 @overload
-def convert_color_space(M: ImageRGB, to_gray: Literal[True]) -> ImageGray: ...
+def convert_color_space(
+    M: ImageRGB, to_gray: Literal[True], batched: bool = False
+) -> ImageGray: ...
 
 
 @overload
-def convert_color_space(M: ImageGray, to_gray: Literal[False]) -> ImageRGB: ...
+def convert_color_space(
+    M: ImageGray, to_gray: Literal[False], batched: bool = False
+) -> ImageRGB: ...
 
 
 def convert_color_space(
-    M: Union[ImageGray, ImageRGB], to_gray: bool = True
+    M: Union[ImageGray, ImageRGB], to_gray: bool = True, batched: bool = False
 ) -> Union[ImageGray, ImageRGB]:
+    is_color: bool = M.ndim > (3 if batched else 2)
+
     if to_gray:
-        if M.ndim == 2:
+        if not is_color:
             return M.astype(np.float32)
+        if M.shape[-3] == 1:
+            return M[..., 0, :, :].astype(np.float32)
         weights = np.array([0.299, 0.587, 0.114], dtype=np.float32)
-        return np.dot(M.transpose(1, 2, 0), weights).astype(np.float32)
+        return np.dot(np.moveaxis(M, -3, -1), weights).astype(np.float32)
 
-    if M.ndim == 3:
+    if is_color:
         return M.astype(np.float32)
 
-    return np.stack([M] * 3, axis=0).astype(np.float32)
+    return np.stack([M] * 3, axis=-3).astype(np.float32)
 
 
 @dataclass(frozen=True, slots=True)
@@ -37,6 +45,6 @@ class GrayScaleProcessing(GrayScaleABC):
         super().__post_init__()
 
     def convert_color_space(
-        self, M: Union[ImageGray, ImageRGB], to_gray: bool = True
+        self, M: Union[ImageGray, ImageRGB], to_gray: bool = True, batched: bool = False
     ) -> Union[ImageGray, ImageRGB]:
-        return convert_color_space(M, to_gray=to_gray)
+        return convert_color_space(M, to_gray=to_gray, batched=batched)
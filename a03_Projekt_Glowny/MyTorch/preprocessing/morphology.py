@@ -0,0 +1,52 @@
+from typing import Callable, Optional
+
+import numpy as np
+
+from MyTorch import FillValue, ImageGray
+
+from .geometry import pad_spatial
+
+
+def running_extremum(
+    M: ImageGray, size: int, op_func: Callable, axis: int
+) -> ImageGray:
+    moved = np.moveaxis(M, axis, -1)
+    length: int = moved.shape[-1]
+    n_out: int = length - size + 1
+    n_blocks: int = -(-length // size)
+
+    identity = -np.inf if op_func is np.maximum else np.inf
+    extended = np.full(
+        moved.shape[:-1] + (n_blocks * size,), identity, dtype=np.float32
+    )
+    extended[..., :length] = moved
+    blocks = extended.reshape(moved.shape[:-1] + (n_blocks, size))
+
+    forward = op_func.accumulate(blocks, axis=-1).reshape(extended.shape)
+    backward = op_func.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    backward = backward.reshape(extended.shape)
+
+    result = op_func(backward[..., :n_out], forward[..., size - 1 : size - 1 + n_out])
+    return np.moveaxis(result, -1, axis)
+
+
+def separable_morphology(
+    M: ImageGray,
+    kernel_size: int,
+    op_func: Callable,
+    pad_value: FillValue = 0,
+    out: Optional[ImageGray] = None,
+) -> ImageGray:
+    pad_before: int = (kernel_size - 1) // 2
+    pad_after: int = kernel_size // 2
+    padded = pad_spatial(
+        M, (pad_before, pad_after), (pad_before, pad_after), fill=pad_value
+    )
+
+    rows = running_extremum(padded, kernel_size, op_func, axis=-1)
+    result = running_extremum(rows, kernel_size, op_func, axis=-2)
+
+    if out is None:
+        return result.astype(np.float32)
+    np.copyto(out, result)
+    return out
@@ -20,8 +20,9 @@ def normalize(
 
 
 def z_score_normalization(M: ImageGray, eps: float = 1e-8) -> ImageGray:
-    mean_val: float = float(np.mean(M))
-    std_val: float = float(np.std(M))
+    axes = (-2, -1) if M.ndim >= 2 else None
+    mean_val = np.mean(M, axis=axes, keepdims=True)
+    std_val = np.std(M, axis=axes, keepdims=True)
     result = (M - mean_val) / (std_val + eps)
     return result.astype(np.float32)
 
@@ -1,26 +1,32 @@
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 import numpy as np
 
-from MyTorch import FilePath, ImageGray, ImageRGB, Shape
-from preprocessing import (
-    ConvolutionActions,
-    DataAugmentation,
-    GrayScaleProcessing,
-    ImageGeometry,
-    ImageHandler,
-    ImageToMatrixConverter,
-    Normalization,
-    Pooling,
-    Thresholding,
-    TransformPipeline,
+from MyTorch import (
+    T2D,
+    FilePath,
+    ImageBatch,
+    ImageGray,
+    ImageRGB,
+    ImageRGBBatch,
+    Shape,
 )
 
-from .base import ImageDataPreprocessingABC, TransformPipelineABC
+from .augmentation import DataAugmentation
+from .base import ExecutionPlanABC, ImageDataPreprocessingABC, TransformPipelineABC
+from .conversion import ImageToMatrixConverter
+from .convolution import ConvolutionActions
+from .geometry import ImageGeometry, resize_operators
+from .grayscale import GrayScaleProcessing
+from .io_image import ImageHandler
+from .normalization import Normalization
+from .pooling import Pooling
 from .protocols import (
     ConvolutionProtocol,
     DataAugmentationProtocol,
+    ExecutionPlanProtocol,
     GrayScaleProtocol,
     ImageConverterProtocol,
     ImageGeometryProtocol,
@@ -30,6 +36,7 @@ from .protocols import (
     ThresholdingProtocol,
     TransformPipelineProtocol,
 )
+from .thresholding import Thresholding
 
 
 def apply_pipeline_logic(
@@ -41,8 +48,149 @@ def apply_pipeline_logic(
 ) -> List[ImageGray]:
     x_gray: ImageGray = grayscale_func(matrix)
     x_geom: ImageGray = geometry_func(x_gray, (28, 28))
-    augmented_samples: List[ImageGray] = augment_func(x_geom)
-    return [normalize_func(sample) for sample in augmented_samples]
+    if x_geom.ndim == 2:
+        augmented_samples: List[ImageGray] = augment_func(x_geom)
+        return [normalize_func(sample) for sample in augmented_samples]
+
+    augmented_samples = [aug for sample in x_geom for aug in augment_func(sample)]
+    if not augmented_samples:
+        return []
+    return list(normalize_func(np.stack(augmented_samples)))
+
+
+def grayscale_into(
+    M: ImageRGB, out: ImageGray, scratch: ImageGray, is_color: bool
+) -> ImageGray:
+    if not is_color:
+        np.copyto(out, M)
+        return out
+
+    weights = (0.299, 0.587, 0.114)
+    np.multiply(M[..., 0, :, :], weights[0], out=out)
+    for channel, weight in enumerate(weights[1:], start=1):
+        np.multiply(M[..., channel, :, :], weight, out=scratch)
+        np.add(out, scratch, out=out)
+    return out
+
+
+def resize_into(
+    M: ImageGray, row_op: T2D, col_op_t: T2D, out: ImageGray, scratch: ImageGray
+) -> ImageGray:
+    np.matmul(row_op, M, out=scratch)
+    np.matmul(scratch, col_op_t, out=out)
+    return out
+
+
+def stack_into(samples: List[ImageGray], out: ImageBatch) -> ImageBatch:
+    return np.stack(samples, out=out[: len(samples)])
+
+
+def z_score_inplace(M: ImageBatch, eps: float = 1e-8) -> ImageBatch:
+    M -= M.mean(axis=(-2, -1), keepdims=True)
+    M /= M.std(axis=(-2, -1), keepdims=True) + eps
+    return M
+
+
+def run_plan_logic(
+    matrix: ImageRGB,
+    grayscale_func: Callable[[ImageRGB], ImageGray],
+    geometry_func: Callable[[ImageGray], ImageGray],
+    augment_func: Callable[[ImageGray], List[ImageGray]],
+    stack_func: Callable[[List[ImageGray]], ImageBatch],
+) -> List[ImageGray]:
+    x_geom: ImageGray = geometry_func(grayscale_func(matrix))
+    samples = x_geom[np.newaxis] if x_geom.ndim == 2 else x_geom
+
+    augmented_samples = [aug for sample in samples for aug in augment_func(sample)]
+    if not augmented_samples:
+        return []
+    return list(z_score_inplace(stack_func(augmented_samples)).copy())
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionPlan(ExecutionPlanABC):
+    input_shape: Shape
+    target_size: Shape = (28, 28)
+    padding: int = 2
+    pad_value: int = 0
+    batched: bool = False
+    is_color: bool = field(init=False, repr=False)
+    gray: ImageGray = field(init=False, repr=False)
+    channel_scratch: ImageGray = field(init=False, repr=False)
+    resize_scratch: ImageGray = field(init=False, repr=False)
+    geometry: ImageGray = field(init=False, repr=False)
+    stack_buffer: ImageBatch = field(init=False, repr=False)
+    inner_region: Tuple[slice, slice] = field(init=False, repr=False)
+    row_op: T2D = field(init=False, repr=False)
+    col_op_t: T2D = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        shape: Shape = tuple(self.input_shape)
+        is_color: bool = len(shape) > (3 if self.batched else 2)
+        gray_shape: Shape = shape[:-3] + shape[-2:] if is_color else shape
+
+        inner_h: int = int(self.target_size[0] - 2 * self.padding)
+        inner_w: int = int(self.target_size[1] - 2 * self.padding)
+        row_op, col_op_t = resize_operators(gray_shape[-2:], (inner_h, inner_w))
+
+        geometry = np.full(
+            gray_shape[:-2] + tuple(self.target_size), self.pad_value, np.float32
+        )
+        inner_rows = slice(self.padding, self.padding + inner_h)
+        inner_cols = slice(self.padding, self.padding + inner_w)
+        scratch_shape: Shape = gray_shape[:-2] + (inner_h, gray_shape[-1])
+
+        object.__setattr__(self, "is_color", is_color)
+        object.__setattr__(self, "gray", np.empty(gray_shape, dtype=np.float32))
+        object.__setattr__(
+            self, "channel_scratch", np.empty(gray_shape, dtype=np.float32)
+        )
+        object.__setattr__(
+            self, "resize_scratch", np.empty(scratch_shape, dtype=np.float32)
+        )
+        object.__setattr__(self, "geometry", geometry)
+        object.__setattr__(
+            self,
+            "stack_buffer",
+            np.empty((0,) + tuple(self.target_size), dtype=np.float32),
+        )
+        object.__setattr__(self, "inner_region", (inner_rows, inner_cols))
+        object.__setattr__(self, "row_op", row_op)
+        object.__setattr__(self, "col_op_t", col_op_t)
+
+    def run(
+        self, matrix: ImageRGB, augment_func: Callable[[ImageGray], List[ImageGray]]
+    ) -> List[ImageGray]:
+        if matrix.shape != tuple(self.input_shape):
+            raise ValueError(
+                f"Plan compiled for {tuple(self.input_shape)}, got {matrix.shape}"
+            )
+
+        return run_plan_logic(
+            matrix=matrix,
+            grayscale_func=self._grayscale,
+            geometry_func=self._geometry,
+            augment_func=augment_func,
+            stack_func=self._stack,
+        )
+
+    def _stack(self, samples: List[ImageGray]) -> ImageBatch:
+        shape: Shape = (len(samples),) + samples[0].shape
+        if (
+            len(self.stack_buffer) < shape[0]
+            or self.stack_buffer.shape[1:] != shape[1:]
+        ):
+            object.__setattr__(self, "stack_buffer", np.empty(shape, dtype=np.float32))
+        return stack_into(samples, self.stack_buffer)
+
+    def _grayscale(self, M: ImageRGB) -> ImageGray:
+        return grayscale_into(M, self.gray, self.channel_scratch, self.is_color)
+
+    def _geometry(self, M: ImageGray) -> ImageGray:
+        inner: ImageGray = self.geometry[(Ellipsis,) + self.inner_region]
+        resize_into(M, self.row_op, self.col_op_t, inner, self.resize_scratch)
+        return self.geometry
 
 
 def preprocess_logic(
@@ -51,6 +199,24 @@ def preprocess_logic(
     return [apply_func(ch) for ch in channels]
 
 
+def preprocess_stack_logic(
+    channels: ImageBatch, apply_func: Callable[[ImageRGBBatch], List[ImageGray]]
+) -> List[ImageGray]:
+    matrix_rgb: ImageRGBBatch = np.stack([channels] * 3, axis=1).astype(np.float32)
+    return apply_func(matrix_rgb)
+
+
+STOCK_COMPONENTS: Tuple[Tuple[str, type], ...] = (
+    ("grayscale", GrayScaleProcessing),
+    ("geometry", ImageGeometry),
+    ("normalization", Normalization),
+)
+
+
+def stock_components_logic(pipeline: TransformPipelineABC) -> bool:
+    return all(type(getattr(pipeline, name)) is cls for name, cls in STOCK_COMPONENTS)
+
+
 @dataclass(frozen=True, slots=True)
 class TransformPipeline(TransformPipelineABC):
     geometry: ImageGeometryProtocol = field(default_factory=ImageGeometry, repr=False)
@@ -69,14 +235,38 @@ class TransformPipeline(TransformPipelineABC):
         default_factory=DataAugmentation, repr=False
     )
 
+    compiled: bool = True
+    max_plans: int = 8
+    _plans: "OrderedDict[Tuple[Shape, bool], ExecutionPlanProtocol]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
     def __post_init__(self) -> None:
         super().__post_init__()
 
-    def apply(self, matrix: ImageRGB) -> List[ImageGray]:
+    def compile(
+        self, input_shape: Shape, batched: bool = False
+    ) -> ExecutionPlanProtocol:
+        key: Tuple[Shape, bool] = (tuple(input_shape), batched)
+        if key in self._plans:
+            self._plans.move_to_end(key)
+            return self._plans[key]
+
+        self.logger.debug(f"Compiling execution plan for input shape {key[0]}")
+        self._plans[key] = ExecutionPlan(input_shape=key[0], batched=batched)
+        while len(self._plans) > max(self.max_plans, 1):
+            self._plans.popitem(last=False)
+        return self._plans[key]
+
+    def apply(self, matrix: ImageRGB, batched: bool = False) -> List[ImageGray]:
+        if self.compiled and stock_components_logic(self):
+            plan: ExecutionPlanProtocol = self.compile(matrix.shape, batched=batched)
+            return plan.run(matrix, self.augmentation.augment)
+
         return apply_pipeline_logic(
             matrix=matrix,
             grayscale_func=lambda m: self.grayscale.convert_color_space(
-                m, to_gray=True
+                m, to_gray=True, batched=batched
             ),
             geometry_func=lambda m, s: self.geometry.prepare_standard_geometry(
                 m, target_size=s
@@ -98,10 +288,19 @@ class ImageDataPreprocessing(ImageDataPreprocessingABC):
         super().__post_init__()
 
     def preprocess(self, path: FilePath) -> List[List[ImageGray]]:
-        channels: List[ImageGray] = self.converter.get_channels_from_file(path)
+        channels: List[ImageGray] = self.load_channels(path)
 
         def _apply_pipeline(ch: ImageGray) -> List[ImageGray]:
             matrix_rgb: ImageRGB = np.stack([ch] * 3, axis=0).astype(np.float32)
             return self.pipeline.apply(matrix_rgb)
 
         return preprocess_logic(channels=channels, apply_func=_apply_pipeline)
+
+    def load_channels(self, path: FilePath) -> List[ImageGray]:
+        return self.converter.get_channels_from_file(path)
+
+    def preprocess_channels(self, channels: ImageBatch) -> List[ImageGray]:
+        return preprocess_stack_logic(
+            channels=channels,
+            apply_func=lambda m: self.pipeline.apply(m, batched=True),
+        )
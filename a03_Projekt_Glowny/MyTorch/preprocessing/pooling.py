@@ -6,6 +6,7 @@ from numpy.lib.stride_tricks import sliding_window_view
 from MyTorch import ImageGray, Shape
 
 from .base import PoolingABC
+from .geometry import pad_spatial
 
 
 def max_pool_logic(
@@ -17,16 +18,13 @@ def max_pool_logic(
 ) -> ImageGray:
     m_np: ImageGray = matrix.astype(np.float32)
     if pad_width > 0:
-        m_np = np.pad(
-            m_np,
-            pad_width=pad_width,
-            mode="constant",
-            constant_values=float(pad_values),
-        ).astype(np.float32)
+        m_np = pad_spatial(
+            m_np, (pad_width, pad_width), (pad_width, pad_width), fill=pad_values
+        )
 
-    windows = sliding_window_view(m_np, window_shape=kernel_size)
-    view = windows[::stride, ::stride]
-    result: ImageGray = np.max(view, axis=(2, 3)).astype(np.float32)
+    windows = sliding_window_view(m_np, window_shape=kernel_size, axis=(-2, -1))
+    view = windows[..., ::stride, ::stride, :, :]
+    result: ImageGray = np.max(view, axis=(-2, -1)).astype(np.float32)
     return result
 
 
@@ -1,6 +1,27 @@
-from typing import List, Literal, Protocol, Tuple, Union, overload
-
-from MyTorch import T2D, FilePath, ImageGray, ImageRGB, JsonData, Padded, Shape
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+    overload,
+)
+
+from common_utils import RngContext
+from MyTorch import (
+    T1D,
+    T2D,
+    FilePath,
+    FillValue,
+    ImageBatch,
+    ImageGray,
+    ImageRGB,
+    Padded,
+    Shape,
+)
 
 
 class DataAugmentationProtocol(Protocol):
@@ -21,9 +42,9 @@ class GeometryAugmentationProtocol(Protocol):
         M: ImageGray,
         h: int,
         w: int,
-        params: JsonData,
         angle: float = 0.0,
-        fill: int = 0,
+        fill: FillValue = 0,
+        is_right: bool = True,
     ) -> ImageGray: ...
 
     def random_shift(
@@ -31,32 +52,51 @@ class GeometryAugmentationProtocol(Protocol):
         M: ImageGray,
         h: int,
         w: int,
-        fill: int = 0,
+        fill: FillValue = 0,
         is_right: bool = True,
     ) -> ImageGray: ...
 
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]: ...
+
 
 class ParameterProviderProtocol(Protocol):
-    def get_value(self) -> float: ...
+    def get_value(self, rng: Optional[RngContext] = None) -> float: ...
+
+    def get_values(self, n: int, rng: Optional[RngContext] = None) -> T1D: ...
 
 
 class NoiseAugmentationProtocol(Protocol):
+    std_provider: ParameterProviderProtocol
+    prob_provider: ParameterProviderProtocol
+
     def gaussian_noise(self, M: ImageGray, std: float = 0.0) -> ImageGray: ...
 
     def salt_and_pepper(self, M: ImageGray, prob: float = 0.0) -> ImageGray: ...
 
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]: ...
+
 
 class MorphologyAugmentationProtocol(Protocol):
     def dilate(self, M: ImageGray, kernel_size: int) -> ImageGray: ...
 
-    def erode(self, M: ImageGray, kernel_size: int, fill: int = 0) -> ImageGray: ...
+    def erode(
+        self, M: ImageGray, kernel_size: int, fill: FillValue = 0
+    ) -> ImageGray: ...
 
     def get_boundaries(self, M: ImageGray, kernel_size: int = 2) -> ImageGray: ...
 
     def morphology_filter(
-        self, M: ImageGray, kernel_size: int, fill: int = 0, mode: str = "open"
+        self, M: ImageGray, kernel_size: int, fill: FillValue = 0, mode: str = "open"
     ) -> ImageGray: ...
 
+    def batch_operations(
+        self, rng: Optional[RngContext] = None
+    ) -> Dict[str, Callable[[ImageBatch], ImageBatch]]: ...
+
 
 class ImageConverterProtocol(Protocol):
     def get_channels_from_file(self, path: FilePath) -> List[ImageGray]: ...
@@ -83,16 +123,16 @@ class ImageGeometryProtocol(Protocol):
 class GrayScaleProtocol(Protocol):
     @overload
     def convert_color_space(
-        self, M: ImageRGB, to_gray: Literal[True] = True
+        self, M: ImageRGB, to_gray: Literal[True] = True, batched: bool = False
     ) -> ImageGray: ...
 
     @overload
     def convert_color_space(
-        self, M: ImageGray, to_gray: Literal[False]
+        self, M: ImageGray, to_gray: Literal[False], batched: bool = False
     ) -> ImageRGB: ...
 
     def convert_color_space(
-        self, M: Union[ImageGray, ImageRGB], to_gray: bool = True
+        self, M: Union[ImageGray, ImageRGB], to_gray: bool = True, batched: bool = False
     ) -> Union[ImageGray, ImageRGB]: ...
 
 
@@ -153,13 +193,27 @@ class NormalizationProtocol(Protocol):
     ) -> ImageGray: ...
 
 
+class ExecutionPlanProtocol(Protocol):
+    def run(
+        self, matrix: ImageRGB, augment_func: Callable[[ImageGray], List[ImageGray]]
+    ) -> List[ImageGray]: ...
+
+
 class TransformPipelineProtocol(Protocol):
-    def apply(self, matrix: ImageRGB) -> List[ImageGray]: ...
+    def apply(self, matrix: ImageRGB, batched: bool = False) -> List[ImageGray]: ...
+
+    def compile(
+        self, input_shape: Shape, batched: bool = False
+    ) -> ExecutionPlanProtocol: ...
 
 
 class ImageDataPreprocessingProtocol(Protocol):
     def preprocess(self, path: FilePath) -> List[List[ImageGray]]: ...
 
+    def load_channels(self, path: FilePath) -> List[ImageGray]: ...
+
+    def preprocess_channels(self, channels: ImageBatch) -> List[ImageGray]: ...
+
 
 class PoolingProtocol(Protocol):
     def max_pool(
@@ -194,3 +248,13 @@ class ThresholdingProtocol(Protocol):
         c: int = 2,
         auto_params: bool = True,
     ) -> ImageGray: ...
+
+
+class WarpEngineProtocol(Protocol):
+    def rotate(
+        self,
+        M: Union[ImageGray, ImageBatch],
+        angles: Union[float, T1D],
+        fill: FillValue = 0,
+        out: Optional[Union[ImageGray, ImageBatch]] = None,
+    ) -> Union[ImageGray, ImageBatch]: ...
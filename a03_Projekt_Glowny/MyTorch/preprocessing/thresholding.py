@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Literal
 
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
@@ -6,7 +7,8 @@ from numpy.lib.stride_tricks import sliding_window_view
 from MyTorch import T2D, ImageGray
 
 from .base import ThresholdingABC
-from .decorators import parameter_complement
+from .decorators import apply_to_methods, parameter_complement
+from .geometry import pad_spatial
 
 
 def generate_gaussian_kernel(size: int) -> T2D:
@@ -18,22 +20,75 @@ def adaptive_threshold_logic(
     matrix: ImageGray, block_size: int, c: int, kernel: T2D
 ) -> ImageGray:
     pad_size: int = block_size // 2
-    padded = np.pad(matrix, pad_width=pad_size, mode="reflect")
-    windows = sliding_window_view(padded, (block_size, block_size))
+    padded = pad_spatial(
+        matrix, (pad_size, pad_size), (pad_size, pad_size), mode="reflect"
+    )
+    windows = sliding_window_view(padded, (block_size, block_size), axis=(-2, -1))
 
     kernel_sum: float = float(np.sum(kernel))
-    local_means = np.sum(windows * kernel, axis=(2, 3)) / kernel_sum
+    local_means = np.sum(windows * kernel, axis=(-2, -1)) / kernel_sum
 
     result = np.where(matrix > (local_means - c), 255.0, 0.0).astype(np.float32)
     return result
 
 
+def running_sum(M: ImageGray, size: int, axis: int) -> ImageGray:
+    cumulative = np.cumsum(M, axis=axis, dtype=np.float64)
+    cumulative = np.moveaxis(cumulative, axis, -1)
+    zeros = np.zeros(cumulative.shape[:-1] + (1,), dtype=np.float64)
+    cumulative = np.concatenate([zeros, cumulative], axis=-1)
+    window_sums = cumulative[..., size:] - cumulative[..., :-size]
+    return np.moveaxis(window_sums, -1, axis)
+
+
+def integral_image(M: ImageGray) -> ImageGray:
+    table = np.zeros(M.shape[:-2] + (M.shape[-2] + 1, M.shape[-1] + 1))
+    np.cumsum(np.cumsum(M, axis=-2, dtype=np.float64), axis=-1, out=table[..., 1:, 1:])
+    return table
+
+
+def box_sum(table: ImageGray, size: int) -> ImageGray:
+    return (
+        table[..., size:, size:]
+        - table[..., :-size, size:]
+        - table[..., size:, :-size]
+        + table[..., :-size, :-size]
+    )
+
+
+def adaptive_threshold_integral_logic(
+    matrix: ImageGray,
+    block_size: int,
+    c: int,
+    weighting: Literal["triangle", "box"] = "triangle",
+) -> ImageGray:
+    pad_size: int = block_size // 2
+    padded = pad_spatial(
+        matrix, (pad_size, pad_size), (pad_size, pad_size), mode="reflect"
+    )
+
+    if weighting == "box":
+        size = 2 * pad_size + 1
+        local_means = box_sum(integral_image(padded), size) / (size * size)
+    else:
+        size = pad_size + 1
+        smoothed = padded
+        for axis in (-2, -1):
+            smoothed = running_sum(running_sum(smoothed, size, axis), size, axis)
+        local_means = smoothed / float(size**4)
+
+    result = np.where(matrix > (local_means - c), 255.0, 0.0).astype(np.float32)
+    return result
+
+
+@apply_to_methods(parameter_complement, "adaptive_threshold")
 @dataclass(frozen=True, slots=True)
 class Thresholding(ThresholdingABC):
+    mode: Literal["integral", "window"] = "integral"
+
     def __post_init__(self) -> None:
         super().__post_init__()
 
-    @parameter_complement
     def adaptive_threshold(
         self,
         matrix: ImageGray,
@@ -41,6 +96,11 @@ class Thresholding(ThresholdingABC):
         c: int = 2,
         auto_params: bool = True,
     ) -> ImageGray:
+        if self.mode == "integral":
+            return adaptive_threshold_integral_logic(
+                matrix=matrix, block_size=block_size, c=c
+            )
+
         pad_size: int = block_size // 2
         kernel: T2D = generate_gaussian_kernel(pad_size + 1)
         return adaptive_threshold_logic(
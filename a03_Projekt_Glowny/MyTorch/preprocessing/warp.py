@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal, Optional, Tuple, Union
+
+import numpy as np
+
+from MyTorch import T1D, FillValue, ImageBatch, ImageGray
+
+from .base import WarpABC
+
+
+@lru_cache(maxsize=32)
+def get_base_grid(h: int, w: int) -> Tuple[ImageGray, ImageGray]:
+    y_idx, x_idx = np.indices((h, w), dtype=np.float64)
+    tx, ty = x_idx - w / 2.0, y_idx - h / 2.0
+    tx.setflags(write=False)
+    ty.setflags(write=False)
+    return tx, ty
+
+
+def rotation_source_coords(
+    angles: T1D, h: int, w: int
+) -> Tuple[ImageBatch, ImageBatch]:
+    tx, ty = get_base_grid(h, w)
+    rad = np.radians(angles.astype(np.float64))[:, np.newaxis, np.newaxis]
+    cos_a, sin_a = np.cos(rad), np.sin(rad)
+    xf = tx * cos_a + ty * sin_a + w / 2.0
+    yf = -tx * sin_a + ty * cos_a + h / 2.0
+    return xf, yf
+
+
+def warp_rotate(
+    M: Union[ImageGray, ImageBatch],
+    angles: Union[float, T1D],
+    fill: FillValue = 0,
+    mode: Literal["nearest", "bilinear"] = "nearest",
+    out: Optional[Union[ImageGray, ImageBatch]] = None,
+) -> Union[ImageGray, ImageBatch]:
+    h, w = M.shape[-2:]
+    src = np.ascontiguousarray(M, dtype=np.float32).reshape(-1, h, w)
+    n = src.shape[0]
+
+    angle_arr = np.broadcast_to(np.asarray(angles, dtype=np.float32), (n,))
+    xf, yf = rotation_source_coords(angle_arr, h, w)
+    mask = (xf >= 0) & (xf < w - 1) & (yf >= 0) & (yf < h - 1)
+
+    x0 = np.clip(np.floor(xf), 0, w - 2).astype(np.intp)
+    y0 = np.clip(np.floor(yf), 0, h - 2).astype(np.intp)
+    idx = (np.arange(n) * h * w)[:, np.newaxis, np.newaxis] + y0 * w + x0
+    flat = src.reshape(-1)
+
+    result = np.empty(M.shape, dtype=np.float32) if out is None else out
+    dst = result.reshape(n, h, w)
+
+    if mode == "bilinear":
+        wx = (xf - x0).astype(np.float32)
+        wy = (yf - y0).astype(np.float32)
+        top = flat[idx] + wx * (flat[idx + 1] - flat[idx])
+        bottom = flat[idx + w] + wx * (flat[idx + w + 1] - flat[idx + w])
+        np.add(top, wy * (bottom - top), out=dst)
+    else:
+        np.take(flat, idx, out=dst)
+
+    fill_plane = np.asarray(fill, dtype=np.float32).reshape(-1, 1, 1)
+    np.copyto(dst, np.broadcast_to(fill_plane, dst.shape), where=~mask)
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class WarpEngine(WarpABC):
+    mode: Literal["nearest", "bilinear"] = "nearest"
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+    def rotate(
+        self,
+        M: Union[ImageGray, ImageBatch],
+        angles: Union[float, T1D],
+        fill: FillValue = 0,
+        out: Optional[Union[ImageGray, ImageBatch]] = None,
+    ) -> Union[ImageGray, ImageBatch]:
+        return warp_rotate(M, angles, fill, self.mode, out)
@@ -67,3 +67,76 @@ def mock_dataset_data() -> list[np.ndarray]:
         f"[fixture:mock_dataset_data] Prepared {len(data)} matrices."
     )
     return data
+
+
+################# downloader
+@pytest.fixture(scope="function")
+def image_payload_server(request):
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    items = [np.full((4, 4, 3), i, dtype=np.uint8).tolist() for i in range(7)]
+    payload = json.dumps(items[:3] + [{"id": "meta"}] + items[3:]).encode("utf-8")
+
+    class PayloadHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            for start in range(0, len(payload), 64):
+                self.wfile.write(payload[start : start + 64])
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PayloadHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logging.getLogger("logger").debug(
+        f"[fixture:image_payload_server] Serving {len(items)} images"
+    )
+    request.addfinalizer(server.server_close)
+    request.addfinalizer(server.shutdown)
+    return f"http://127.0.0.1:{server.server_port}/images.json", len(items)
+
+
+@pytest.fixture(scope="function")
+def etag_server(request):
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    counts = {200: 0, 304: 0}
+
+    class EtagHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            etag = f'"{self.path}"'
+            if self.headers.get("If-None-Match") == etag:
+                counts[304] += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            body = json.dumps([{"path": self.path}]).encode("utf-8")
+            counts[200] += 1
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EtagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logging.getLogger("logger").debug("[fixture:etag_server] Serving with ETags")
+    request.addfinalizer(server.server_close)
+    request.addfinalizer(server.shutdown)
+    return f"http://127.0.0.1:{server.server_port}", counts
@@ -1,13 +1,35 @@
 import logging
 from typing import TypeAlias
+from unittest.mock import MagicMock
 
 import numpy as np
 from common_utils import class_autologger, silent
+from data.batch import BatchProcessing
 
 Mtx: TypeAlias = np.ndarray
 MtxList: TypeAlias = list[np.ndarray]
 
 
+class PathSeededPreprocessor:
+    def load_channels(self, path: str) -> MtxList:
+        if path.startswith("missing"):
+            raise FileNotFoundError(path)
+        value = float(path.split(".")[0])
+        return [np.full((8, 8), value + ch, dtype=np.float32) for ch in range(3)]
+
+    def preprocess_channels(self, channels: np.ndarray) -> MtxList:
+        return [np.full((28, 28), ch[0, 0], dtype=np.float32) for ch in channels]
+
+
+class VariableSamplesPreprocessor(PathSeededPreprocessor):
+    def preprocess_channels(self, channels: np.ndarray) -> MtxList:
+        return [
+            np.full((16, 16), value, dtype=np.float32)
+            for value in channels[::3, 0, 0]
+            for _ in range(4 if value == 9.0 else 2)
+        ]
+
+
 @class_autologger
 class TestBatchProcessing:
     logger: logging.Logger
@@ -27,6 +49,37 @@ class TestBatchProcessing:
             f"[test_create_batches_logic] Validated {len(mock_mtx_list)} items."
         )
 
+    def test_iter_batches_reuses_buffer(self, batch_proc):
+        data = np.arange(7 * 2, dtype=np.float32).reshape(7, 1, 1, 2)
+        out = np.empty((3, 1, 1, 2), dtype=np.float32)
+
+        batches = list(
+            batch_proc.iter_batches(data, batch_size=3, seed=5, epoch=1, out=out)
+        )
+        expected = batch_proc.create_batches(data, batch_size=3, seed=5, epoch=1)
+
+        if not all(np.shares_memory(batch, out) for batch in batches):
+            self.logger.error("[test_iter_batches_reuses_buffer] Batch was allocated")
+        assert all(np.shares_memory(batch, out) for batch in batches)
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert np.array_equal(batches[-1], expected[-1])
+        self.logger.info(
+            f"[test_iter_batches_reuses_buffer] Validated {len(data)} items."
+        )
+
+    def test_epoch_seeds_differ(self, batch_proc):
+        data = np.arange(32, dtype=np.float32).reshape(32, 1, 1, 1)
+
+        first = np.concatenate(batch_proc.create_batches(data, 4, seed=1, epoch=0))
+        again = np.concatenate(batch_proc.create_batches(data, 4, seed=1, epoch=0))
+        second = np.concatenate(batch_proc.create_batches(data, 4, seed=1, epoch=1))
+
+        if np.array_equal(first, second):
+            self.logger.error("[test_epoch_seeds_differ] Epochs share one order")
+        assert np.array_equal(first, again)
+        assert not np.array_equal(first, second)
+        assert np.array_equal(np.sort(second, axis=0), data)
+
     def test_process_batch_validation(self, batch_proc, test_paths):
         results = batch_proc.process_batch(test_paths)
         assert isinstance(results, list)
@@ -45,3 +98,119 @@ class TestBatchProcessing:
             )
 
         assert total == len(mock_mtx_list)
+
+    def test_process_batch_groups_same_shapes(self):
+        preprocessor = MagicMock()
+        shapes = {"a.png": (8, 8), "b.png": (8, 8), "c.png": (6, 4)}
+        preprocessor.load_channels.side_effect = (
+            lambda path: [np.zeros(shapes[path], dtype=np.float32)] * 3
+        )
+        preprocessor.preprocess_channels.side_effect = lambda channels: [
+            np.ones((1, 28, 28), dtype=np.float32) for _ in range(len(channels) // 3)
+        ]
+
+        results = BatchProcessing(preprocessor=preprocessor).process_batch(
+            ["a.png", "missing.png", "b.png", "c.png"]
+        )
+        calls = preprocessor.preprocess_channels.call_args_list
+
+        if len(calls) != 2:
+            self.logger.error(
+                f"[test_process_batch_groups_same_shapes] Expected 2 runs, got {len(calls)}"
+            )
+        assert len(calls) == 2
+        assert calls[0].args[0].shape == (6, 8, 8)
+        assert calls[1].args[0].shape == (3, 6, 4)
+        assert results.shape == (3, 1, 28, 28)
+        self.logger.info(
+            f"[test_process_batch_groups_same_shapes] Validated {len(results)} items."
+        )
+
+    def test_process_batch_retries_failed_group(self, caplog):
+        preprocessor = PathSeededPreprocessor()
+        original = preprocessor.preprocess_channels
+
+        def fail_on_bad(channels):
+            if np.any(channels == 7.0):
+                raise ValueError("corrupt image")
+            return original(channels)
+
+        preprocessor.preprocess_channels = fail_on_bad
+        with caplog.at_level(logging.ERROR):
+            results = BatchProcessing(preprocessor=preprocessor).process_batch(
+                ["1.png", "7.png", "2.png"]
+            )
+
+        if results.shape != (6, 28, 28):
+            self.logger.error(
+                f"[test_process_batch_retries_failed_group] Data loss: shape={results.shape}"
+            )
+        assert results.shape == (6, 28, 28)
+        assert np.array_equal(results[:, 0, 0], [1, 2, 3, 2, 3, 4])
+        assert "Error processing 7.png" in caplog.text
+        self.logger.info(
+            f"[test_process_batch_retries_failed_group] Validated {len(results)} items."
+        )
+
+    def test_process_batch_parallel_matches_serial(self, caplog):
+        paths = [f"{idx}.png" for idx in range(10)]
+        paths.insert(4, "missing.png")
+        preprocessor = PathSeededPreprocessor()
+
+        serial = BatchProcessing(preprocessor=preprocessor).process_batch(paths)
+        with caplog.at_level(logging.ERROR):
+            parallel = BatchProcessing(
+                preprocessor=preprocessor, workers=3
+            ).process_batch(paths)
+
+        if not np.array_equal(serial, parallel):
+            self.logger.error(
+                "[test_process_batch_parallel_matches_serial] Order mismatch"
+            )
+        assert parallel.shape == (30, 28, 28)
+        assert np.array_equal(serial, parallel)
+        assert "Error processing missing.png" in caplog.text
+        self.logger.info(
+            f"[test_process_batch_parallel_matches_serial] Validated {len(parallel)} items."
+        )
+
+    def test_process_batch_parallel_sizes_from_results(self):
+        paths = [f"{idx}.png" for idx in range(10)]
+        preprocessor = VariableSamplesPreprocessor()
+
+        serial = BatchProcessing(preprocessor=preprocessor).process_batch(paths)
+        parallel = BatchProcessing(preprocessor=preprocessor, workers=3).process_batch(
+            paths
+        )
+
+        if parallel.shape != serial.shape:
+            self.logger.error(
+                f"[test_process_batch_parallel_sizes_from_results] Data loss: {parallel.shape} vs {serial.shape}"
+            )
+        assert serial.shape == (22, 16, 16)
+        assert np.array_equal(serial, parallel)
+        self.logger.info(
+            f"[test_process_batch_parallel_sizes_from_results] Validated {len(parallel)} items."
+        )
+
+    def test_process_batch_parallel_probe_skips_failed_path(self, caplog):
+        paths = ["missing.png"] + [f"{idx}.png" for idx in range(6)]
+        preprocessor = PathSeededPreprocessor()
+
+        serial = BatchProcessing(preprocessor=preprocessor).process_batch(paths)
+        caplog.clear()
+        with caplog.at_level(logging.ERROR):
+            parallel = BatchProcessing(
+                preprocessor=preprocessor, workers=2
+            ).process_batch(paths)
+
+        if not np.array_equal(serial, parallel):
+            self.logger.error(
+                f"[test_process_batch_parallel_probe_skips_failed_path] Mismatch: {parallel.shape}"
+            )
+        assert parallel.shape == (18, 28, 28)
+        assert np.array_equal(serial, parallel)
+        assert caplog.text.count("Error processing missing.png") == 1
+        self.logger.info(
+            f"[test_process_batch_parallel_probe_skips_failed_path] Validated {len(parallel)} items."
+        )
@@ -1,8 +1,10 @@
 import logging
 from typing import TypeAlias
 
+import data.cache as cache_module
 import numpy as np
 from common_utils import class_autologger, silent
+from data.cache import CacheManager
 
 MtxList: TypeAlias = list[np.ndarray]
 
@@ -51,3 +53,89 @@ class TestCacheManager:
             self.logger.error(f"[test_cache_success_flow] Failed to cache valid data.")
 
         assert result is True
+
+    def test_cache_roundtrip_mmap(self, tmp_path):
+        source = tmp_path / "digit.png"
+        source.write_bytes(b"fake image bytes")
+        manager = CacheManager(root=str(tmp_path / "cache"), config={"size": 28})
+        data = [np.arange(6, dtype=np.float64).reshape(2, 3), np.ones(4, np.uint8)]
+
+        missed = manager.load(str(source))
+        stored = manager.cache(data, str(source))
+        loaded = manager.load(str(source))
+
+        if not isinstance(loaded[0], np.memmap):
+            self.logger.error("[test_cache_roundtrip_mmap] Loaded entry is not mmapped")
+        assert missed == [] and stored is True
+        assert isinstance(loaded[0], np.memmap)
+        assert loaded[0].dtype == np.float32 and loaded[1].dtype == np.uint8
+        assert np.array_equal(loaded[0], data[0])
+        assert manager.get_stats() == {"hits": 1, "misses": 1, "evictions": 0}
+        self.logger.info(f"[test_cache_roundtrip_mmap] Validated {len(loaded)} items.")
+
+    def test_cache_config_changes_key(self, tmp_path):
+        source = tmp_path / "digit.png"
+        source.write_bytes(b"fake image bytes")
+        first = CacheManager(root=str(tmp_path), config={"size": 28})
+        second = CacheManager(root=str(tmp_path), config={"size": 32})
+
+        if first.entry_path(str(source)) == second.entry_path(str(source)):
+            self.logger.error("[test_cache_config_changes_key] Config ignored in key")
+        assert first.entry_path(str(source)) != second.entry_path(str(source))
+
+    def test_cache_evicts_least_recently_used(self, tmp_path):
+        sources = []
+        for idx in range(3):
+            source = tmp_path / f"{idx}.png"
+            source.write_bytes(bytes([idx]))
+            sources.append(str(source))
+        manager = CacheManager(root=str(tmp_path / "cache"), max_bytes=9000)
+        tensor = [np.zeros(1000, dtype=np.float32)]
+
+        manager.cache(tensor, sources[0])
+        manager.cache(tensor, sources[1])
+        manager.load(sources[0])
+        manager.cache(tensor, sources[2])
+
+        if manager.get_stats()["evictions"] != 1:
+            self.logger.error(
+                f"[test_cache_evicts_least_recently_used] Stats: {manager.get_stats()}"
+            )
+        assert manager.get_stats()["evictions"] == 1
+        assert manager.load(sources[1]) == []
+        assert len(manager.load(sources[0])) == 1
+        assert len(manager.load(sources[2])) == 1
+
+    def test_cache_skips_scan_under_budget(self, tmp_path, monkeypatch):
+        scans: list = []
+        scan = cache_module.scan_entries_logic
+        monkeypatch.setattr(
+            cache_module,
+            "scan_entries_logic",
+            lambda root: scans.append(root) or scan(root),
+        )
+        manager = CacheManager(root=str(tmp_path / "cache"), max_bytes=9000)
+        tensor = [np.zeros(1000, dtype=np.float32)]
+        sources = []
+        for idx in range(3):
+            source = tmp_path / f"{idx}.png"
+            source.write_bytes(bytes([idx]))
+            sources.append(str(source))
+
+        manager.cache(tensor, sources[0])
+        manager.cache(tensor, sources[1])
+        under_budget = len(scans)
+        manager.cache(tensor, sources[2])
+
+        if under_budget != 1 or len(manager.sizes) != 2:
+            self.logger.error(
+                f"[test_cache_skips_scan_under_budget] Scans: {scans}, "
+                f"index: {manager.sizes}"
+            )
+        assert under_budget == 1
+        assert len(scans) == 2
+        assert len(manager.sizes) == 2
+        assert sum(manager.sizes.values()) <= manager.max_bytes
+        self.logger.info(
+            f"[test_cache_skips_scan_under_budget] Validated {len(sources)} items."
+        )
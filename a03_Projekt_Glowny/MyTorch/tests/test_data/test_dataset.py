@@ -4,7 +4,13 @@ from typing import TypeAlias
 import numpy as np
 import pytest
 from common_utils import class_autologger, silent
-from data.dataset import Dataset
+from data.dataset import (
+    ArrayDataset,
+    Dataset,
+    create_storage_logic,
+    open_storage_logic,
+    stack_samples_logic,
+)
 
 Mtx: TypeAlias = np.ndarray
 MtxList: TypeAlias = list[np.ndarray]
@@ -62,3 +68,45 @@ class TestDataset:
                 f"[test_getitem_negative_index] Dataset does not support negative indexing: {idx}."
             )
             raise
+
+
+@class_autologger
+class TestArrayDataset:
+    logger: logging.Logger
+
+    def test_getitem_returns_views(self, mock_dataset_data: MtxList) -> None:
+        data = stack_samples_logic(mock_dataset_data)
+        ds = ArrayDataset(data, np.arange(len(data), dtype=np.int64))
+
+        sample, label = ds[2]
+        batch, labels = ds[1:4]
+
+        if not np.shares_memory(sample, data):
+            self.logger.error("[test_getitem_returns_views] Sample was copied")
+        assert data.shape == (5, 1, 3, 3) and data.flags.c_contiguous
+        assert np.shares_memory(sample, data) and np.shares_memory(batch, data)
+        assert label == 2 and list(labels) == [1, 2, 3]
+        assert np.array_equal(sample[0], mock_dataset_data[2])
+        self.logger.info(f"[test_getitem_returns_views] Validated {len(ds)} items.")
+
+    def test_memmap_storage_roundtrip(self, tmp_path, mock_dataset_data) -> None:
+        data, labels = create_storage_logic(str(tmp_path), 5, (1, 3, 3))
+        stack_samples_logic(mock_dataset_data, out=data)
+        labels[:] = np.arange(5)
+        data.flush()
+        labels.flush()
+
+        ds = ArrayDataset(*open_storage_logic(str(tmp_path)))
+        batch, batch_labels = ds.get_batch(np.array([4, 0]))
+
+        if not isinstance(ds.data, np.memmap):
+            self.logger.error("[test_memmap_storage_roundtrip] Storage not mmapped")
+        assert isinstance(ds.data, np.memmap)
+        assert list(batch_labels) == [4, 0]
+        assert np.array_equal(batch[0, 0], mock_dataset_data[4])
+        self.logger.info(f"[test_memmap_storage_roundtrip] Validated {len(ds)} items.")
+
+    def test_length_mismatch(self, mock_dataset_data: MtxList) -> None:
+        data = stack_samples_logic(mock_dataset_data)
+        with pytest.raises(ValueError):
+            ArrayDataset(data, np.arange(3, dtype=np.int64))
@@ -1,8 +1,20 @@
+import json
+import logging
 from typing import TypeAlias
 
 import numpy as np
+import pytest
 from common_utils import class_autologger, silent
-from data.downloader import DataDownloader, DataProcessor, ProjectManager
+from data.downloader import (
+    DataDownloader,
+    DataProcessor,
+    ProjectManager,
+    iter_json_items_logic,
+    load_container_logic,
+    load_http_cache_logic,
+    save_container_logic,
+    save_http_cache_logic,
+)
 
 Mtx: TypeAlias = np.ndarray
 MtxList: TypeAlias = list[np.ndarray]
@@ -88,6 +100,156 @@ class TestProjectPipeline:
 
         assert save_status is True
 
+    def test_processor_buckets_and_grayscale(self):
+        rng = np.random.default_rng(0)
+        rgb = [rng.integers(0, 256, (4, 5, 3), dtype=np.uint8) for _ in range(3)]
+        items = [rgb[0], np.zeros((2, 2, 3), dtype=np.uint8), rgb[1], rgb[2]]
+
+        blocks = DataProcessor().process_batch(items, grayscale=True)
+        expected = np.stack(rgb).astype(np.float32) @ [0.299, 0.587, 0.114] / 255.0
+
+        if len(blocks) != 2:
+            self.logger.error(
+                f"[test_processor_buckets_and_grayscale] Got {len(blocks)} buckets"
+            )
+        assert [block.shape for block in blocks] == [(3, 4, 5), (1, 2, 2)]
+        assert blocks[0].dtype == np.float32 and blocks[0].flags.c_contiguous
+        assert np.allclose(blocks[0], expected, atol=1e-6)
+        self.logger.info(
+            f"[test_processor_buckets_and_grayscale] Validated {len(items)} items."
+        )
+
+
+@class_autologger
+class TestStreamingPipeline:
+    logger: logging.Logger
+
+    def test_iter_json_items_byte_chunks(self):
+        items = [{"id": 1, "name": "zażółć"}, [1, 2, 3], 12345, "x,]"]
+        payload = json.dumps(items).encode("utf-8")
+
+        parsed = list(
+            iter_json_items_logic(payload[i : i + 1] for i in range(len(payload)))
+        )
+
+        if parsed != items:
+            self.logger.error(f"[test_iter_json_items_byte_chunks] Got {parsed}")
+        assert parsed == items
+        assert list(iter_json_items_logic([b'{"id": 1}'])) == [{"id": 1}]
+        self.logger.info(
+            f"[test_iter_json_items_byte_chunks] Validated {len(items)} items."
+        )
+
+    def test_stream_pipeline_writes_batches(self, image_payload_server, tmp_path):
+        url, n_images = image_payload_server
+        pm = ProjectManager(stream=True, batch_size=3, output_dir=str(tmp_path))
+
+        result = pm.run_pipeline(url, fast_mode=False)
+        parts = sorted(tmp_path.glob("*.npy"))
+        written = sum(len(np.load(part)) for part in parts)
+
+        if written != n_images:
+            self.logger.error(
+                f"[test_stream_pipeline_writes_batches] Wrote {written}/{n_images}"
+            )
+        assert result == f"Pipeline finished. Processed {n_images} items."
+        assert len(parts) == 3 and written == n_images
+        assert np.allclose(np.load(parts[-1])[0], 6 / 255.0)
+        self.logger.info(
+            f"[test_stream_pipeline_writes_batches] Validated {written} items."
+        )
+
+    def test_fetch_many_revalidates_cache(self, etag_server, tmp_path):
+        base_url, counts = etag_server
+        sources = [f"{base_url}/part-{i}.json" for i in range(3)]
+        downloader = DataDownloader(workers=2, cache_dir=str(tmp_path))
+
+        first = downloader.fetch_many(sources)
+        second = downloader.fetch_many(sources)
+
+        if counts[304] != len(sources):
+            self.logger.error(
+                f"[test_fetch_many_revalidates_cache] Re-downloaded: {counts}"
+            )
+        assert first == second
+        assert first[2] == [{"path": "/part-2.json"}]
+        assert counts == {200: 3, 304: 3}
+        self.logger.info(
+            f"[test_fetch_many_revalidates_cache] Validated {len(sources)} items."
+        )
+
+    def test_http_cache_entry_is_single_file(self, tmp_path):
+        url = "http://api.test.com/items.json"
+        cache_dir = str(tmp_path)
+
+        save_http_cache_logic(cache_dir, url, b"[1]", {"ETag": '"a"'})
+        save_http_cache_logic(cache_dir, url, b"[1, 2]", {"ETag": '"b"'})
+        meta, body = load_http_cache_logic(cache_dir, url)
+        entries = sorted(p.name for p in tmp_path.iterdir())
+
+        if len(entries) != 1 or (meta["etag"], body) != ('"b"', b"[1, 2]"):
+            self.logger.error(
+                f"[test_http_cache_entry_is_single_file] {entries}: {meta} {body}"
+            )
+        assert len(entries) == 1 and entries[0].endswith(".http")
+        assert (meta["etag"], body) == ('"b"', b"[1, 2]")
+        assert load_http_cache_logic(cache_dir, "http://other.test/x") == ({}, b"")
+
+        (tmp_path / entries[0]).write_bytes(b"not json")
+        assert load_http_cache_logic(cache_dir, url) == ({}, b"")
+        self.logger.info(
+            f"[test_http_cache_entry_is_single_file] Validated {len(entries)} items."
+        )
+
+
+@class_autologger
+class TestDatasetContainer:
+    logger: logging.Logger
+
+    def test_container_roundtrip_memmap(self, tmp_path):
+        path = str(tmp_path / "train.mtds")
+        data = np.arange(5 * 3 * 4, dtype=np.float32).reshape(5, 1, 3, 4)
+        labels = np.array([3, 1, 4, 1, 5], dtype=np.int64)
+
+        assert save_container_logic(data, path, labels)
+        loaded, loaded_labels = load_container_logic(path, verify=True)
+
+        if not isinstance(loaded, np.memmap):
+            self.logger.error("[test_container_roundtrip_memmap] Payload was parsed")
+        assert isinstance(loaded, np.memmap)
+        assert loaded.dtype == np.float32 and loaded.shape == data.shape
+        assert np.array_equal(loaded, data)
+        assert np.array_equal(loaded_labels, labels)
+        self.logger.info(
+            f"[test_container_roundtrip_memmap] Validated {len(loaded)} items."
+        )
+
+    def test_container_detects_corruption(self, tmp_path):
+        path = tmp_path / "train.mtds"
+        save_container_logic(np.zeros((2, 4, 4), dtype=np.uint8), str(path))
+
+        raw = bytearray(path.read_bytes())
+        raw[-1] ^= 0xFF
+        path.write_bytes(bytes(raw))
+
+        with pytest.raises(ValueError):
+            load_container_logic(str(path), verify=True)
+
+    def test_convert_json(self, tmp_path):
+        json_path = str(tmp_path / "data.json")
+        items = [{"image": [[i, 255], [0, i]], "label": i} for i in range(3)]
+        downloader = DataDownloader(cache_dir="")
+        downloader.save_to_disk(items, json_path)
+
+        converted = downloader.convert_json(json_path, str(tmp_path / "data.mtds"))
+        data, labels = downloader.load_container(str(tmp_path / "data.mtds"))
+
+        if not converted:
+            self.logger.error("[test_convert_json] Conversion failed")
+        assert converted and data.dtype == np.uint8 and data.shape == (3, 2, 2)
+        assert list(labels) == [0, 1, 2] and data[2, 1, 1] == 2
+        self.logger.info(f"[test_convert_json] Validated {len(data)} items.")
+
 
 """ Context: Przeprowadź refaktoryzację wklejonego niżej testu, wydzielając logikę współdzieloną do pliku conftest.py zgodnie z zasadami pytest fixtures. Zadania: Analiza conftest.py: Zidentyfikuj powtarzalne elementy (inicjalizacje klas jak CacheManager, przygotowanie danych MtxList, konfigurację loggera lub mocki) i stwórz z nich @pytest.fixture. Refaktoryzacja testu: Przepisz test tak, aby nie używał setup_method ani self. Ma korzystać z fixture'ów wstrzykniętych przez argumenty funkcji. Zachowanie logowania: W fixture'ach i testach zachowaj logowanie punktów decyzyjnych zgodnie z naszymi poprzednimi ustaleniami (ENG, [method_name], DEBUG/INFO/WARNING).Output format: Podaj mi wynik w dwóch wyraźnych sekcjach:DO DODANIA W CONFTEST.PY: (Kod nowych fixture'ów).POCHODNY PLIK TESTOWY: (Oczyszczony i skrócony kod testu).Dodatkowe wytyczne:Używaj scope="function" lub scope="class" zależnie od kosztu tworzenia obiektu.Importy Mtx, MtxList oraz dekoratory @silent mają zostać tam, gdzie są niezbędne.Nie pisz zbędnych komentarzy – kod ma być czysty i gotowy do wklejenia.Cel końcowy: Przygotowanie modularnej bazy,którą na końcu wspólnie zeskaleujemy i uprościmy w jednym pliku conftest.py.
 """
@@ -0,0 +1,65 @@
+import logging
+from typing import TypeAlias
+
+import numpy as np
+import pytest
+from common_utils import class_autologger
+from data.dataset import ArrayDataset
+from data.loader import DataLoader, batch_indices_logic
+
+Mtx: TypeAlias = np.ndarray
+
+
+@pytest.fixture
+def array_dataset() -> ArrayDataset:
+    data = np.arange(10 * 1 * 2 * 2, dtype=np.float32).reshape(10, 1, 2, 2)
+    return ArrayDataset(data, np.arange(10, dtype=np.int64))
+
+
+@class_autologger
+class TestDataLoader:
+    logger: logging.Logger
+
+    def test_batches_match_direct_gather(self, array_dataset: ArrayDataset) -> None:
+        loader = DataLoader(array_dataset, batch_size=4, seed=3, prefetch=2)
+        expected = batch_indices_logic(10, 4, shuffle=True, seed=3)
+
+        seen = 0
+        for (batch, labels), indices in zip(loader, expected, strict=True):
+            if not np.array_equal(labels, indices):
+                self.logger.error("[test_batches_match_direct_gather] Order mismatch")
+            assert np.array_equal(labels, indices)
+            assert np.array_equal(batch, array_dataset.data[indices])
+            seen += len(labels)
+
+        assert len(loader) == 3 and seen == 10
+        self.logger.info(f"[test_batches_match_direct_gather] Validated {seen} items.")
+
+    def test_drop_last(self, array_dataset: ArrayDataset) -> None:
+        loader = DataLoader(array_dataset, batch_size=4, shuffle=False, drop_last=True)
+        sizes = [len(labels) for _, labels in loader]
+
+        if sizes != [4, 4]:
+            self.logger.error(f"[test_drop_last] Unexpected batch sizes {sizes}")
+        assert sizes == [4, 4] and len(loader) == 2
+
+    def test_buffers_are_reused(self, array_dataset: ArrayDataset) -> None:
+        loader = DataLoader(
+            array_dataset, batch_size=2, shuffle=False, prefetch=1, workers=2
+        )
+        buffers = {id(slot[0]) for slot in loader.slots}
+
+        for epoch in range(2):
+            for batch, _ in loader:
+                if batch.base is None or id(batch.base) not in buffers:
+                    self.logger.error(
+                        f"[test_buffers_are_reused] Epoch {epoch} allocated a batch"
+                    )
+                assert batch.base is not None and id(batch.base) in buffers
+
+        assert len(loader.slots) == 2
+        self.logger.info(f"[test_buffers_are_reused] Validated {len(loader)} items.")
+
+    def test_invalid_config(self, array_dataset: ArrayDataset) -> None:
+        with pytest.raises(ValueError):
+            DataLoader(array_dataset, batch_size=0)
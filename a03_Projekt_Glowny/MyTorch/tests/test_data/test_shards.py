@@ -0,0 +1,89 @@
+import json
+import logging
+from typing import TypeAlias
+
+import numpy as np
+from common_utils import class_autologger
+from data.downloader import load_container_logic
+from data.shards import MANIFEST_FILE, ShardBuilder
+
+Mtx: TypeAlias = np.ndarray
+MtxList: TypeAlias = list[np.ndarray]
+
+
+class NameSeededPreprocessor:
+    def load_channels(self, path: str) -> MtxList:
+        value = float(path.rsplit("/", 1)[-1].split(".")[0])
+        return [np.full((8, 8), value * 10 + ch, dtype=np.float32) for ch in range(3)]
+
+    def preprocess_channels(self, channels: np.ndarray) -> MtxList:
+        return [np.full((4, 4), ch[0, 0], dtype=np.float32) for ch in channels]
+
+
+@class_autologger
+class TestShardBuilder:
+    logger: logging.Logger
+
+    def test_build_and_incremental_rebuild(self, tmp_path) -> None:
+        src, out = tmp_path / "images", tmp_path / "shards"
+        src.mkdir()
+        for idx in range(3):
+            (src / f"{idx}.png").write_bytes(bytes([idx]))
+        builder = ShardBuilder(preprocessor=NameSeededPreprocessor(), shard_size=4)
+
+        first = builder.build(str(src), str(out))
+        second = builder.build(str(src), str(out))
+        (src / "1.png").write_bytes(b"changed")
+        third = builder.build(str(src), str(out))
+
+        manifest = json.loads((out / MANIFEST_FILE).read_text())
+        shards = {s["index"]: s["file"] for s in manifest["shards"]}
+        for sample in manifest["samples"]:
+            data, _ = load_container_logic(str(out / shards[sample["shard"]]))
+            value = data[sample["offset"], 0, 0]
+            expected = float(sample["source"][-5]) * 10
+
+            if not expected <= value < expected + 3:
+                self.logger.error(
+                    f"[test_build_and_incremental_rebuild] Bad offset for {sample}"
+                )
+            assert expected <= value < expected + 3
+
+        assert first["processed"] == 3 and first["shards"] == 3
+        assert second["skipped"] == 3 and second["processed"] == 0
+        assert third["processed"] == 1 and third["samples"] == 9
+        assert len(manifest["samples"]) == 9
+        self.logger.info(
+            f"[test_build_and_incremental_rebuild] Validated {third['samples']} items."
+        )
+
+    def test_shards_hold_whole_files(self, tmp_path) -> None:
+        src = tmp_path / "images"
+        src.mkdir()
+        for idx in range(5):
+            (src / f"{idx}.png").write_bytes(bytes([idx]))
+
+        for shard_size in (4, 2):
+            out = tmp_path / f"shards-{shard_size}"
+            builder = ShardBuilder(
+                preprocessor=NameSeededPreprocessor(), shard_size=shard_size
+            )
+            stats = builder.build(str(src), str(out))
+
+            manifest = json.loads((out / MANIFEST_FILE).read_text())
+            sources: dict = {}
+            for sample in manifest["samples"]:
+                sources.setdefault(sample["source"], set()).add(sample["shard"])
+            for shard in manifest["shards"]:
+                data, _ = load_container_logic(str(out / shard["file"]))
+                used = [s for s in manifest["samples"] if s["shard"] == shard["index"]]
+
+                if len(used) != len(data):
+                    self.logger.error(
+                        f"[test_shards_hold_whole_files] Orphaned samples in {shard}"
+                    )
+                assert len(used) == len(data) == shard["count"]
+
+            assert all(len(shards) == 1 for shards in sources.values())
+            assert stats["samples"] == 15 and stats["shards"] == 5
+        self.logger.info("[test_shards_hold_whole_files] Validated 15 items.")
@@ -0,0 +1,102 @@
+import logging
+
+import numpy as np
+
+from nn import (
+    Conv2D,
+    Dropout,
+    Flatten,
+    Linear,
+    NeuralNetwork,
+    ReLU,
+    Sequential,
+    Sigmoid,
+    chain_fwd,
+    dropout_fwd,
+)
+
+logger = logging.getLogger("test_logger")
+
+
+def build_network(chunk_size):
+    layers = [
+        Conv2D(1, 4, 3),
+        Dropout(0.5),
+        ReLU(),
+        Flatten(),
+        Linear(4 * 12 * 12, 10),
+        Sigmoid(),
+    ]
+    return NeuralNetwork(model=Sequential(layers=layers), chunk_size=chunk_size)
+
+
+class TestInference:
+    def test_chunked_predict_matches_single_forward(self):
+        logger.info(
+            "[test_chunked_predict_matches_single_forward] ACTION: Testing predict"
+        )
+        rng = np.random.default_rng(0)
+        network = build_network(chunk_size=7)
+        x = rng.standard_normal((23, 1, 14, 14)).astype(np.float32)
+        original = x.copy()
+        out = np.empty((23, 10), dtype=np.float32)
+
+        result = network.predict(x, out=out)
+        with network.inference():
+            expected = chain_fwd(network.model.layers, x)
+
+        if result is not out:
+            logger.error(
+                "[test_chunked_predict_matches_single_forward] Logic error: "
+                "output buffer not used"
+            )
+        assert result is out
+        assert np.allclose(result, expected, atol=1e-6)
+        assert np.array_equal(x, original)
+        logger.info(
+            f"[test_chunked_predict_matches_single_forward] Validated {len(x)} items."
+        )
+
+    def test_inference_skips_caches_and_restores_training(self):
+        logger.info(
+            "[test_inference_skips_caches_and_restores_training] ACTION: "
+            "Testing inference context"
+        )
+        rng = np.random.default_rng(1)
+        network = build_network(chunk_size=5)
+        model = network.model
+        x = rng.standard_normal((12, 1, 14, 14)).astype(np.float32)
+
+        with network.inference():
+            assert not model.training and not model.layers[1].training
+            first = network.predict(x)
+            second = network.predict(x)
+
+        assert model.training and model.layers[1].training
+        assert np.array_equal(first, second)
+        for layer in model.layers:
+            for name in ("_input_cache", "_last_output", "_mask"):
+                cache = getattr(layer, name, np.array([]))
+                if cache.size:
+                    logger.error(
+                        "[test_inference_skips_caches_and_restores_training] "
+                        f"Logic error: {type(layer).__name__}.{name} kept"
+                    )
+                assert cache.size == 0
+        logger.info(
+            "[test_inference_skips_caches_and_restores_training] Validated 2 items."
+        )
+
+    def test_dropout_eval_allocates_no_mask(self):
+        logger.info("[test_dropout_eval_allocates_no_mask] ACTION: Testing mask")
+        x = np.ones((4, 1, 8, 8), dtype=np.float32)
+
+        result, mask = dropout_fwd(x, 0.5, training=False)
+
+        if mask.size:
+            logger.error(
+                f"[test_dropout_eval_allocates_no_mask] Logic error: mask={mask.shape}"
+            )
+        assert result is x
+        assert mask.size == 0
+        logger.info("[test_dropout_eval_allocates_no_mask] Validated 1 items.")
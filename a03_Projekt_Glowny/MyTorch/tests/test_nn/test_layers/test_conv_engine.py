@@ -0,0 +1,201 @@
+import logging
+
+import numpy as np
+import pytest
+
+from common_utils import RngContext
+from nn import (
+    Conv2D,
+    col2im_logic,
+    conv2d_bwd,
+    conv2d_fwd,
+    im2col_logic,
+    winograd_conv2d_fwd,
+    winograd_kernels_logic,
+)
+
+logger = logging.getLogger("test_logger")
+
+
+def naive_conv2d(x, kernels, biases, stride):
+    n, _, h, w = x.shape
+    o, _, k, _ = kernels.shape
+    oh, ow = (h - k) // stride + 1, (w - k) // stride + 1
+    result = np.zeros((n, o, oh, ow))
+    for i in range(oh):
+        for j in range(ow):
+            patch = x[:, :, i * stride : i * stride + k, j * stride : j * stride + k]
+            result[:, :, i, j] = np.einsum("ncij,ocij->no", patch, kernels)
+    return result + biases.reshape(1, o, 1, 1)
+
+
+class TestConvEngine:
+    @pytest.mark.parametrize("stride", [1, 2, 3])
+    def test_forward_matches_naive(self, stride):
+        logger.info("[test_forward_matches_naive] ACTION: Testing im2col forward")
+        rng = np.random.default_rng(0)
+        x = rng.standard_normal((2, 3, 9, 8))
+        kernels = rng.standard_normal((4, 3, 3, 3))
+        biases = rng.standard_normal(4)
+
+        result = conv2d_fwd(x, kernels, biases, stride)
+        expected = naive_conv2d(x, kernels, biases, stride)
+
+        if result.shape != expected.shape:
+            logger.error(
+                f"[test_forward_matches_naive] Out of bounds: shape={result.shape}"
+            )
+        assert np.allclose(result, expected)
+        logger.info("[test_forward_matches_naive] Validated 1 items.")
+
+    @pytest.mark.parametrize("stride", [1, 2])
+    def test_backward_finite_differences(self, stride):
+        logger.info("[test_backward_finite_differences] ACTION: Testing gradients")
+        rng = np.random.default_rng(1)
+        x = rng.standard_normal((2, 2, 7, 6))
+        kernels = rng.standard_normal((3, 2, 3, 3))
+        biases = rng.standard_normal(3)
+        grad = rng.standard_normal(conv2d_fwd(x, kernels, biases, stride).shape)
+
+        d_x, d_kernels, d_biases = conv2d_bwd(grad, x, kernels, stride)
+
+        eps = 1e-6
+        checked = 0
+        for array, analytic in ((x, d_x), (kernels, d_kernels), (biases, d_biases)):
+            for index in np.ndindex(array.shape):
+                original = array[index]
+                array[index] = original + eps
+                plus = np.sum(naive_conv2d(x, kernels, biases, stride) * grad)
+                array[index] = original - eps
+                minus = np.sum(naive_conv2d(x, kernels, biases, stride) * grad)
+                array[index] = original
+
+                numeric = (plus - minus) / (2 * eps)
+                if abs(numeric - analytic[index]) > 1e-5:
+                    logger.error(
+                        f"[test_backward_finite_differences] Data loss: {index} "
+                        f"numeric={numeric}, analytic={analytic[index]}"
+                    )
+                assert abs(numeric - analytic[index]) < 1e-5
+                checked += 1
+        logger.info(f"[test_backward_finite_differences] Validated {checked} items.")
+
+    def test_col2im_is_adjoint_of_im2col(self):
+        logger.info("[test_col2im_is_adjoint_of_im2col] ACTION: Testing adjoint")
+        rng = np.random.default_rng(2)
+        x = rng.standard_normal((2, 3, 8, 9))
+        cols = im2col_logic(x, 3, 2)
+        y = rng.standard_normal(cols.shape)
+
+        lhs = np.sum(cols * y)
+        rhs = np.sum(x * col2im_logic(y, x.shape, 3, 2))
+
+        assert np.isclose(lhs, rhs)
+        logger.info("[test_col2im_is_adjoint_of_im2col] Validated 1 items.")
+
+    def test_layer_keeps_gradients_and_buffers(self):
+        logger.info(
+            "[test_layer_keeps_gradients_and_buffers] ACTION: Testing Conv2D state"
+        )
+        rng = np.random.default_rng(3)
+        layer = Conv2D(3, 4, 3, stride=2)
+        x = rng.standard_normal((2, 3, 9, 9))
+
+        out = layer.forward(x)
+        buffer = layer.col_buffer(x.shape)
+        layer.forward(x)
+        grad = np.ones_like(out)
+        d_x = layer.backward(grad)
+
+        _, d_kernels, d_biases = conv2d_bwd(grad, x, layer.kernels, 2)
+        if layer.col_buffer(x.shape) is not buffer:
+            logger.error(
+                "[test_layer_keeps_gradients_and_buffers] Logic error: buffer rebuilt"
+            )
+        assert layer.col_buffer(x.shape) is buffer
+        assert d_x.shape == x.shape
+        assert np.allclose(layer.grad_kernels, d_kernels)
+        assert np.allclose(layer.grad_biases, d_biases)
+        logger.info("[test_layer_keeps_gradients_and_buffers] Validated 1 items.")
+
+    def test_layer_keeps_latest_workspace_only(self):
+        logger.info(
+            "[test_layer_keeps_latest_workspace_only] ACTION: Testing Conv2D workspace"
+        )
+        rng = np.random.default_rng(6)
+        layer = Conv2D(3, 4, 3, rng=RngContext(7))
+        shapes = [(n, 3, 8, 8) for n in (4, 3, 2)]
+
+        for shape in shapes:
+            out = layer.forward(rng.standard_normal(shape))
+            layer.backward(np.ones_like(out))
+        cached_shapes = [layer._col_buffer[0], layer._tile_buffer[0]]
+
+        if cached_shapes != [shapes[-1]] * 2:
+            logger.error(
+                f"[test_layer_keeps_latest_workspace_only] Stale shapes: {cached_shapes}"
+            )
+        assert cached_shapes == [shapes[-1]] * 2
+        assert np.array_equal(layer.kernels, Conv2D(3, 4, 3, rng=RngContext(7)).kernels)
+        assert not np.array_equal(
+            layer.kernels, Conv2D(3, 4, 3, rng=RngContext(8)).kernels
+        )
+        logger.info(
+            f"[test_layer_keeps_latest_workspace_only] Validated {len(shapes)} items."
+        )
+
+
+class TestWinogradEngine:
+    @pytest.mark.parametrize("shape", [(2, 3, 9, 8), (1, 5, 10, 10), (3, 2, 3, 4)])
+    def test_matches_im2col(self, shape):
+        logger.info("[test_matches_im2col] ACTION: Testing Winograd output")
+        rng = np.random.default_rng(4)
+        x = rng.standard_normal(shape).astype(np.float32)
+        kernels = rng.standard_normal((4, shape[1], 3, 3)).astype(np.float32)
+        biases = rng.standard_normal(4).astype(np.float32)
+
+        expected = conv2d_fwd(x, kernels, biases)
+        result = winograd_conv2d_fwd(x, winograd_kernels_logic(kernels), biases)
+
+        if result.shape != expected.shape:
+            logger.error(f"[test_matches_im2col] Out of bounds: shape={result.shape}")
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected, rtol=1e-4, atol=1e-4)
+        logger.info("[test_matches_im2col] Validated 1 items.")
+
+    def test_engine_selection(self):
+        logger.info("[test_engine_selection] ACTION: Testing engine choice")
+
+        assert Conv2D(3, 8, 3).active_engine == "winograd"
+        assert Conv2D(3, 8, 3, stride=2).active_engine == "im2col"
+        assert Conv2D(3, 8, 3, engine="im2col").active_engine == "im2col"
+        with pytest.raises(ValueError):
+            Conv2D(3, 8, 5, engine="winograd")
+        logger.info("[test_engine_selection] Validated 4 items.")
+
+    def test_in_place_kernel_update_invalidates_cache(self):
+        logger.info(
+            "[test_in_place_kernel_update_invalidates_cache] ACTION: Testing cache"
+        )
+        rng = np.random.default_rng(5)
+        layer = Conv2D(3, 4, 3)
+        x = rng.standard_normal((2, 3, 8, 8))
+
+        layer.forward(x)
+        transformed = layer.winograd_kernels()
+        if layer.winograd_kernels() is not transformed:
+            logger.error(
+                "[test_in_place_kernel_update_invalidates_cache] Logic error: "
+                "unchanged kernels were transformed again"
+            )
+        assert layer.winograd_kernels() is transformed
+
+        layer.kernels[...] *= 2
+        result = layer.forward(x)
+
+        expected = conv2d_fwd(x, layer.kernels, layer.biases)
+        assert layer.winograd_kernels() is not transformed
+        assert np.allclose(result, expected)
+        logger.info(
+            "[test_in_place_kernel_update_invalidates_cache] Validated 1 items."
+        )
@@ -0,0 +1,108 @@
+import logging
+
+import numpy as np
+
+from nn import (
+    Conv2D,
+    Dropout,
+    Flatten,
+    Linear,
+    ReLU,
+    Sequential,
+    Sigmoid,
+    chain_bwd,
+    chain_fwd,
+    plan_memory_logic,
+)
+
+logger = logging.getLogger("test_logger")
+
+
+def build_layers():
+    return [
+        Conv2D(1, 4, 3),
+        ReLU(),
+        Conv2D(4, 4, 3, stride=2),
+        ReLU(),
+        Flatten(),
+        Linear(4 * 5 * 5, 16),
+        ReLU(),
+        Linear(16, 3),
+        Sigmoid(),
+    ]
+
+
+def copy_layers(layers):
+    copies = build_layers()
+    for source, target in zip(layers, copies, strict=True):
+        for name in ("kernels", "biases", "weights", "bias"):
+            if hasattr(source, name):
+                object.__setattr__(target, name, getattr(source, name).copy())
+    return copies
+
+
+class TestMemoryPlan:
+    def test_plan_reuses_buffers(self):
+        logger.info("[test_plan_reuses_buffers] ACTION: Testing slot assignment")
+        layers = build_layers()
+
+        train_slots, train_inplace = plan_memory_logic(layers, training=True)
+        eval_slots, _ = plan_memory_logic(layers, training=False)
+
+        if max(eval_slots) + 1 != 2:
+            logger.error(
+                f"[test_plan_reuses_buffers] Logic error: eval slots={eval_slots}"
+            )
+        assert max(eval_slots) + 1 == 2
+        assert train_slots == [0, -1, 1, -1, -1, 2, -1, 3, -1]
+        assert eval_slots == [0, -1, 1, -1, -1, 0, -1, 1, -1]
+        expected = [False, True, False, True, False, False, True, False, False]
+        assert train_inplace == expected
+        logger.info("[test_plan_reuses_buffers] Validated 2 items.")
+
+    def test_relu_not_in_place_over_saved_output(self):
+        logger.info(
+            "[test_relu_not_in_place_over_saved_output] ACTION: Testing in-place"
+        )
+        layers = [Linear(4, 4), Sigmoid(), ReLU(), Dropout(0.5)]
+
+        _, inplace = plan_memory_logic(layers, training=True)
+
+        if inplace[2] or inplace[3]:
+            logger.error(
+                f"[test_relu_not_in_place_over_saved_output] Data loss: {inplace}"
+            )
+        assert inplace == [False, False, False, False]
+        eval_inplace = plan_memory_logic(layers, training=False)[1]
+        assert eval_inplace == [False, False, True, True]
+        logger.info("[test_relu_not_in_place_over_saved_output] Validated 2 items.")
+
+    def test_planned_matches_unplanned(self):
+        logger.info("[test_planned_matches_unplanned] ACTION: Testing equivalence")
+        rng = np.random.default_rng(0)
+        model = Sequential(layers=build_layers())
+        reference = copy_layers(model.layers)
+
+        for step in range(3):
+            x = rng.standard_normal((8, 1, 14, 14)).astype(np.float32)
+            original = x.copy()
+
+            result = model.forward(x)
+            expected = chain_fwd(reference, x)
+            grad = rng.standard_normal(result.shape).astype(np.float32)
+            d_x = model.backward(grad)
+            expected_d_x = chain_bwd(reference, grad)
+
+            if not np.array_equal(result, expected):
+                logger.error(f"[test_planned_matches_unplanned] Data loss at {step}")
+            assert np.array_equal(result, expected)
+            assert np.array_equal(d_x, expected_d_x)
+            assert np.array_equal(x, original)
+            for layer, ref in zip(model.layers, reference, strict=True):
+                if isinstance(layer, Conv2D):
+                    assert np.array_equal(layer.grad_kernels, ref.grad_kernels)
+                    assert np.array_equal(layer.grad_biases, ref.grad_biases)
+
+        assert model.layers[0]._input_cache.size == 0
+        assert model.layers[1]._last_output.size == 0
+        logger.info("[test_planned_matches_unplanned] Validated 3 items.")
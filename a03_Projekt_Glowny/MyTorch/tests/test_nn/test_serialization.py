@@ -0,0 +1,70 @@
+import logging
+
+import numpy as np
+
+from nn import (
+    Conv2D,
+    Dropout,
+    Flatten,
+    Linear,
+    NeuralNetwork,
+    ReLU,
+    Sequential,
+    Sigmoid,
+)
+
+logger = logging.getLogger("test_logger")
+
+
+class TestSerialization:
+    def test_save_load_roundtrip(self, tmp_path):
+        logger.info("[test_save_load_roundtrip] ACTION: Testing .npz round-trip")
+        rng = np.random.default_rng(0)
+        layers = [
+            Conv2D(1, 4, 3),
+            ReLU(),
+            Conv2D(4, 2, 5, stride=2),
+            Dropout(0.25),
+            Flatten(),
+            Linear(32, 10),
+            Sigmoid(),
+        ]
+        network = NeuralNetwork(model=Sequential(layers=layers), chunk_size=5)
+        x = rng.standard_normal((11, 1, 14, 14)).astype(np.float32)
+        expected = network.predict(x)
+        path = str(tmp_path / "model" / "net.npz")
+
+        network.save(path)
+        restored = NeuralNetwork()
+        restored.load(path)
+        loaded = restored.model.layers
+
+        names = [type(layer).__name__ for layer in loaded]
+        if names != [type(layer).__name__ for layer in layers]:
+            logger.error(f"[test_save_load_roundtrip] Logic error: layers={names}")
+        assert names == [type(layer).__name__ for layer in layers]
+        assert loaded[2].stride == 2 and loaded[3].probability == 0.25
+        for layer in (loaded[0], loaded[2]):
+            assert isinstance(layer.kernels, np.memmap)
+            assert isinstance(layer.biases, np.memmap)
+        assert isinstance(loaded[5].weights, np.memmap)
+        assert np.allclose(restored.predict(x), expected)
+        logger.info(f"[test_save_load_roundtrip] Validated {len(loaded)} items.")
+
+    def test_loaded_weights_are_writable(self, tmp_path):
+        logger.info("[test_loaded_weights_are_writable] ACTION: Testing copy-on-write")
+        network = NeuralNetwork(model=Sequential(layers=[Linear(4, 2)]))
+        path = str(tmp_path / "linear.npz")
+        network.save(path)
+        saved = network.model.layers[0].weights.copy()
+
+        restored = NeuralNetwork()
+        restored.load(path)
+        weights = restored.model.layers[0].weights
+        weights -= 0.5
+
+        reloaded = NeuralNetwork()
+        reloaded.load(path)
+        assert np.allclose(weights, saved - 0.5)
+        assert np.array_equal(reloaded.model.layers[0].weights, saved)
+        logger.info("[test_loaded_weights_are_writable] Validated 1 items.")
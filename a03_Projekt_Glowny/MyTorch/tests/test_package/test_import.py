@@ -0,0 +1,100 @@
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from MyTorch.typecheck import (
+    get_typecheck_level,
+    set_typecheck_level,
+    typecheck_modules_logic,
+)
+
+logger = logging.getLogger("test_logger")
+
+PACKAGE_DIR = Path(__file__).resolve().parents[2]
+PACKAGE_NAME = PACKAGE_DIR.name
+
+
+def _import_time_us(level: str) -> tuple[int, list[str]]:
+    env = dict(os.environ, MYTORCH_TYPECHECK=level)
+    env.pop("PYTHONPATH", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE_NAME}"],
+        cwd=PACKAGE_DIR.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = [line.split("|") for line in proc.stderr.splitlines() if "|" in line]
+    modules = [row[2].strip() for row in rows]
+    total = next(
+        int(row[1])
+        for row, name in zip(rows, modules, strict=True)
+        if name == PACKAGE_NAME
+    )
+    return total, modules
+
+
+class TestImport:
+    @pytest.mark.parametrize("level", ["off", "boundary", "full"])
+    def test_import_time_is_lazy(self, level):
+        logger.info(f"[test_import_time_is_lazy] ACTION: Importing with level={level}")
+
+        total_us, modules = _import_time_us(level)
+        eager = [
+            name
+            for name in modules
+            if name.startswith(f"{PACKAGE_NAME}.")
+            and name not in {f"{PACKAGE_NAME}.types", f"{PACKAGE_NAME}.typecheck"}
+        ]
+
+        if eager:
+            logger.error(f"[test_import_time_is_lazy] Logic error: eager {eager}")
+        assert eager == []
+        logger.info(
+            f"[test_import_time_is_lazy] {PACKAGE_NAME} import ({level}): "
+            f"{total_us / 1000:.1f} ms"
+        )
+
+    def test_typecheck_levels(self):
+        logger.info("[test_typecheck_levels] ACTION: Testing type-check levels")
+        previous = get_typecheck_level()
+
+        set_typecheck_level("off")
+        modules = typecheck_modules_logic("boundary", PACKAGE_NAME)
+
+        if get_typecheck_level() != "off":
+            logger.error("[test_typecheck_levels] Logic error: level not applied")
+        assert get_typecheck_level() == "off"
+        assert typecheck_modules_logic("full", PACKAGE_NAME) == [PACKAGE_NAME]
+        assert f"{PACKAGE_NAME}.core" in modules
+        with pytest.raises(ValueError):
+            set_typecheck_level("strict")
+
+        set_typecheck_level(previous)
+        logger.info(f"[test_typecheck_levels] Validated {len(modules)} items.")
+
+    def test_all_names_resolve(self):
+        logger.info("[test_all_names_resolve] ACTION: Testing star import")
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import {PACKAGE_NAME} as m; "
+                "print(*[n for n in m.__all__ if n not in dir(m)])",
+            ],
+            cwd=PACKAGE_DIR.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        missing = proc.stdout.split()
+
+        if missing:
+            logger.error(f"[test_all_names_resolve] Logic error: missing {missing}")
+        assert missing == []
+        logger.info("[test_all_names_resolve] Validated 1 items.")
@@ -18,6 +18,7 @@ ENGINES = {
     "norm_engine": ("Normalization", "class"),
     "idp_engine": ("ImageDataPreprocessing", "class"),
     "pipeline_engine": ("TransformPipeline", "class"),
+    "warp_engine": ("WarpEngine", "class"),
 }
 
 MTX_CONFIGS = {
@@ -1,6 +1,17 @@
 import logging
 
 import numpy as np
+from common_utils import RngContext, reseed_components
+from preprocessing import (
+    DataAugmentation,
+    GeometryAugmentation,
+    MorphologyAugmentation,
+    NoiseAugmentation,
+    RandomUniformProvider,
+    batch_augment_engine,
+    random_shift_batch,
+    random_shift_engine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -72,29 +83,16 @@ class TestGeometryAugmentation:
         while hasattr(raw_rotate, "__wrapped__"):
             raw_rotate = raw_rotate.__wrapped__
 
-        result = raw_rotate(
-            ga_engine,
-            mock_mtx,
-            28,
-            28,
-            params={
-                "cos_a": 0.98,
-                "sin_a": 0.17,
-                "cx": 14,
-                "cy": 14,
-                "new_matrix": np.zeros_like(mock_mtx),
-            },
-            angle=0.0,
-            fill=0,
-        )
+        result = raw_rotate(ga_engine, mock_mtx, 28, 28, angle=10.0, fill=0)
 
-        if result.dtype != np.uint8 or result.shape != mock_mtx.shape:
+        if result.dtype != np.float32 or result.shape != mock_mtx.shape:
             logger.error(
                 f"[test_rotate_small_angle_math] Validation failed: shape={result.shape}, dtype={result.dtype}"
             )
 
-        assert result.dtype == np.uint8
+        assert result.dtype == np.float32
         assert result.shape == mock_mtx.shape
+        assert not np.array_equal(result, mock_mtx)
         logger.info("[test_rotate_small_angle_math] Validated 1 items.")
 
 
@@ -207,6 +205,193 @@ class TestDataAugmentation:
         logger.info(f"[test_augment_output_structure] Validated {len(result)} items.")
 
 
+class TestBatchAugmentation:
+    def test_random_shift_batch_matches_engine(self, mock_mtx):
+        logger.info(
+            "[test_random_shift_batch_matches_engine] ACTION: Testing per-sample shifts"
+        )
+        batch = np.stack([mock_mtx, mock_mtx.T, mock_mtx[::-1]]).astype(np.float32)
+        dx, dy = np.array([1, -3, 4]), np.array([0, 2, -4])
+        sx, sy = np.array([2, 0, 8]), np.array([0, 4, 3])
+        fill = np.array([0, 7, 255], dtype=np.int64)
+
+        result = random_shift_batch(batch, dx, dy, sx, sy, fill)
+        expected = np.stack(
+            [
+                random_shift_engine(
+                    batch[i], 28, 28, dx[i], dy[i], sx[i], sy[i], int(fill[i])
+                )
+                for i in range(len(batch))
+            ]
+        )
+
+        if not np.array_equal(result, expected):
+            logger.error(
+                "[test_random_shift_batch_matches_engine] Data loss: batch differs from loop"
+            )
+        assert np.array_equal(result, expected)
+        logger.info(
+            f"[test_random_shift_batch_matches_engine] Validated {len(batch)} items."
+        )
+
+    def test_batch_augment_engine_acceptance(self, mock_mtx):
+        logger.info(
+            "[test_batch_augment_engine_acceptance] ACTION: Testing batch_augment_engine"
+        )
+        repeats = 16
+        orig_px = int(np.sum(mock_mtx > 0))
+        provider = RandomUniformProvider(0.1, 1.0)
+        noise = NoiseAugmentation(std_provider=provider, prob_provider=provider)
+
+        results, histories, attempts = batch_augment_engine(
+            m_arr=mock_mtx,
+            repeats=repeats,
+            max_attempts=repeats * 100,
+            groups=[
+                GeometryAugmentation().batch_operations(),
+                noise.batch_operations(),
+                MorphologyAugmentation().batch_operations(),
+            ],
+            orig_px=orig_px,
+        )
+
+        if len(results) != repeats or len(histories) != repeats:
+            logger.error(
+                f"[test_batch_augment_engine_acceptance] Data loss: {len(results)} != {repeats}"
+            )
+        assert len(results) == len(histories) == repeats
+        assert attempts >= repeats
+        assert all(len(history) == 3 for history in histories)
+        assert all(np.sum(m > 0) >= orig_px * 0.5 for m in results)
+        logger.info(
+            f"[test_batch_augment_engine_acceptance] Validated {len(results)} items."
+        )
+
+    def test_augment_uses_injected_components(self, mock_mtx, capsys):
+        logger.info(
+            "[test_augment_uses_injected_components] ACTION: Testing component routing"
+        )
+        calls = []
+
+        class FlipOnly:
+            def batch_operations(self, rng=None):
+                return {"flip": lambda M: calls.append(len(M)) or M[..., ::-1]}
+
+        class Silent:
+            def batch_operations(self, rng=None):
+                return {}
+
+        class Identity:
+            def batch_operations(self, rng=None):
+                return {"identity": lambda M: M}
+
+        augmentation = DataAugmentation(
+            geometry=FlipOnly(), noise=Silent(), morphology=Identity()
+        )
+        result = augmentation.augment(mock_mtx, repeats=5, debug=True)
+        trace = capsys.readouterr().out
+
+        if sum(calls) != 5:
+            logger.error(
+                f"[test_augment_uses_injected_components] Logic error: geometry ran on {sum(calls)} samples"
+            )
+        assert sum(calls) == 5
+        assert trace.count("flip") == trace.count("identity") == 5
+        assert all(np.array_equal(m, mock_mtx[:, ::-1]) for m in result)
+        logger.info(
+            f"[test_augment_uses_injected_components] Validated {len(result)} items."
+        )
+
+    def test_batch_operations_draw_from_providers(self, mock_mtx):
+        logger.info(
+            "[test_batch_operations_draw_from_providers] ACTION: Testing provider ranges"
+        )
+        batch = np.stack([mock_mtx] * 6).astype(np.float32)
+        fixed = RandomUniformProvider(3.0, 3.0)
+        dilate = MorphologyAugmentation(kernel_provider=fixed).batch_operations()
+
+        dilated = dilate["dilate"](batch)
+        expected = MorphologyAugmentation().dilate(mock_mtx.astype(np.float32), 3)
+
+        if not all(np.array_equal(m, expected) for m in dilated):
+            logger.error(
+                "[test_batch_operations_draw_from_providers] Logic error: kernel size ignored"
+            )
+        assert all(np.array_equal(m, expected) for m in dilated)
+        logger.info(
+            f"[test_batch_operations_draw_from_providers] Validated {len(batch)} items."
+        )
+
+    def test_batch_shift_matches_random_shift_ranges(self):
+        logger.info(
+            "[test_batch_shift_matches_random_shift_ranges] ACTION: Testing shift range"
+        )
+        dot = np.zeros((28, 28), dtype=np.float32)
+        dot[14, 14] = 255.0
+        batch = np.stack([dot] * 256)
+        shift = GeometryAugmentation(
+            shift_provider=RandomUniformProvider(-10.0, 10.0)
+        ).batch_operations(RngContext(3))["random_shift"]
+
+        rows, cols = np.nonzero(shift(batch).reshape(256, -1) == 255.0)
+        dy, dx = cols // 28 - 14, cols % 28 - 14
+
+        if np.abs(dx).max() > 4 or np.abs(dy).max() > 4:
+            logger.error(
+                f"[test_batch_shift_matches_random_shift_ranges] Out of bounds: dx={dx.max()}, dy={dy.max()}"
+            )
+        assert len(rows) == 256
+        assert np.abs(dx).max() <= 4 and np.abs(dy).max() <= 4
+        logger.info(
+            f"[test_batch_shift_matches_random_shift_ranges] Validated {len(rows)} items."
+        )
+
+    def test_augment_reproducible_with_rng_context(self, mock_mtx):
+        logger.info(
+            "[test_augment_reproducible_with_rng_context] ACTION: Testing seeded augment"
+        )
+        first = DataAugmentation(rng=RngContext(7)).augment(mock_mtx, repeats=4)
+        second = DataAugmentation(rng=RngContext(7)).augment(mock_mtx, repeats=4)
+        other = DataAugmentation(rng=RngContext(8)).augment(mock_mtx, repeats=4)
+
+        same = all(np.array_equal(a, b) for a, b in zip(first, second, strict=True))
+        if not same:
+            logger.error(
+                "[test_augment_reproducible_with_rng_context] Seeded runs differ"
+            )
+        assert same and len(first) == 4
+        assert not all(np.array_equal(a, b) for a, b in zip(first, other, strict=True))
+        logger.info(
+            f"[test_augment_reproducible_with_rng_context] Validated {len(first)} items."
+        )
+
+    def test_reseed_components_spawns_streams(self):
+        logger.info(
+            "[test_reseed_components_spawns_streams] ACTION: Testing worker reseed"
+        )
+        workers = [DataAugmentation() for _ in range(2)]
+        root = np.random.SeedSequence(3)
+        for worker, child in zip(workers, root.spawn(2), strict=True):
+            reseed_components(worker, child)
+
+        draws = [w.noise.std_provider.get_values(8, w.rng) for w in workers]
+        replay = DataAugmentation()
+        reseed_components(replay, np.random.SeedSequence(3).spawn(2)[0])
+
+        if np.array_equal(draws[0], draws[1]):
+            logger.error(
+                "[test_reseed_components_spawns_streams] Workers share a stream"
+            )
+        assert not np.array_equal(draws[0], draws[1])
+        assert np.array_equal(
+            draws[0], replay.noise.std_provider.get_values(8, replay.rng)
+        )
+        assert np.all((draws[0] >= 0.1) & (draws[0] <= 5.0))
+        logger.info(
+            f"[test_reseed_components_spawns_streams] Validated {len(draws)} items."
+        )
+
+
 class TestRandomUniformProvider:
     def test_get_value_range(self, uniform_provider):
         logger.info(
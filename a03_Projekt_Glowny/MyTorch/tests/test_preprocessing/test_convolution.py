@@ -1,6 +1,13 @@
 import logging
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from preprocessing import (
+    ConvolutionActions,
+    convolve_stack,
+    select_conv_backend,
+    separable_factors,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,3 +69,69 @@ class TestConvolutionActions:
             )
         assert actual_sum == expected_sum
         logger.info("[test_convolution_2d] Validated 1 items.")
+
+    def test_backends_agree(self):
+        logger.info("[test_backends_agree] ACTION: Testing direct/separable/fft")
+        rng = np.random.default_rng(0)
+        batch = rng.random((2, 20, 24)).astype(np.float32)
+        kernels = np.stack(
+            [np.outer(rng.random(5), rng.random(5)) for _ in range(3)]
+        ).astype(np.float32)
+
+        expected = np.stack(
+            [
+                np.einsum(
+                    "ij,...hwij->...hw",
+                    k,
+                    sliding_window_view(batch, k.shape, axis=(-2, -1)),
+                )
+                for k in kernels
+            ]
+        )
+
+        for backend in ["direct", "separable", "fft"]:
+            res = convolve_stack(batch, kernels, backend)
+            if res.shape != expected.shape or not np.allclose(res, expected, atol=1e-4):
+                logger.error(
+                    f"[test_backends_agree] Data loss: backend {backend} mismatch"
+                )
+            assert res.shape == (3, 2, 16, 20)
+            assert np.allclose(res, expected, atol=1e-4)
+
+        logger.info("[test_backends_agree] Validated 3 items.")
+
+    def test_select_conv_backend(self):
+        logger.info("[test_select_conv_backend] ACTION: Testing backend heuristics")
+        sobel = np.array([[1, 0, -1], [2, 0, -2], [1, 0, -1]], dtype=np.float32)
+
+        assert separable_factors(sobel) is not None
+        assert separable_factors(np.eye(3, dtype=np.float32)) is None
+
+        cases = {
+            ((28, 28), (3, 3), 1, True): "separable",
+            ((28, 28), (3, 3), 4, False): "direct",
+            ((512, 512), (15, 15), 4, False): "fft",
+        }
+        for args, expected in cases.items():
+            backend = select_conv_backend(*args)
+            if backend != expected:
+                logger.error(
+                    f"[test_select_conv_backend] Logic error: {args} -> {backend}"
+                )
+            assert backend == expected
+
+        logger.info(f"[test_select_conv_backend] Validated {len(cases)} items.")
+
+    def test_apply_filters_order(self):
+        logger.info("[test_apply_filters_order] ACTION: Testing filters x channels")
+        channels = [np.full((6, 6), v, dtype=np.float32) for v in (1.0, 2.0)]
+        filters = [np.ones((3, 3), dtype=np.float32), np.ones((2, 2), dtype=np.float32)]
+
+        results = ConvolutionActions().apply_filters(channels, filters)
+        sums = [float(r[0, 0]) for r in results]
+
+        if sums != [9.0, 18.0, 4.0, 8.0]:
+            logger.error(f"[test_apply_filters_order] Logic error: {sums}")
+        assert sums == [9.0, 18.0, 4.0, 8.0]
+        assert [r.shape for r in results] == [(4, 4), (4, 4), (5, 5), (5, 5)]
+        logger.info(f"[test_apply_filters_order] Validated {len(results)} items.")
@@ -3,12 +3,15 @@ from unittest.mock import MagicMock
 
 import numpy as np
 from preprocessing import (
+    calculate_fill_color,
+    calculate_fill_colors,
     apply_to_methods,
     auto_fill_color,
     kernel_data_processing,
     parameter_complement,
     prepare_angle,
     prepare_values,
+    resolve_arg_layout,
     with_dimensions,
 )
 
@@ -159,3 +162,69 @@ class TestDecorators:
 
         assert actual_sum == expected_sum
         logger.info("[test_prepare_values] Validated 1 items.")
+
+    def test_calculate_fill_color_batch(self):
+        logger.info(
+            "[test_calculate_fill_color_batch] ACTION: Testing per-image fill colour"
+        )
+        batch = np.zeros((3, 4, 4), dtype=np.uint8)
+        batch[1] = 9
+        batch[2, :3] = 5
+
+        colors = calculate_fill_color(batch)
+        expected = [calculate_fill_color(m) for m in batch]
+
+        if list(colors) != expected:
+            logger.error(
+                f"[test_calculate_fill_color_batch] Logic error: {colors} != {expected}"
+            )
+        assert list(colors) == expected == [0, 9, 5]
+
+        logger.info(f"[test_calculate_fill_color_batch] Validated {len(batch)} items.")
+
+    def test_calculate_fill_colors_bincount(self):
+        logger.info(
+            "[test_calculate_fill_colors_bincount] ACTION: Testing bincount fill colour"
+        )
+        rng = np.random.default_rng(0)
+        batch = rng.integers(0, 256, size=(16, 12, 12))
+
+        for dtype in (np.uint8, np.int64, np.float32):
+            colors = calculate_fill_colors(batch.astype(dtype))
+            expected = []
+            for m in batch:
+                values, counts = np.unique(m, return_counts=True)
+                expected.append(int(values[np.argmax(counts)]))
+
+            if list(colors) != expected:
+                logger.error(
+                    f"[test_calculate_fill_colors_bincount] Logic error: {dtype} mismatch"
+                )
+            assert list(colors) == expected
+
+        logger.info(
+            f"[test_calculate_fill_colors_bincount] Validated {len(batch)} items."
+        )
+
+    def test_apply_to_methods_resolves_positions(self, decorator_mtx):
+        logger.info(
+            "[test_apply_to_methods_resolves_positions] ACTION: Testing compiled layout"
+        )
+
+        @apply_to_methods([auto_fill_color, kernel_data_processing], ["erode"])
+        class Target:
+            def erode(self, M, kernel_size, fill=0):
+                return kernel_size, fill
+
+        layout = resolve_arg_layout(Target.erode)
+        positional = Target().erode(decorator_mtx, 3, 7)
+        injected = Target().erode(decorator_mtx, kernel_size=3)
+
+        if positional != (3, 7):
+            logger.error(
+                f"[test_apply_to_methods_resolves_positions] Logic error: {positional}"
+            )
+        assert layout["M"] == 1
+        assert positional == (3, 7)
+        assert injected == (3, 0)
+        logger.info("[test_apply_to_methods_resolves_positions] Validated 2 items.")
@@ -2,7 +2,7 @@ import logging
 from unittest.mock import patch
 
 import numpy as np
-from preprocessing import ImageGeometry
+from preprocessing import ImageGeometry, pad_spatial, resize
 
 logger = logging.getLogger("test_logger")
 
@@ -75,3 +75,47 @@ class TestImageGeometry:
             assert np.sum(res) == expected_sum
 
         logger.info("[test_prepare_standard_geometry] Validated 1 items.")
+
+    def test_pad_spatial_batch_fill(self):
+        logger.info("[test_pad_spatial_batch_fill] ACTION: Testing per-image fill")
+        batch = np.zeros((2, 4, 5), dtype=np.uint8)
+        fill = np.array([3, 7], dtype=np.int64)
+
+        res = pad_spatial(batch, (1, 1), (2, 2), fill=fill)
+
+        if res.shape != (2, 6, 9):
+            logger.error(
+                f"[test_pad_spatial_batch_fill] Shape mismatch: {res.shape} != (2, 6, 9)"
+            )
+        assert res.shape == (2, 6, 9)
+
+        for idx, value in enumerate(fill):
+            border = np.concatenate([res[idx, 0], res[idx, -1]])
+            if not np.all(border == value):
+                logger.error(
+                    f"[test_pad_spatial_batch_fill] Wrong fill on image {idx}: {border}"
+                )
+            assert np.all(border == value)
+            assert np.all(res[idx, 1:-1, 2:-2] == 0)
+
+        logger.info(f"[test_pad_spatial_batch_fill] Validated {len(fill)} items.")
+
+    def test_resize_batch(self, mock_geometry_mtx):
+        logger.info("[test_resize_batch] ACTION: Testing resize on a batch")
+        batch = np.stack([mock_geometry_mtx, mock_geometry_mtx.T])
+
+        for target_size in [(28, 28), (64, 60)]:
+            res = resize(batch, target_size)
+            expected = np.stack([resize(m, target_size) for m in batch])
+
+            if res.shape != (2, *target_size):
+                logger.error(
+                    f"[test_resize_batch] Shape mismatch: {res.shape} != {(2, *target_size)}"
+                )
+            assert res.shape == (2, *target_size)
+
+            if not np.allclose(res, expected):
+                logger.error("[test_resize_batch] Data loss: batch differs from loop")
+            assert np.allclose(res, expected)
+
+        logger.info("[test_resize_batch] Validated 2 items.")
@@ -101,3 +101,23 @@ class TestGrayScaleProcessing:
             )
         assert actual_sum == 300
         logger.info("[test_convert_color_space_to_color] Validated 1 items.")
+
+    def test_convert_color_space_batched_gray(self, grayscale_engine):
+        logger.info(
+            "[test_convert_color_space_batched_gray] ACTION: Testing convert_color_space [batched=True]"
+        )
+        gray_batch = np.arange(3 * 4 * 5, dtype=np.float32).reshape(3, 4, 5)
+        rgb_batch = np.stack([gray_batch] * 3, axis=1)
+
+        result = grayscale_engine.convert_color_space(gray_batch, batched=True)
+        converted = grayscale_engine.convert_color_space(rgb_batch, batched=True)
+
+        if result.shape != (3, 4, 5) or not np.array_equal(result, gray_batch):
+            logger.error(
+                f"[test_convert_color_space_batched_gray] Logic error: gray batch treated as RGB, shape={result.shape}"
+            )
+        assert result.shape == (3, 4, 5)
+        assert np.array_equal(result, gray_batch)
+        assert converted.shape == (3, 4, 5)
+        assert np.allclose(converted, gray_batch, atol=1e-3)
+        logger.info("[test_convert_color_space_batched_gray] Validated 2 items.")
@@ -0,0 +1,49 @@
+import logging
+
+import numpy as np
+from preprocessing import separable_morphology, sliding_window_engine
+
+logger = logging.getLogger("test_logger")
+
+
+class TestSeparableMorphology:
+    def test_matches_window_engine(self):
+        logger.info("[test_matches_window_engine] ACTION: Testing van Herk/Gil-Werman")
+        rng = np.random.default_rng(0)
+        batch = (rng.random((3, 17, 23)) * 255).astype(np.float32)
+        fill = np.array([0, 40, 255], dtype=np.int64)
+
+        checked = 0
+        for kernel_size in [1, 2, 3, 6, 9]:
+            for op_func, reduce in [(np.maximum, np.max), (np.minimum, np.min)]:
+                res = separable_morphology(batch, kernel_size, op_func, fill)
+                expected = sliding_window_engine(
+                    batch,
+                    kernel_size,
+                    (kernel_size - 1) // 2,
+                    kernel_size // 2,
+                    fill,
+                    lambda win, axes, reduce=reduce: reduce(win, axis=axes),
+                )
+                if not np.array_equal(res, expected):
+                    logger.error(
+                        f"[test_matches_window_engine] Data loss: k={kernel_size} mismatch"
+                    )
+                assert np.array_equal(res, expected)
+                checked += 1
+
+        logger.info(f"[test_matches_window_engine] Validated {checked} items.")
+
+    def test_output_buffer_reused(self):
+        logger.info("[test_output_buffer_reused] ACTION: Testing out buffer")
+        M = np.zeros((10, 10), dtype=np.float32)
+        M[5, 5] = 255.0
+        out = np.empty_like(M)
+
+        res = separable_morphology(M, 3, np.maximum, 0, out=out)
+
+        if res is not out:
+            logger.error("[test_output_buffer_reused] Logic error: buffer not reused")
+        assert res is out
+        assert np.sum(res == 255.0) == 9
+        logger.info("[test_output_buffer_reused] Validated 1 items.")
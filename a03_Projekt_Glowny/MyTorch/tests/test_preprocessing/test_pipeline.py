@@ -1,6 +1,16 @@
 import logging
+from unittest.mock import MagicMock
 
 import numpy as np
+from preprocessing import (
+    ExecutionPlan,
+    Normalization,
+    TransformPipeline,
+    apply_pipeline_logic,
+    convert_color_space,
+    prepare_standard_geometry_logic,
+    z_score_normalization,
+)
 
 logger = logging.getLogger("test_logger")
 
@@ -46,6 +56,124 @@ class TestTransformPipeline:
 
         logger.info(f"[test_apply] Validated {len(result)} items.")
 
+    def test_apply_uses_injected_components(self):
+        logger.info(
+            "[test_apply_uses_injected_components] ACTION: Testing compiled=True with custom components"
+        )
+
+        class ClippedNormalization(Normalization):
+            def process(
+                self, M, use_z_score=True, old_r=(0.0, 255.0), new_r=(0.0, 1.0)
+            ):
+                return np.zeros_like(M, dtype=np.float32)
+
+        augmentation = MagicMock()
+        augmentation.augment.side_effect = lambda m: [m]
+        matrix = np.ones((3, 40, 36), dtype=np.float32)
+
+        stock = TransformPipeline(augmentation=augmentation)
+        custom = TransformPipeline(
+            augmentation=augmentation, normalization=ClippedNormalization()
+        )
+        custom_result = custom.apply(matrix)
+        stock.apply(matrix)
+
+        if np.any(custom_result[0]):
+            logger.error(
+                "[test_apply_uses_injected_components] Logic error: injected normalization bypassed"
+            )
+        assert not np.any(custom_result[0])
+        assert len(stock._plans) == 1
+        assert not custom._plans
+        logger.info("[test_apply_uses_injected_components] Validated 1 items.")
+
+    def test_plan_cache_is_bounded(self):
+        logger.info("[test_plan_cache_is_bounded] ACTION: Testing plan LRU")
+        pipeline = TransformPipeline(max_plans=2)
+        first = pipeline.compile((3, 20, 20))
+        pipeline.compile((3, 24, 24))
+        assert pipeline.compile((3, 20, 20)) is first
+        pipeline.compile((3, 32, 32))
+
+        keys = list(pipeline._plans)
+        if len(keys) != 2:
+            logger.error(f"[test_plan_cache_is_bounded] Logic error: {keys}")
+        assert keys == [((3, 20, 20), False), ((3, 32, 32), False)]
+        logger.info(f"[test_plan_cache_is_bounded] Validated {len(keys)} items.")
+
+
+class TestExecutionPlan:
+    def test_plan_matches_uncompiled(self, mock_28x28_sample):
+        logger.info("[test_plan_matches_uncompiled] ACTION: Testing ExecutionPlan.run")
+        rng = np.random.default_rng(0)
+        matrix = (rng.random((3, 40, 36)) * 255).astype(np.float32)
+
+        def augment(m):
+            return [m.copy(), m[::-1].copy()]
+
+        expected = apply_pipeline_logic(
+            matrix=matrix,
+            grayscale_func=lambda m: convert_color_space(m, to_gray=True),
+            geometry_func=lambda m, s: prepare_standard_geometry_logic(m, s, 2, 0),
+            augment_func=augment,
+            normalize_func=z_score_normalization,
+        )
+        plan = ExecutionPlan(input_shape=matrix.shape)
+        plan.run(matrix, augment)
+        result = plan.run(matrix, augment)
+
+        assert len(result) == len(expected)
+        for idx, (got, ref) in enumerate(zip(result, expected, strict=True)):
+            if not np.allclose(got, ref, atol=1e-5):
+                logger.error(
+                    f"[test_plan_matches_uncompiled] Data loss: sample {idx} differs"
+                )
+            assert got.dtype == np.float32
+            assert np.allclose(got, ref, atol=1e-5)
+
+        logger.info(f"[test_plan_matches_uncompiled] Validated {len(result)} items.")
+
+    def test_buffers_reused(self):
+        logger.info("[test_buffers_reused] ACTION: Testing plan buffer reuse")
+        plan = ExecutionPlan(input_shape=(3, 28, 28))
+        geometry_buffer = plan.geometry
+        captured = []
+
+        def augment(m):
+            captured.append(m)
+            return [m.copy()]
+
+        first = plan.run(np.ones((3, 28, 28), dtype=np.float32), augment)
+        stack_buffer = plan.stack_buffer
+        second = plan.run(np.zeros((3, 28, 28), dtype=np.float32), augment)
+
+        if captured[0].base is not geometry_buffer:
+            logger.error("[test_buffers_reused] Logic error: geometry buffer rebuilt")
+        assert captured[0].base is geometry_buffer
+        assert captured[1].base is geometry_buffer
+        assert first[0] is not second[0]
+        assert plan.stack_buffer is stack_buffer
+        assert not np.shares_memory(first[0], second[0])
+        assert not np.shares_memory(second[0], stack_buffer)
+        logger.info("[test_buffers_reused] Validated 2 items.")
+
+    def test_batched_gray_layout(self):
+        logger.info("[test_batched_gray_layout] ACTION: Testing batched plan layout")
+        batch = np.ones((3, 20, 20), dtype=np.float32)
+        single = ExecutionPlan(input_shape=(3, 20, 20))
+        batched = ExecutionPlan(input_shape=(3, 20, 20), batched=True)
+
+        result = batched.run(batch, lambda m: [m.copy()])
+
+        if batched.is_color or len(result) != 3:
+            logger.error(
+                f"[test_batched_gray_layout] Logic error: gray batch treated as RGB, got {len(result)} samples"
+            )
+        assert single.is_color
+        assert not batched.is_color
+        assert len(result) == 3
+        logger.info(f"[test_batched_gray_layout] Validated {len(result)} items.")
+
 
 class TestImageDataPreprocessing:
     def test_preprocess_exception(self, idp_engine):
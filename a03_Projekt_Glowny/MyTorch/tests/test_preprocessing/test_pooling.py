@@ -1,6 +1,7 @@
 import logging
 
 import numpy as np
+from preprocessing import max_pool_logic
 
 logger = logging.getLogger("test_logger")
 
@@ -62,3 +63,31 @@ class TestPooling:
         assert actual_sum == 44
 
         logger.info("[test_max_pool] Validated 1 items.")
+
+    def test_max_pool_batch(self, mock_pooling_mtx):
+        logger.info("[test_max_pool_batch] ACTION: Testing max_pool on a batch")
+
+        batch = np.stack([mock_pooling_mtx, mock_pooling_mtx[::-1]])
+        result = max_pool_logic(
+            batch, kernel_size=(2, 2), stride=2, pad_width=1, pad_values=0
+        )
+        expected = np.stack(
+            [
+                max_pool_logic(
+                    m, kernel_size=(2, 2), stride=2, pad_width=1, pad_values=0
+                )
+                for m in batch
+            ]
+        )
+
+        if result.shape != (2, 3, 3):
+            logger.error(
+                f"[test_max_pool_batch] Shape mismatch: expected (2, 3, 3), got {result.shape}"
+            )
+        assert result.shape == (2, 3, 3)
+
+        if not np.array_equal(result, expected):
+            logger.error("[test_max_pool_batch] Data loss: batch differs from loop")
+        assert np.array_equal(result, expected)
+
+        logger.info(f"[test_max_pool_batch] Validated {len(batch)} items.")
@@ -3,7 +3,12 @@ from unittest.mock import patch
 
 import numpy as np
 import pytest
-from preprocessing import Thresholding
+from preprocessing import (
+    Thresholding,
+    adaptive_threshold_integral_logic,
+    adaptive_threshold_logic,
+    generate_gaussian_kernel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,3 +75,29 @@ class TestThresholding:
         assert result.dtype == np.uint8
 
         logger.info("SUCCESS: adaptive_threshold with auto_params verified")
+
+    def test_integral_matches_window(self):
+        logger.info("ACTION: Testing integral adaptive_threshold against window path")
+        rng = np.random.default_rng(0)
+        batch = (rng.random((3, 40, 36)) * 255).astype(np.float32)
+        block_size = 11
+
+        result = adaptive_threshold_integral_logic(batch, block_size=block_size, c=2)
+        expected = np.stack(
+            [
+                adaptive_threshold_logic(
+                    m, block_size, 2, generate_gaussian_kernel(block_size // 2 + 1)
+                )
+                for m in batch
+            ]
+        )
+
+        if result.shape != batch.shape:
+            logger.error(f"Assertion failed: batch shape {result.shape} mismatch")
+        assert result.shape == batch.shape
+
+        if not np.array_equal(result, expected):
+            logger.error("Assertion failed: integral path differs from window path")
+        assert np.array_equal(result, expected)
+
+        logger.info("SUCCESS: integral adaptive_threshold verified")
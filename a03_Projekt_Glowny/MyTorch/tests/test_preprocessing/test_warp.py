@@ -0,0 +1,65 @@
+import logging
+
+import numpy as np
+from preprocessing import get_base_grid, rotate_small_angle
+
+logger = logging.getLogger("test_logger")
+
+
+class TestWarpEngine:
+    def test_rotate_matches_legacy(self, warp_engine, mock_28x28_sample):
+        logger.info("[test_rotate_matches_legacy] ACTION: Testing nearest rotate")
+        batch = np.stack([mock_28x28_sample, mock_28x28_sample.T])
+        angles = np.array([12.0, -25.0], dtype=np.float32)
+
+        result = warp_engine.rotate(batch, angles, fill=0)
+
+        for idx, angle in enumerate(angles):
+            rad = np.radians(float(angle))
+            expected = rotate_small_angle(
+                batch[idx],
+                28,
+                28,
+                float(np.cos(rad)),
+                float(np.sin(rad)),
+                14.0,
+                14.0,
+                np.zeros((28, 28), dtype=np.float32),
+            )
+            if not np.array_equal(result[idx], expected):
+                logger.error(
+                    f"[test_rotate_matches_legacy] Data loss: image {idx} differs"
+                )
+            assert np.array_equal(result[idx], expected)
+
+        logger.info(f"[test_rotate_matches_legacy] Validated {len(batch)} items.")
+
+    def test_rotate_bilinear_into_buffer(self, warp_engine, mock_28x28_sample):
+        logger.info(
+            "[test_rotate_bilinear_into_buffer] ACTION: Testing bilinear rotate"
+        )
+        engine = type(warp_engine)(mode="bilinear")
+        out = np.empty((28, 28), dtype=np.float32)
+
+        result = engine.rotate(mock_28x28_sample, 0.0, fill=7, out=out)
+
+        if result is not out:
+            logger.error(
+                "[test_rotate_bilinear_into_buffer] Logic error: buffer not reused"
+            )
+        assert result is out
+        assert np.allclose(result[:27, :27], mock_28x28_sample[:27, :27])
+        assert np.all(result[27, :] == 7)
+        logger.info("[test_rotate_bilinear_into_buffer] Validated 1 items.")
+
+    def test_base_grid_is_cached(self):
+        logger.info("[test_base_grid_is_cached] ACTION: Testing grid cache")
+
+        first = get_base_grid(28, 28)
+        second = get_base_grid(28, 28)
+
+        if first[0] is not second[0]:
+            logger.error("[test_base_grid_is_cached] Logic error: grid rebuilt")
+        assert first[0] is second[0]
+        assert not first[0].flags.writeable
+        logger.info("[test_base_grid_is_cached] Validated 1 items.")
@@ -0,0 +1,62 @@
+import logging
+import sys
+from typing import Any, Dict, List, Literal, Tuple
+
+import jaxtyping
+
+TypecheckLevel = Literal["off", "boundary", "full"]
+
+TYPECHECK_ENV = "MYTORCH_TYPECHECK"
+TYPECHECK_LEVELS: Tuple[str, ...] = ("off", "boundary", "full")
+BOUNDARY_MODULES: Tuple[str, ...] = (
+    "core",
+    "data.downloader",
+    "preprocessing.io_image",
+)
+
+_package_name = __name__.rpartition(".")[0]
+_state: Dict[str, Any] = {"level": "off", "hook": None}
+logger = logging.getLogger(_package_name)
+
+
+def typecheck_modules_logic(level: TypecheckLevel, package: str) -> List[str]:
+    if level == "full":
+        return [package]
+    if level == "boundary":
+        return [f"{package}.{module}" for module in BOUNDARY_MODULES]
+    return []
+
+
+def set_typecheck_level(level: TypecheckLevel) -> None:
+    if level not in TYPECHECK_LEVELS:
+        raise ValueError(
+            f"Unknown type-check level {level!r}, expected one of {TYPECHECK_LEVELS}"
+        )
+
+    if _state["hook"] is not None:
+        _state["hook"].uninstall()
+
+    modules = typecheck_modules_logic(level, _package_name)
+    _state["hook"] = (
+        jaxtyping.install_import_hook(modules, "typeguard.typechecked")
+        if modules
+        else None
+    )
+    _state["level"] = level
+
+    skip = {__name__, f"{_package_name}.types"}
+    loaded = [
+        name
+        for name in sys.modules
+        if name.startswith(f"{_package_name}.") and name not in skip
+    ]
+    if loaded:
+        logger.warning(
+            f"Type-check level {level!r} only applies to modules imported later, "
+            f"already loaded: {loaded}"
+        )
+    logger.debug(f"Jaxtyping hook level {level!r} installed for: {modules}")
+
+
+def get_typecheck_level() -> TypecheckLevel:
+    return _state["level"]
@@ -32,6 +32,7 @@ else:
 
         def jaxtyped(typechecker=None):
             return lambda x: x
+
     except ImportError:
 
         class _Fallback:
@@ -60,6 +61,12 @@ M4D: TypeAlias = Annotated[
     npt.NDArray[np.bool_], Bool[np.ndarray, "Batch Channels Height Width"]
 ]
 ImageGray: TypeAlias = Annotated[npt.NDArray[Any], Shaped[np.ndarray, "Height Width"]]
+ImageBatch: TypeAlias = Annotated[
+    npt.NDArray[Any], Shaped[np.ndarray, "Batch Height Width"]
+]
+ImageRGBBatch: TypeAlias = Annotated[
+    npt.NDArray[Any], Shaped[np.ndarray, "Batch Channels Height Width"]
+]
 Padded: TypeAlias = Annotated[
     npt.NDArray[np.float32], Shaped[np.ndarray, "H_pad W_pad"]
 ]
@@ -69,6 +76,9 @@ RawImage: TypeAlias = Annotated[
     npt.NDArray[np.uint8], UInt8[np.ndarray, "Height Width Channels"]
 ]
 LabelsMtx: TypeAlias = Annotated[npt.NDArray[np.int64], Int[np.ndarray, "Batch"]]
+FillValue: TypeAlias = Union[
+    int, Annotated[npt.NDArray[np.int64], Int[np.ndarray, "*Batch"]]
+]
 
 Label: TypeAlias = int
 BatchData: TypeAlias = List[T]
@@ -102,10 +112,13 @@ __all__ = [
     "DataResult",
     "DatasetBatch",
     "FilePath",
+    "FillValue",
     "FuncDec",
+    "ImageBatch",
     "ImageBytes",
     "ImageGray",
     "ImageRGB",
+    "ImageRGBBatch",
     "JsonData",
     "JsonDict",
     "JsonList",
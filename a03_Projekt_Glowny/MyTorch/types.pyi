@@ -119,6 +119,35 @@ A 2D matrix representing a single-channel intensity image.
 Input for classic CV algorithms (HOG, SIFT) or single-channel preprocessing.
 """
 
+ImageBatch: TypeAlias = npt.NDArray[Any]
+"""
+ImageBatch | Grayscale Image Stack
+---
+**Format**: `[Batch, Height, Width]`
+**Range**:  `[0, 255]` (uint8) or `[0.0, 1.0]` (float32)
+**Description**: 
+N grayscale images of identical size stacked along a leading batch axis.
+Every preprocessing step treats the last two axes as the image plane.
+A stack of exactly three images is indistinguishable from ImageRGB (3, H, W),
+so colour conversion should receive such stacks as ImageRGBBatch instead.
+
+**Usage**:
+Batched preprocessing: one vectorized call instead of one call per image.
+"""
+
+ImageRGBBatch: TypeAlias = npt.NDArray[Any]
+"""
+ImageRGBBatch | Multi-channel Image Stack (NCHW)
+---
+**Format**: `[Batch, Channels, Height, Width]`
+**Range**:  `[0, 255]` (uint8) or `[0.0, 1.0]` (float32)
+**Description**: 
+N channel-first images of identical size stacked along a leading batch axis.
+
+**Usage**:
+Batched colour conversion and the batched TransformPipeline entry point.
+"""
+
 Padded: TypeAlias = npt.NDArray[np.float32]
 """
 Padded | Padded Image Matrix
@@ -184,6 +213,20 @@ A 1D array containing integer class indices for an entire batch.
 Ground truth for Cross-Entropy loss or classification performance metrics.
 """
 
+FillValue: TypeAlias = Union[int, npt.NDArray[np.int64]]
+"""
+FillValue | Background Fill Colour
+---
+**Format**: Scalar or `[*Batch]`
+**Range**:  `[0, 255]` (int)
+**Description**: 
+A single fill colour for one image, or one fill colour per image plane
+of a stack (shape equal to the leading batch axes of the stack).
+
+**Usage**:
+Padding value for shifts, rotations and erosion, computed by `auto_fill_color`.
+"""
+
 Label: TypeAlias = int
 """
 Label | Class Index